@@ -98,9 +98,29 @@ def main() -> None:
         dest.write("permission_parents: Dict[Permission, List[Permission]] = ")
         dest.write(repr(all_parents))
 
+        dest.write(
+            "\n\n# Holds all implied permissions (including itself) for each permission.\n"
+        )
+        dest.write("implied_permissions: Dict[Permission, List[Permission]] = ")
+        dest.write(repr(get_implied_permissions(all_parents)))
+
     print(f"Permissions file {DESTINATION} successfully created.")
 
 
+def get_implied_permissions(all_parents: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    implied_permissions: Dict[str, Set[str]] = defaultdict(set)
+    for permission in all_parents:
+        queue = [permission]
+        while queue:
+            current = queue.pop()
+            implied_permissions[current].add(permission)
+            queue.extend(all_parents[current])
+    return {
+        permission: sorted(implied_permissions[permission])
+        for permission in all_parents
+    }
+
+
 def process_permission_level(
     collection: str, permission: Optional[str], children: Dict[str, Any]
 ) -> Iterable[Tuple[str, Optional[str]]]:
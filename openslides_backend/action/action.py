@@ -23,6 +23,7 @@ from ..permissions.management_levels import (
 from ..permissions.permission_helper import has_organization_management_level, has_perm
 from ..permissions.permissions import Permission
 from ..services.auth.interface import AuthenticationService
+from ..services.datastore.commands import GetManyRequest
 from ..services.datastore.interface import DatastoreService
 from ..services.media.interface import MediaService
 from ..services.vote.interface import VoteService
@@ -47,14 +48,25 @@ from .util.typing import ActionData, ActionResultElement, ActionResults
 
 class SchemaProvider(type):
     """
-    Metaclass to provide pre-compiled JSON schemas for faster validation.
+    Metaclass to provide compiled JSON schemas for faster validation. Each schema is
+    compiled on first use and kept in the class which defines it, so that importing
+    all actions does not compile all schemas.
     """
 
-    def __new__(cls, name, bases, attrs):  # type: ignore
-        schema = attrs.get("schema")
-        if schema is not None:
-            attrs["schema_validator"] = fastjsonschema.compile(schema)
-        return super().__new__(cls, name, bases, attrs)
+    @property
+    def schema_validator(cls) -> Callable[[Dict[str, Any]], None]:
+        for clazz in cls.__mro__:
+            if vars(clazz).get("schema") is not None:
+                break
+        else:
+            raise AttributeError(f"{cls.__name__} has no schema.")
+        if "_schema_validator" not in vars(clazz):
+            setattr(
+                clazz,
+                "_schema_validator",
+                fastjsonschema.compile(vars(clazz)["schema"]),
+            )
+        return vars(clazz)["_schema_validator"]
 
 
 def original_instances(method: Callable) -> Callable:
@@ -128,6 +140,8 @@ class Action(BaseAction, metaclass=SchemaProvider):
         """
         self.user_id = user_id
         self.index = 0
+        if not (internal and self.skip_archived_meeting_check):
+            self.prefetch(action_data)
         for instance in action_data:
             self.validate_instance(instance)
             self.check_for_archived_meeting(instance)
@@ -173,6 +187,69 @@ class Action(BaseAction, metaclass=SchemaProvider):
 
         return (final_write_request, self.results)
 
+    def prefetch(self, action_data: ActionData) -> None:
+        """
+        Loads all models which are needed to check the instances of the action data
+        in advance with one get_many request per step, so that the reads of the
+        following per-instance checks are served from the model cache of the datastore.
+        Nothing is locked here, locking is done by the checks themselves.
+        """
+        meeting_ids = set(self.get_prefetch_ids(action_data, "meeting_id"))
+        if requests := self.get_prefetch_requests(action_data):
+            result = self.datastore.get_many(requests, lock_result=False)
+            for models in result.values():
+                for model in models.values():
+                    if isinstance(model.get("meeting_id"), int):
+                        meeting_ids.add(model["meeting_id"])
+        if not meeting_ids:
+            return
+
+        requests = [
+            GetManyRequest(
+                Collection("meeting"),
+                sorted(meeting_ids),
+                ["is_active_in_organization_id", "name"],
+            )
+        ]
+        if self.user_id > 0:
+            requests.append(
+                GetManyRequest(
+                    Collection("user"),
+                    [self.user_id],
+                    ["organization_management_level"]
+                    + [f"group_${meeting_id}_ids" for meeting_id in meeting_ids],
+                )
+            )
+        self.datastore.get_many(requests, lock_result=False)
+
+    def get_prefetch_requests(self, action_data: ActionData) -> List[GetManyRequest]:
+        """
+        Returns the get_many requests for all models which are read while checking
+        the instances of the given action data. By default, these are the models the
+        meeting ids are read from. Override in subclasses to prefetch further models.
+        The meeting ids found in the resulting models are prefetched afterwards.
+        """
+        model = self.permission_model or self.model
+        if not model.has_field("meeting_id"):
+            return []
+        ids = self.get_prefetch_ids(action_data, self.permission_id or "id")
+        if not ids:
+            return []
+        return [GetManyRequest(model.collection, ids, ["meeting_id"])]
+
+    def get_prefetch_ids(self, action_data: ActionData, field: str) -> List[int]:
+        """
+        Returns all distinct ids which are found in the given field of the instances.
+        Since the action data is not validated yet, all other values are ignored.
+        """
+        return sorted(
+            {
+                instance[field]
+                for instance in action_data
+                if isinstance(instance.get(field), int) and instance[field] > 0
+            }
+        )
+
     def check_permissions(self, instance: Dict[str, Any]) -> None:
         """
         Checks permission by requesting permission service or using internal check.
@@ -79,8 +79,7 @@ class ActionHandler(BaseHandler):
         """
         for name in sorted(actions_map):
             action = actions_map[name]
-            schema: Dict[str, Any] = deepcopy(action_data_schema)
-            schema["items"] = action.schema
+            schema: Dict[str, Any] = dict(action_data_schema, items=action.schema)
             if action.is_singular:
                 schema["maxItems"] = 1
             info = dict(
@@ -132,6 +131,16 @@ class ActionHandler(BaseHandler):
         for on_success in self.on_success:
             on_success()
 
+        self.logger.debug(
+            f"Model cache of the datastore had {self.datastore.cache_hits} hits and "
+            f"{self.datastore.cache_misses} misses."
+        )
+        self.logger.debug(
+            f"Reserved ids with {self.datastore.reserve_round_trips} requests, "
+            f"{sum(map(len, self.datastore.reserved_ids.values()))} reserved ids "
+            "were not used."
+        )
+
         # Return action result
         self.logger.debug("Request was successful. Send response now.")
         return ActionsResponse(
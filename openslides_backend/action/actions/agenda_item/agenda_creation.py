@@ -1,9 +1,11 @@
-from typing import Any, Dict, List, Type
+from typing import Any, Dict, List, Optional, Type
 
 from ....models.models import AgendaItem
+from ....services.datastore.commands import GetManyRequest
 from ....shared.patterns import KEYSEPARATOR, Collection, FullQualifiedId
 from ....shared.schema import optional_id_schema
 from ...action import Action
+from ...util.typing import ActionData
 
 AGENDA_PREFIX = "agenda_"
 
@@ -41,6 +43,23 @@ agenda_creation_properties = {
 }
 
 
+def is_agenda_item_created(
+    agenda_item_creation: Optional[str], agenda_create: Optional[bool]
+) -> bool:
+    if agenda_item_creation == "always":
+        return True
+    elif agenda_item_creation == "never":
+        return False
+    elif agenda_item_creation == "default_yes":
+        result_default = True
+    else:
+        result_default = False
+
+    if agenda_create is None:
+        return result_default
+    return agenda_create
+
+
 class CreateActionWithAgendaItemMixin(Action):
     """
     Mixin that can be used to create an agenda item as a dependency.
@@ -54,20 +73,37 @@ class CreateActionWithAgendaItemMixin(Action):
             FullQualifiedId(Collection("meeting"), instance["meeting_id"]),
             ["agenda_item_creation"],
         )
-        agenda_item_creation = meeting.get("agenda_item_creation")
-        agenda_create = instance.pop("agenda_create", None)
-        if agenda_item_creation == "always":
-            return True
-        elif agenda_item_creation == "never":
-            return False
-        elif agenda_item_creation == "default_yes":
-            result_default = True
-        else:
-            result_default = False
+        return is_agenda_item_created(
+            meeting.get("agenda_item_creation"), instance.pop("agenda_create", None)
+        )
 
-        if agenda_create is None:
-            return result_default
-        return agenda_create
+    def count_dependant_action_executions_agenda_item(
+        self, action_data: ActionData, CreateActionClass: Type[Action]
+    ) -> Optional[int]:
+        """
+        Counts the agenda items if the meeting of each instance is given in the action
+        data. The meetings are read without locks, the check locks them later.
+        """
+        if any("meeting_id" not in instance for instance in action_data):
+            return None
+        meetings = self.datastore.get_many(
+            [
+                GetManyRequest(
+                    Collection("meeting"),
+                    sorted({instance["meeting_id"] for instance in action_data}),
+                    ["agenda_item_creation"],
+                )
+            ],
+            lock_result=False,
+        ).get(Collection("meeting"), {})
+        return sum(
+            1
+            for instance in action_data
+            if is_agenda_item_created(
+                meetings.get(instance["meeting_id"], {}).get("agenda_item_creation"),
+                instance.get("agenda_create"),
+            )
+        )
 
     def get_dependent_action_data_agenda_item(
         self, instance: Dict[str, Any], CreateActionClass: Type[Action]
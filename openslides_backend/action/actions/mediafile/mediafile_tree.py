@@ -0,0 +1,110 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+from ....models.helper import calculate_inherited_groups_helper
+from ....services.datastore.commands import GetManyRequest
+from ....services.datastore.interface import DatastoreService
+from ....shared.patterns import Collection, FullQualifiedField, FullQualifiedId
+
+MEDIAFILE_FIELDS = [
+    "child_ids",
+    "access_group_ids",
+    "is_public",
+    "inherited_access_group_ids",
+]
+
+
+class MediafileTree:
+    """
+    In-memory tree of the mediafiles of a meeting to recalculate the fields is_public
+    and inherited_access_group_ids of whole subtrees without further requests.
+
+    The tree can be built from any dict of mediafiles, e.g. from a meeting json. If
+    it is loaded from the datastore, all mediafiles of the meeting are read at once
+    and the fields of all visited mediafiles are locked, as if they had been read
+    one by one.
+    """
+
+    mediafiles: Dict[int, Dict[str, Any]]
+
+    def __init__(
+        self,
+        mediafiles: Dict[int, Dict[str, Any]],
+        datastore: Optional[DatastoreService] = None,
+    ) -> None:
+        self.mediafiles = mediafiles
+        self.datastore = datastore
+
+    @classmethod
+    def get(cls, datastore: DatastoreService, meeting_id: int) -> "MediafileTree":
+        """
+        Returns the tree of the given meeting for the current request.
+        """
+        key = ("mediafile_tree", meeting_id)
+        if key not in datastore.request_cache:
+            meeting = datastore.get(
+                FullQualifiedId(Collection("meeting"), meeting_id),
+                ["mediafile_ids"],
+                lock_result=False,
+            )
+            mediafiles = datastore.get_many(
+                [
+                    GetManyRequest(
+                        Collection("mediafile"),
+                        meeting.get("mediafile_ids") or [],
+                        MEDIAFILE_FIELDS + ["meta_position"],
+                    )
+                ],
+                lock_result=False,
+            ).get(Collection("mediafile"), {})
+            datastore.request_cache[key] = cls(dict(mediafiles), datastore)
+        return datastore.request_cache[key]
+
+    def recalculate_children(
+        self,
+        id: int,
+        is_public: Optional[bool],
+        inherited_access_group_ids: Optional[List[int]],
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Calculates the fields of all descendants of the given mediafile top-down from
+        its given values and yields the changed descendants in depth-first order. The
+        subtree of an unchanged descendant is skipped, since it is consistent already.
+        """
+        self.lock(id, ["child_ids"])
+        for child_id in self.mediafiles.get(id, {}).get("child_ids") or []:
+            if (child := self.mediafiles.get(child_id)) is None:
+                continue
+            self.lock(child_id, MEDIAFILE_FIELDS)
+            (
+                child_is_public,
+                child_inherited_access_group_ids,
+            ) = calculate_inherited_groups_helper(
+                child.get("access_group_ids", []),
+                is_public,
+                inherited_access_group_ids,
+            )
+            if (
+                child.get("is_public") == child_is_public
+                and child.get("inherited_access_group_ids")
+                == child_inherited_access_group_ids
+            ):
+                continue
+            child["is_public"] = child_is_public
+            child["inherited_access_group_ids"] = child_inherited_access_group_ids
+            yield {
+                "id": child_id,
+                "is_public": child_is_public,
+                "inherited_access_group_ids": child_inherited_access_group_ids,
+            }
+            yield from self.recalculate_children(
+                child_id, child_is_public, child_inherited_access_group_ids
+            )
+
+    def lock(self, id: int, fields: List[str]) -> None:
+        if not self.datastore or "meta_position" not in self.mediafiles.get(id, {}):
+            return
+        for field in fields:
+            self.datastore.update_locked_fields(
+                FullQualifiedField(Collection("mediafile"), id, field),
+                self.mediafiles[id]["meta_position"],
+            )
@@ -2,7 +2,6 @@ import time
 from collections import defaultdict
 from typing import Any, Dict, Iterable, List
 
-from ....models.checker import Checker, CheckException
 from ....models.models import Meeting
 from ....permissions.management_levels import CommitteeManagementLevel
 from ....permissions.permission_helper import has_committee_management_level
@@ -28,18 +27,9 @@ class MeetingClone(MeetingImport):
     )
 
     def update_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
-        meeting_json_old = export_meeting(
+        meeting_json = export_meeting(
             self.datastore, self.media, instance["meeting_id"]
         )
-
-        # Transform data format
-        # TODO: Transform format earlier, e. g. in export_meeting function
-        meeting_json: Dict[str, Any] = {}
-        for collection, objs in meeting_json_old.items():
-            meeting_json[collection] = {}
-            for obj in objs:
-                meeting_json[collection][str(obj["id"])] = obj
-
         instance["meeting"] = meeting_json
 
         # checks if the meeting is correct
@@ -52,12 +42,7 @@ class MeetingClone(MeetingImport):
             self.get_meeting_from_json(meeting_json)["committee_id"] = committee_id
 
         # check datavalidation
-        checker = Checker(data=meeting_json, mode="internal")
-        try:
-            checker.run_check()
-        except CheckException as ce:
-            raise ActionException(str(ce))
-        self.allowed_collections = checker.allowed_collections
+        self.check_meeting_data(meeting_json, mode="internal")
 
         for entry in meeting_json.get("motion", {}).values():
             if entry.get("all_origin_ids") or entry.get("all_derived_motion_ids"):
@@ -106,9 +91,10 @@ class MeetingClone(MeetingImport):
         meeting["name"] = meeting.get("name", "") + " - Copy"
 
     def create_write_requests(self, instance: Dict[str, Any]) -> Iterable[WriteRequest]:
-        write_requests = list(super().create_write_requests(instance))
+        yield from super().create_write_requests(instance)
+        write_requests: List[WriteRequest] = []
         self.append_extra_write_requests(write_requests, instance["meeting"])
-        return write_requests
+        yield from write_requests
 
     def append_extra_write_requests(
         self, write_requests: List[WriteRequest], json_data: Dict[str, Any]
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 from datastore.shared.util import is_reserved_field
 
@@ -11,24 +11,30 @@ from ....shared.patterns import Collection, FullQualifiedId
 
 def export_meeting(
     datastore: DatastoreService, media: MediaService, meeting_id: int
-) -> Dict[str, Any]:
-    export = {}
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Exports all models of the meeting, keyed by collection and stringified id.
+    """
+    return dict(iter_meeting_export(datastore, meeting_id))
 
-    # handle collections with meeting_id
-    meeting_collections = get_collections_with_meeting_id()
-    for collection in meeting_collections:
+
+def iter_meeting_export(
+    datastore: DatastoreService, meeting_id: int
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yields the models of the meeting collection by collection. The models returned
+    by the datastore are transformed in place, so no further copy of the meeting is
+    held in memory.
+    """
+    for collection in get_collections_with_meeting_id():
         res = datastore.filter(
             Collection(collection),
             FilterOperator("meeting_id", "=", meeting_id),
         )
-        export[collection] = add_empty_fields(
-            remove_meta_fields(list(res.values())), collection
-        )
+        yield collection, prepare_models(res.values(), collection)
 
-    # handle meeting
     meeting = datastore.get(FullQualifiedId(Collection("meeting"), meeting_id))
-    export["meeting"] = add_empty_fields(remove_meta_fields([meeting]), "meeting")
-    return export
+    yield "meeting", prepare_models([meeting], "meeting")
 
 
 def get_collections_with_meeting_id() -> List[str]:
@@ -66,26 +72,34 @@ def get_collections_with_meeting_id() -> List[str]:
     return collections
 
 
-def remove_meta_fields(res: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    list_without_meta_fields = []
-    for entry in res:
-        new_entry = {}
-        for fieldname in entry:
-            if not is_reserved_field(fieldname):
-                new_entry[fieldname] = entry[fieldname]
-        list_without_meta_fields.append(new_entry)
-    return list_without_meta_fields
+def prepare_models(
+    models: Iterable[Dict[str, Any]], collection: str
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Removes the meta fields and adds all missing fields of the collection to the
+    given models and returns them keyed by their stringified id.
+    """
+    fields = get_field_names(collection)
+    result = {}
+    for model in models:
+        remove_meta_fields(model)
+        add_empty_fields(model, fields)
+        result[str(model["id"])] = model
+    return result
 
 
-def add_empty_fields(
-    res: List[Dict[str, Any]], collection: str
-) -> List[Dict[str, Any]]:
-    fields = set(
+def get_field_names(collection: str) -> List[str]:
+    return [
         field.get_own_field_name()
         for field in model_registry[Collection(collection)]().get_fields()
-    )
-    for entry in res:
-        for field in fields:
-            if field not in entry:
-                entry[field] = None
-    return res
+    ]
+
+
+def remove_meta_fields(model: Dict[str, Any]) -> None:
+    for fieldname in [fieldname for fieldname in model if is_reserved_field(fieldname)]:
+        del model[fieldname]
+
+
+def add_empty_fields(model: Dict[str, Any], fields: Iterable[str]) -> None:
+    for field in fields:
+        model.setdefault(field, None)
@@ -2,33 +2,23 @@ import time
 from collections import defaultdict
 from typing import Any, Dict, Iterable, Optional, Tuple
 
-from ....models.base import model_registry
 from ....models.checker import Checker, CheckException
-from ....models.fields import (
-    BaseGenericRelationField,
-    BaseRelationField,
-    BaseTemplateField,
-    GenericRelationField,
-    GenericRelationListField,
-    RelationField,
-    RelationListField,
-)
 from ....models.models import Meeting
 from ....permissions.management_levels import CommitteeManagementLevel
 from ....permissions.permission_helper import has_committee_management_level
 from ....shared.exceptions import ActionException, MissingPermission
-from ....shared.filters import FilterOperator
 from ....shared.interfaces.event import EventType
 from ....shared.interfaces.write_request import WriteRequest
-from ....shared.patterns import KEYSEPARATOR, Collection, FullQualifiedId
+from ....shared.patterns import Collection, FullQualifiedId
 from ...action import Action
 from ...mixins.singular_action_mixin import SingularActionMixin
 from ...util.crypto import get_random_string
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
 from ...util.typing import ActionData, ActionResultElement, ActionResults
-from ..motion.update import RECOMMENDATION_EXTENSION_REFERENCE_IDS_PATTERN
 from ..user.user_mixin import LimitOfUserMixin
+from ..user.username_index import UsernameIndex
+from .replace_helper import IdReplacer
 
 
 @register_action("meeting.import")
@@ -93,12 +83,7 @@ class MeetingImport(SingularActionMixin, LimitOfUserMixin, Action):
                 self.mediadata.append((blob, entry["id"], entry["mimetype"]))
 
         # check datavalidation
-        checker = Checker(data=meeting_json, mode="external")
-        try:
-            checker.run_check()
-        except CheckException as ce:
-            raise ActionException(str(ce))
-        self.allowed_collections = checker.allowed_collections
+        self.check_meeting_data(meeting_json, mode="external")
 
         for entry in meeting_json.get("motion", {}).values():
             if entry.get("all_origin_ids") or entry.get("all_derived_motion_ids"):
@@ -116,28 +101,27 @@ class MeetingImport(SingularActionMixin, LimitOfUserMixin, Action):
         self.upload_mediadata()
         return instance
 
+    def check_meeting_data(self, meeting_json: Dict[str, Any], mode: str) -> None:
+        checker = Checker(data=meeting_json, mode=mode)
+        try:
+            checker.run_check()
+        except CheckException as ce:
+            raise ActionException(str(ce))
+        finally:
+            timings = sorted(checker.timings.items(), key=lambda t: t[1], reverse=True)
+            self.logger.debug(
+                f"Checked meeting data in {sum(checker.timings.values()):.3f}s: "
+                + ", ".join(
+                    f"{collection} {timing:.3f}s" for collection, timing in timings
+                )
+            )
+        self.allowed_collections = checker.allowed_collections
+
     def check_usernames_and_generate_new_ones(self, json_data: Dict[str, Any]) -> None:
-        used_usernames = set()
+        username_index = UsernameIndex.get(self.datastore)
+        username_index.load()
         for entry in json_data.get("user", {}).values():
-            is_username_unique = False
-            template_username = entry["username"]
-            count = 1
-            while not is_username_unique:
-                if entry["username"] in used_usernames:
-                    entry["username"] = template_username + " " + str(count)
-                    count += 1
-                    continue
-                result = self.datastore.filter(
-                    Collection("user"),
-                    FilterOperator("username", "=", entry["username"]),
-                    ["id"],
-                )
-                if result:
-                    entry["username"] = template_username + " " + str(count)
-                    count += 1
-                    continue
-                is_username_unique = True
-            used_usernames.add(entry["username"])
+            entry["username"] = username_index.generate(entry["username"])
 
     def check_limit_of_meetings(self, committee_id: int, text: str = "import") -> int:
         committee = self.datastore.get(
@@ -196,134 +180,17 @@ class MeetingImport(SingularActionMixin, LimitOfUserMixin, Action):
         self.replace_map = replace_map
 
     def replace_fields(self, instance: Dict[str, Any]) -> None:
+        """
+        Replaces the ids of all entries in place, collection by collection.
+        """
         json_data = instance["meeting"]
-        new_json_data = {}
-        for collection in json_data:
+        id_replacer = IdReplacer(self.replace_map, self.allowed_collections)
+        for collection, entries in json_data.items():
             new_collection = {}
-            for entry in json_data[collection].values():
-                for field in list(entry.keys()):
-                    self.replace_field_ids(collection, entry, field)
+            for entry in entries.values():
+                id_replacer.replace_entry(collection, entry)
                 new_collection[str(entry["id"])] = entry
-            new_json_data[collection] = new_collection
-        instance["meeting"] = new_json_data
-
-    def replace_field_ids(
-        self,
-        collection: str,
-        entry: Dict[str, Any],
-        field: str,
-    ) -> None:
-
-        model_field = model_registry[Collection(collection)]().try_get_field(field)
-        if model_field is None:
-            raise ActionException(f"{collection}/{field} is not allowed.")
-        if isinstance(model_field, BaseRelationField):
-            if isinstance(model_field, BaseGenericRelationField):
-                content_list = (
-                    content
-                    if isinstance(content := entry.get(field), list)
-                    else [content]
-                )
-                target_collections = [
-                    item.split(KEYSEPARATOR)[0] for item in content_list if item
-                ]
-            else:
-                target_collections = [k.collection for k in model_field.to.keys()]
-            if all(c not in self.allowed_collections for c in target_collections):
-                return
-        if field == "id":
-            entry["id"] = self.replace_map[collection][entry["id"]]
-        elif (
-            collection == "meeting"
-            and field == "user_ids"
-            and "user" in self.allowed_collections
-        ):
-            entry[field] = [
-                self.replace_map["user"][id_] for id_ in entry.get(field) or []
-            ]
-        elif collection == "user" and field == "meeting_ids":
-            entry[field] = list(self.replace_map["meeting"].values())
-        elif collection == "motion" and field == "recommendation_extension":
-            if entry[field]:
-                fqids_str = RECOMMENDATION_EXTENSION_REFERENCE_IDS_PATTERN.findall(
-                    entry[field]
-                )
-                entry_str = entry[field]
-                entry_list = []
-                for fqid in fqids_str:
-                    search_str = "[" + fqid + "]"
-                    idx = entry_str.find(search_str)
-                    entry_list.append(entry_str[:idx])
-                    col, id_ = fqid.split(KEYSEPARATOR)
-                    replace_str = (
-                        "["
-                        + col
-                        + KEYSEPARATOR
-                        + str(self.replace_map[col][int(id_)])
-                        + "]"
-                    )
-                    entry_list.append(replace_str)
-                    entry_str = entry_str[idx + len(replace_str) :]
-                entry_list.append(entry_str)
-                entry[field] = "".join(entry_list)
-        else:
-            if (
-                isinstance(model_field, BaseTemplateField)
-                and model_field.is_template_field(field)
-                and model_field.replacement_collection
-            ):
-                entry[field] = [
-                    str(
-                        self.replace_map[model_field.replacement_collection.collection][
-                            int(id_)
-                        ]
-                    )
-                    for id_ in entry[field]
-                ]
-            elif (
-                isinstance(model_field, BaseTemplateField)
-                and model_field.is_template_field(field)
-                and not model_field.replacement_collection
-            ):
-                pass
-            elif isinstance(model_field, RelationField):
-                target_collection = model_field.get_target_collection().collection
-                if entry[field]:
-                    entry[field] = self.replace_map[target_collection][entry[field]]
-            elif isinstance(model_field, RelationListField):
-                target_collection = model_field.get_target_collection().collection
-                entry[field] = [
-                    self.replace_map[target_collection][id_]
-                    for id_ in entry.get(field) or []
-                ]
-            elif isinstance(model_field, GenericRelationField):
-                if entry[field]:
-                    name, id_ = entry[field].split(KEYSEPARATOR)
-                    entry[field] = (
-                        name + KEYSEPARATOR + str(self.replace_map[name][int(id_)])
-                    )
-            elif isinstance(model_field, GenericRelationListField):
-                new_fqid_list = []
-                for fqid in entry[field]:
-                    name, id_ = fqid.split(KEYSEPARATOR)
-                    new_fqid_list.append(
-                        name + KEYSEPARATOR + str(self.replace_map[name][int(id_)])
-                    )
-                entry[field] = new_fqid_list
-            if (
-                isinstance(model_field, BaseTemplateField)
-                and model_field.replacement_collection
-                and not model_field.is_template_field(field)
-            ):
-                replacement = model_field.get_replacement(field)
-                id_ = int(replacement)
-                new_id_ = self.replace_map[
-                    model_field.replacement_collection.collection
-                ][id_]
-                new_field = model_field.get_structured_field_name(new_id_)
-                tmp = entry[field]
-                del entry[field]
-                entry[new_field] = tmp
+            json_data[collection] = new_collection
 
     def update_admin_group(self, data_json: Dict[str, Any]) -> None:
         admin_group_id = self.get_meeting_from_json(data_json)["admin_group_id"]
@@ -344,43 +211,35 @@ class MeetingImport(SingularActionMixin, LimitOfUserMixin, Action):
     def create_write_requests(self, instance: Dict[str, Any]) -> Iterable[WriteRequest]:
         json_data = instance["meeting"]
         meeting_id = self.get_meeting_from_json(json_data)["id"]
-        write_requests = []
         for collection in json_data:
             for entry in json_data[collection].values():
                 fqid = FullQualifiedId(Collection(collection), entry["id"])
-                write_requests.append(
-                    self.build_write_request(
-                        EventType.Create,
-                        fqid,
-                        f"import meeting {meeting_id}",
-                        entry,
-                    )
+                yield self.build_write_request(
+                    EventType.Create,
+                    fqid,
+                    f"import meeting {meeting_id}",
+                    entry,
                 )
         # add meeting to committee/meeting_ids
-        write_requests.append(
-            self.build_write_request(
-                EventType.Update,
-                FullQualifiedId(
-                    Collection("committee"),
-                    self.get_meeting_from_json(json_data)["committee_id"],
-                ),
-                f"import meeting {meeting_id}",
-                None,
-                {"add": {"meeting_ids": [meeting_id]}, "remove": {}},
-            )
+        yield self.build_write_request(
+            EventType.Update,
+            FullQualifiedId(
+                Collection("committee"),
+                self.get_meeting_from_json(json_data)["committee_id"],
+            ),
+            f"import meeting {meeting_id}",
+            None,
+            {"add": {"meeting_ids": [meeting_id]}, "remove": {}},
         )
         # add meeting to organization/active_meeting_ids if not archived
         if self.get_meeting_from_json(json_data).get("is_active_in_organization_id"):
-            write_requests.append(
-                self.build_write_request(
-                    EventType.Update,
-                    FullQualifiedId(Collection("organization"), 1),
-                    f"import meeting {meeting_id}",
-                    None,
-                    {"add": {"active_meeting_ids": [meeting_id]}, "remove": {}},
-                )
+            yield self.build_write_request(
+                EventType.Update,
+                FullQualifiedId(Collection("organization"), 1),
+                f"import meeting {meeting_id}",
+                None,
+                {"add": {"active_meeting_ids": [meeting_id]}, "remove": {}},
             )
-        return write_requests
 
     def create_action_result_element(
         self, instance: Dict[str, Any]
@@ -0,0 +1,206 @@
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from ....models.base import model_registry
+from ....models.fields import (
+    BaseGenericRelationField,
+    BaseRelationField,
+    BaseTemplateField,
+    Field,
+    GenericRelationField,
+    GenericRelationListField,
+    RelationField,
+    RelationListField,
+)
+from ....shared.exceptions import ActionException
+from ....shared.patterns import KEYSEPARATOR, Collection
+from ..motion.update import RECOMMENDATION_EXTENSION_REFERENCE_IDS_PATTERN
+
+ReplaceMap = Dict[str, Dict[int, int]]
+FieldRewrite = Callable[[Dict[str, Any], str], None]
+
+
+class IdReplacer:
+    """
+    Replaces all ids in the entries of a meeting json with the new ids from the
+    replace map.
+
+    For each pair of collection and field name a rewrite function is compiled once
+    from the model definitions, so that all further entries only need dictionary
+    lookups. Fields which need no rewrite are compiled to None.
+    """
+
+    def __init__(self, replace_map: ReplaceMap, allowed_collections: Iterable[str]):
+        self.replace_map = replace_map
+        self.allowed_collections: Set[str] = set(allowed_collections)
+        self.rewrites: Dict[Tuple[str, str], Optional[FieldRewrite]] = {}
+
+    def replace_entry(self, collection: str, entry: Dict[str, Any]) -> None:
+        for field in list(entry.keys()):
+            self.replace_field(collection, entry, field)
+
+    def replace_field(self, collection: str, entry: Dict[str, Any], field: str) -> None:
+        key = (collection, field)
+        if key in self.rewrites:
+            rewrite = self.rewrites[key]
+        else:
+            rewrite = self.rewrites[key] = self.compile(collection, field)
+        if rewrite:
+            rewrite(entry, field)
+
+    def compile(self, collection: str, field: str) -> Optional[FieldRewrite]:
+        model_field = model_registry[Collection(collection)]().try_get_field(field)
+        if model_field is None:
+            raise ActionException(f"{collection}/{field} is not allowed.")
+
+        rewrite = self.compile_rewrite(collection, field, model_field)
+        if rewrite is None or not isinstance(model_field, BaseRelationField):
+            return rewrite
+        if isinstance(model_field, BaseGenericRelationField):
+            # the target collections are only known from the value
+            return self.guard_generic_relation(rewrite)
+        if all(c.collection not in self.allowed_collections for c in model_field.to):
+            return None
+        return rewrite
+
+    def guard_generic_relation(self, rewrite: FieldRewrite) -> FieldRewrite:
+        allowed_collections = self.allowed_collections
+
+        def guarded_rewrite(entry: Dict[str, Any], field: str) -> None:
+            content = entry.get(field)
+            for item in content if isinstance(content, list) else [content]:
+                if item and item.split(KEYSEPARATOR)[0] in allowed_collections:
+                    rewrite(entry, field)
+                    return
+
+        return guarded_rewrite
+
+    def compile_rewrite(
+        self, collection: str, field: str, model_field: Field
+    ) -> Optional[FieldRewrite]:
+        replace_map = self.replace_map
+        if field == "id":
+            collection_map = replace_map[collection]
+
+            def replace_id(entry: Dict[str, Any], field: str) -> None:
+                entry["id"] = collection_map[entry["id"]]
+
+            return replace_id
+        if collection == "meeting" and field == "user_ids":
+            if "user" not in self.allowed_collections:
+                return None
+            return self.replace_relation_list("user")
+        if collection == "user" and field == "meeting_ids":
+
+            def replace_meeting_ids(entry: Dict[str, Any], field: str) -> None:
+                entry[field] = list(replace_map["meeting"].values())
+
+            return replace_meeting_ids
+        if collection == "motion" and field == "recommendation_extension":
+            return self.replace_recommendation_extension
+
+        is_template_field = isinstance(
+            model_field, BaseTemplateField
+        ) and model_field.is_template_field(field)
+        value_rewrite: Optional[FieldRewrite] = None
+        if is_template_field:
+            assert isinstance(model_field, BaseTemplateField)
+            if model_field.replacement_collection:
+                value_rewrite = self.replace_replacements(
+                    model_field.replacement_collection.collection
+                )
+        elif isinstance(model_field, RelationField):
+            value_rewrite = self.replace_relation(
+                model_field.get_target_collection().collection
+            )
+        elif isinstance(model_field, RelationListField):
+            value_rewrite = self.replace_relation_list(
+                model_field.get_target_collection().collection
+            )
+        elif isinstance(model_field, GenericRelationField):
+            value_rewrite = self.replace_generic_relation
+        elif isinstance(model_field, GenericRelationListField):
+            value_rewrite = self.replace_generic_relation_list
+
+        if (
+            isinstance(model_field, BaseTemplateField)
+            and model_field.replacement_collection
+            and not is_template_field
+        ):
+            return self.rename_structured_field(model_field, field, value_rewrite)
+        return value_rewrite
+
+    def replace_relation(self, target_collection: str) -> FieldRewrite:
+        replace_map = self.replace_map
+
+        def rewrite(entry: Dict[str, Any], field: str) -> None:
+            if entry[field]:
+                entry[field] = replace_map[target_collection][entry[field]]
+
+        return rewrite
+
+    def replace_relation_list(self, target_collection: str) -> FieldRewrite:
+        replace_map = self.replace_map
+
+        def rewrite(entry: Dict[str, Any], field: str) -> None:
+            collection_map = replace_map[target_collection]
+            entry[field] = [collection_map[id_] for id_ in entry.get(field) or []]
+
+        return rewrite
+
+    def replace_replacements(self, replacement_collection: str) -> FieldRewrite:
+        replace_map = self.replace_map
+
+        def rewrite(entry: Dict[str, Any], field: str) -> None:
+            collection_map = replace_map[replacement_collection]
+            entry[field] = [str(collection_map[int(id_)]) for id_ in entry[field]]
+
+        return rewrite
+
+    def replace_fqid(self, fqid: str) -> str:
+        name, id_ = fqid.split(KEYSEPARATOR)
+        return name + KEYSEPARATOR + str(self.replace_map[name][int(id_)])
+
+    def replace_generic_relation(self, entry: Dict[str, Any], field: str) -> None:
+        if entry[field]:
+            entry[field] = self.replace_fqid(entry[field])
+
+    def replace_generic_relation_list(self, entry: Dict[str, Any], field: str) -> None:
+        entry[field] = [self.replace_fqid(fqid) for fqid in entry[field]]
+
+    def rename_structured_field(
+        self,
+        model_field: BaseTemplateField,
+        field: str,
+        value_rewrite: Optional[FieldRewrite],
+    ) -> FieldRewrite:
+        assert model_field.replacement_collection
+        replacement_collection = model_field.replacement_collection.collection
+        replacement = int(model_field.get_replacement(field))
+        replace_map = self.replace_map
+
+        def rewrite(entry: Dict[str, Any], field: str) -> None:
+            if value_rewrite:
+                value_rewrite(entry, field)
+            new_id = replace_map[replacement_collection][replacement]
+            new_field = model_field.get_structured_field_name(new_id)
+            entry[new_field] = entry.pop(field)
+
+        return rewrite
+
+    def replace_recommendation_extension(
+        self, entry: Dict[str, Any], field: str
+    ) -> None:
+        if not entry[field]:
+            return
+        fqids_str = RECOMMENDATION_EXTENSION_REFERENCE_IDS_PATTERN.findall(entry[field])
+        entry_str = entry[field]
+        entry_list = []
+        for fqid in fqids_str:
+            search_str = "[" + fqid + "]"
+            idx = entry_str.find(search_str)
+            entry_list.append(entry_str[:idx])
+            replace_str = "[" + self.replace_fqid(fqid) + "]"
+            entry_list.append(replace_str)
+            entry_str = entry_str[idx + len(replace_str) :]
+        entry_list.append(entry_str)
+        entry[field] = "".join(entry_list)
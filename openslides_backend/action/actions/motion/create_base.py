@@ -5,6 +5,7 @@ from ....models.models import Motion
 from ....shared.exceptions import ActionException
 from ....shared.patterns import Collection, FullQualifiedId
 from ...mixins.create_action_with_dependencies import CreateActionWithDependencies
+from ...util.typing import ActionData
 from ..agenda_item.agenda_creation import CreateActionWithAgendaItemMixin
 from ..agenda_item.create import AgendaItemCreate
 from ..list_of_speakers.create import ListOfSpeakersCreate
@@ -27,6 +28,16 @@ class MotionCreateBase(
     model = Motion()
     dependencies = [AgendaItemCreate, ListOfSpeakersCreate]
 
+    def get_dependent_id_amounts(
+        self, action_data: ActionData
+    ) -> Dict[Collection, int]:
+        amounts = super().get_dependent_id_amounts(action_data)
+        amounts[MotionSubmitterCreateAction.model.collection] += sum(
+            len(instance.get("submitter_ids") or [self.user_id])
+            for instance in action_data
+        )
+        return amounts
+
     def set_state_from_workflow(
         self, instance: Dict[str, Any], meeting: Dict[str, Any]
     ) -> None:
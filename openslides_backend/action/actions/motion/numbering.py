@@ -0,0 +1,258 @@
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ....services.datastore.commands import GetManyRequest
+from ....services.datastore.interface import DatastoreService
+from ....shared.filters import And, FilterOperator
+from ....shared.interfaces.collection_field_lock import CollectionFieldLockWithFilter
+from ....shared.patterns import (
+    Collection,
+    CollectionField,
+    FullQualifiedField,
+    FullQualifiedId,
+)
+
+MEETING_FIELDS = [
+    "motion_ids",
+    "motion_category_ids",
+    "motions_number_type",
+    "motions_number_min_digits",
+    "motions_number_with_blank",
+    "motions_amendments_prefix",
+]
+MOTION_FIELDS = [
+    "number",
+    "number_value",
+    "lead_motion_id",
+    "category_id",
+    "category_weight",
+]
+CATEGORY_FIELDS = ["prefix", "parent_id", "child_ids", "weight", "motion_ids"]
+# the fields the numbers given out by the index depend on, only these are locked
+LOCKED_MOTION_FIELDS = ["number", "number_value", "lead_motion_id", "category_id"]
+LOCKED_CATEGORY_FIELDS = ["prefix"]
+
+# The motions over which the maximal number value is taken: all motions which have
+# the given value in the given field.
+NumberScope = Tuple[str, Optional[int]]
+
+
+class MotionNumbering:
+    """
+    In-memory index of the motion numbers of a meeting. The meeting, its motions and
+    its motion categories are loaded once per request and shared by all actions via
+    the request cache of the datastore. Numbers which are given to motions during
+    the request are registered in the index, so that all motions of a payload can be
+    numbered without further requests and without giving a number twice.
+
+    The index is locked with filter locks on the fields of the motions and motion
+    categories of the meeting the numbers depend on, as if the numbers had been
+    checked with datastore.filter and datastore.max.
+    """
+
+    meeting: Dict[str, Any]
+    motions: Dict[int, Dict[str, Any]]
+    categories: Dict[int, Dict[str, Any]]
+    # maps the numbers to the ids of the motions which have them
+    numbers: Dict[str, Set[int]]
+    # maps the number scopes to their maximal number value
+    max_values: Dict[NumberScope, int]
+
+    def __init__(self, datastore: DatastoreService, meeting_id: int) -> None:
+        self.datastore = datastore
+        self.meeting_id = meeting_id
+        self.meeting = datastore.get(
+            FullQualifiedId(Collection("meeting"), meeting_id),
+            MEETING_FIELDS + ["meta_position"],
+            lock_result=False,
+        )
+        result = datastore.get_many(
+            [
+                GetManyRequest(
+                    Collection("motion"),
+                    self.meeting.get("motion_ids") or [],
+                    MOTION_FIELDS + ["meta_position"],
+                ),
+                GetManyRequest(
+                    Collection("motion_category"),
+                    self.meeting.get("motion_category_ids") or [],
+                    CATEGORY_FIELDS + ["meta_position"],
+                ),
+            ],
+            lock_result=False,
+        )
+        self.motions = dict(result.get(Collection("motion"), {}))
+        self.categories = dict(result.get(Collection("motion_category"), {}))
+        # No motion or category was changed between this position and the read. It
+        # is used as position of the locks.
+        self.position = max(
+            model["meta_position"]
+            for model in (
+                self.meeting,
+                *self.motions.values(),
+                *self.categories.values(),
+            )
+        )
+        self.numbers = {}
+        for motion_id, motion in self.motions.items():
+            if motion.get("number"):
+                self.numbers.setdefault(motion["number"], set()).add(motion_id)
+        self.max_values = {}
+        self.filter_lock: CollectionFieldLockWithFilter = {
+            "position": self.position,
+            "filter": And(
+                FilterOperator("meeting_id", "=", self.meeting_id),
+                FilterOperator("meta_deleted", "=", False),
+            ),
+        }
+
+    @classmethod
+    def get(cls, datastore: DatastoreService, meeting_id: int) -> "MotionNumbering":
+        """
+        Returns the index of the given meeting for the current request.
+        """
+        key = ("motion_numbering", meeting_id)
+        if key not in datastore.request_cache:
+            datastore.request_cache[key] = cls(datastore, meeting_id)
+        numbering = datastore.request_cache[key]
+        numbering.lock()
+        return numbering
+
+    @property
+    def blank(self) -> str:
+        return " " if self.meeting.get("motions_number_with_blank") else ""
+
+    def format_number(self, prefix: str, number_value: int) -> str:
+        number_value_str = str(number_value).rjust(
+            self.meeting.get("motions_number_min_digits", 0), "0"
+        )
+        return f"{prefix}{number_value_str}"
+
+    def is_unique(self, number: str, exclude_ids: Iterable[int] = ()) -> bool:
+        """
+        Checks whether no motion of the meeting besides the excluded ones has the
+        number.
+        """
+        return not self.numbers.get(number, set()).difference(exclude_ids)
+
+    def get_prefix(
+        self, lead_motion_id: Optional[int], category_id: Optional[int]
+    ) -> str:
+        if lead_motion_id:
+            lead_motion = self.motions.get(lead_motion_id, {})
+            return f"{lead_motion.get('number', '')}{self.blank}{self.meeting.get('motions_amendments_prefix', '')}"
+        if category_id and (
+            prefix := self.categories.get(category_id, {}).get("prefix")
+        ):
+            return f"{prefix}{self.blank}"
+        return ""
+
+    def get_scope(
+        self, lead_motion_id: Optional[int], category_id: Optional[int]
+    ) -> NumberScope:
+        if lead_motion_id:
+            return ("lead_motion_id", lead_motion_id)
+        if self.meeting.get("motions_number_type") == "per_category":
+            return ("category_id", category_id)
+        return ("lead_motion_id", None)
+
+    def get_max_value(self, scope: NumberScope) -> Optional[int]:
+        if scope not in self.max_values:
+            field, value = scope
+            number_values = [
+                motion["number_value"]
+                for motion in self.motions.values()
+                if motion.get(field) == value and motion.get("number_value") is not None
+            ]
+            if not number_values:
+                return None
+            self.max_values[scope] = max(number_values)
+        return self.max_values[scope]
+
+    def allocate(
+        self,
+        motion_id: int,
+        lead_motion_id: Optional[int],
+        category_id: Optional[int],
+        number_value: Optional[int] = None,
+    ) -> Tuple[str, int]:
+        """
+        Returns the next free number and number value for the motion and registers
+        them. If a number value is given, the search for a free number starts there.
+        """
+        prefix = self.get_prefix(lead_motion_id, category_id)
+        if not number_value:
+            max_value = self.get_max_value(self.get_scope(lead_motion_id, category_id))
+            number_value = 1 if max_value is None else max_value + 1
+        number = self.format_number(prefix, number_value)
+        while not self.is_unique(number):
+            number_value += 1
+            number = self.format_number(prefix, number_value)
+        self.register(motion_id, number, number_value, lead_motion_id, category_id)
+        return number, number_value
+
+    def register(
+        self,
+        motion_id: int,
+        number: str,
+        number_value: Optional[int],
+        lead_motion_id: Optional[int],
+        category_id: Optional[int],
+    ) -> None:
+        """
+        Registers the number and number value of the motion in the index.
+        """
+        motion = self.motions.setdefault(motion_id, {})
+        if (old_number := motion.get("number")) and old_number in self.numbers:
+            self.numbers[old_number].discard(motion_id)
+        self.numbers.setdefault(number, set()).add(motion_id)
+
+        old_number_value = motion.get("number_value")
+        motion.update(
+            {
+                "number": number,
+                "number_value": number_value,
+                "lead_motion_id": lead_motion_id,
+                "category_id": category_id,
+            }
+        )
+        if old_number_value is not None or number_value is None:
+            # a number value could have been lowered, so the maxima are recalculated
+            self.max_values.clear()
+            return
+        for scope in (("lead_motion_id", lead_motion_id), ("category_id", category_id)):
+            if scope in self.max_values:
+                self.max_values[scope] = max(self.max_values[scope], number_value)
+
+    def lock(self) -> None:
+        """
+        Adds the locks of the index to the locked fields of the current action, if
+        they are not contained yet.
+        """
+        if self.is_locked():
+            return
+        for field in ("motion_ids", "motion_category_ids"):
+            self.datastore.update_locked_fields(
+                FullQualifiedField(Collection("meeting"), self.meeting_id, field),
+                self.meeting["meta_position"],
+            )
+        fields: List[Tuple[str, List[str]]] = [
+            ("motion", LOCKED_MOTION_FIELDS),
+            ("motion_category", LOCKED_CATEGORY_FIELDS),
+        ]
+        for collection, collection_fields in fields:
+            for field in collection_fields:
+                self.datastore.update_locked_fields(
+                    CollectionField(Collection(collection), field), self.filter_lock
+                )
+
+    def is_locked(self) -> bool:
+        """
+        Returns whether the filter lock of the index is in the locked fields of the
+        current action.
+        """
+        locks = self.datastore.locked_fields.get(
+            str(CollectionField(Collection("motion"), LOCKED_MOTION_FIELDS[0]))
+        )
+        if isinstance(locks, list):
+            return any(lock is self.filter_lock for lock in locks)
+        return locks is self.filter_lock
@@ -4,13 +4,13 @@ from typing import Dict, List, Optional, Tuple
 
 from ....models.models import Motion, MotionCategory
 from ....permissions.permissions import Permissions
-from ....services.datastore.commands import GetManyRequest
 from ....shared.exceptions import ActionException
 from ....shared.patterns import Collection, FullQualifiedId
 from ...action import ActionData
 from ...generics.update import UpdateAction
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
+from ..motion.numbering import MotionNumbering
 
 
 @register_action("motion_category.number_motions")
@@ -34,12 +34,6 @@ class MotionCategoryNumberMotions(UpdateAction):
 
             affected_categories = self.get_affected_categories(instance["id"])
             affected_motions = self.get_affected_motions(affected_categories)
-            non_affected_motion_ids = [
-                id for id in self.mem_motions if id not in affected_motions
-            ]
-            non_affected_numbers = [
-                self.mem_motions[id].get("number") for id in non_affected_motion_ids
-            ]
 
             # check for missing lead_motion_ids in affected_motions.
             for motion_id in affected_motions:
@@ -62,13 +56,25 @@ class MotionCategoryNumberMotions(UpdateAction):
                     number_value_map[motion_id] = main_counter
                     main_counter += 1
 
-            for motion_id in affected_motions:
-                number, number_value = self.get_number(motion_id, number_value_map)
-                if number in non_affected_numbers:
+            numbers = {
+                motion_id: self.get_number(motion_id, number_value_map)
+                for motion_id in affected_motions
+            }
+            for number, _ in numbers.values():
+                if not self.numbering.is_unique(number, affected_motions):
                     raise ActionException(
                         f'Numbering aborted because the motion identifier "{number}" already exists.'
                     )
 
+            for motion_id, (number, number_value) in numbers.items():
+                motion = self.mem_motions.get(motion_id, {})
+                self.numbering.register(
+                    motion_id,
+                    number,
+                    number_value,
+                    motion.get("lead_motion_id"),
+                    motion.get("category_id"),
+                )
                 yield {
                     "id": motion_id,
                     "number": number,
@@ -77,48 +83,20 @@ class MotionCategoryNumberMotions(UpdateAction):
                 }
 
     def init_memory(self, main_category_id: int) -> None:
-        """Preload all categories with needed fields, all motions with needed fields
-        and meeting with needed fields."""
+        """Get the motion numbering of the meeting, which holds all categories, all
+        motions and the meeting with needed fields."""
         category = self.datastore.get(
             FullQualifiedId(Collection("motion_category"), main_category_id),
             ["meeting_id"],
         )
         self.main_category_id = main_category_id
 
-        if category.get("meeting_id"):
-            meeting = self.datastore.get(
-                FullQualifiedId(Collection("meeting"), category["meeting_id"]),
-                [
-                    "motion_ids",
-                    "motion_category_ids",
-                    "motions_number_with_blank",
-                    "motions_number_min_digits",
-                    "motions_amendments_prefix",
-                ],
-            )
-            self.meeting = meeting
-        else:
+        if not category.get("meeting_id"):
             raise ActionException("Main category doesnt include meeting_id.")
-
-        gmr_categories = GetManyRequest(
-            Collection("motion_category"),
-            meeting.get("motion_category_ids", []),
-            ["prefix", "parent_id", "child_ids", "weight", "motion_ids"],
-        )
-        gmr_motions = GetManyRequest(
-            Collection("motion"),
-            meeting.get("motion_ids", []),
-            [
-                "lead_motion_id",
-                "category_weight",
-                "category_id",
-                "number",
-            ],
-        )
-        result = self.datastore.get_many([gmr_categories, gmr_motions])
-        self.mem_categories = result.get(Collection("motion_category"), {})
-        self.mem_motions = result.get(Collection("motion"), {})
-        self.mem_meetings = {category.get("meeting_id"): meeting}
+        self.numbering = MotionNumbering.get(self.datastore, category["meeting_id"])
+        self.meeting = self.numbering.meeting
+        self.mem_categories = self.numbering.categories
+        self.mem_motions = self.numbering.motions
 
     def get_prefix(self, category_id: int) -> str:
         """Get the prefix of a category. If none, get the prefix of the parent if exists."""
@@ -1,19 +1,29 @@
+import re
 from collections import defaultdict
 from decimal import Decimal
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Set, Tuple, Union, cast
 
 from ....permissions.permission_helper import has_perm
 from ....permissions.permissions import Permission, Permissions
 from ....services.datastore.commands import GetManyRequest
 from ....services.datastore.interface import DatastoreService
 from ....shared.exceptions import MissingPermission, VoteServiceException
-from ....shared.patterns import KEYSEPARATOR, Collection, FullQualifiedId
+from ....shared.interfaces.event import Event, EventType
+from ....shared.interfaces.write_request import WriteRequest
+from ....shared.patterns import (
+    DECIMAL_PATTERN,
+    KEYSEPARATOR,
+    Collection,
+    FullQualifiedId,
+)
 from ...action import Action
+from ...util.entitled_users import get_entitled_users
 from ..option.set_auto_fields import OptionSetAutoFields
 from ..projector_countdown.mixins import CountdownControl
-from ..vote.create import VoteCreate
 from ..vote.user_token_helper import get_user_token
 
+decimal_regex = re.compile(DECIMAL_PATTERN)
+
 
 class PollPermissionMixin(Action):
     def check_permissions(self, instance: Dict[str, Any]) -> None:
@@ -53,7 +63,7 @@ class StopControl(CountdownControl, Action):
     def on_stop(self, instance: Dict[str, Any]) -> None:
         poll = self.datastore.get(
             FullQualifiedId(self.model.collection, instance["id"]),
-            ["state", "meeting_id", "pollmethod", "global_option_id"],
+            ["state", "meeting_id", "pollmethod", "global_option_id", "option_ids"],
         )
         # reset countdown given by meeting
         meeting = self.datastore.get(
@@ -69,46 +79,97 @@ class StopControl(CountdownControl, Action):
 
         # stop poll in vote service and create vote objects
         results = self.vote_service.stop(instance["id"])
-        action_data = []
+        votes, option_results, votesvalid = self.parse_vote_results(poll, results)
+        self.create_votes(poll["meeting_id"], votes)
+        # update results into option
+        self.execute_other_action(
+            OptionSetAutoFields,
+            [
+                {
+                    "id": _id,
+                    "yes": str(option["Y"]),
+                    "no": str(option["N"]),
+                    "abstain": str(option["A"]),
+                }
+                for _id, option in option_results.items()
+            ],
+        )
+        # set voted ids
+        voted_ids = results["user_ids"]
+        instance["voted_ids"] = voted_ids
+
+        # set votescast, votesvalid, votesinvalid
+        instance["votesvalid"] = str(votesvalid)
+        instance["votescast"] = str(Decimal("0.000000") + Decimal(len(voted_ids)))
+        instance["votesinvalid"] = "0.000000"
+
+        # set entitled users at stop.
+        instance["entitled_users_at_stop"] = get_entitled_users(
+            self.datastore, poll["meeting_id"], voted_ids
+        )
+
+    def parse_vote_results(
+        self, poll: Dict[str, Any], results: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], Dict[int, Dict[str, Decimal]], Decimal]:
+        """
+        Validates the result of the vote service and turns the ballots into the
+        votes to create. Sums up the weights per option and value in the same pass.
+        """
+        if not isinstance(results.get("votes"), list) or not isinstance(
+            results.get("user_ids"), list
+        ):
+            raise VoteServiceException("Invalid response from vote service")
+        option_ids = set(poll.get("option_ids") or [])
+        votes: List[Dict[str, Any]] = []
         votesvalid = Decimal("0.000000")
         option_results: Dict[int, Dict[str, Decimal]] = defaultdict(
             lambda: defaultdict(lambda: Decimal("0.000000"))
         )  # maps options to their respective YNA sums
         for ballot in results["votes"]:
-            user_token = get_user_token()
-            vote_weight = Decimal(ballot["weight"])
-            votesvalid += vote_weight
-            vote_template = {"user_token": user_token}
+            if not isinstance(ballot.get("weight"), str) or not decimal_regex.match(
+                ballot["weight"]
+            ):
+                raise VoteServiceException("Invalid response from vote service")
+            ballot_weight = Decimal(ballot["weight"])
+            votesvalid += ballot_weight
+            vote_template = {"user_token": get_user_token()}
             if "vote_user_id" in ballot:
                 vote_template["user_id"] = ballot["vote_user_id"]
             if "request_user_id" in ballot:
                 vote_template["delegated_user_id"] = ballot["request_user_id"]
 
             if isinstance(ballot["value"], dict):
+                ballot_values = []
                 for option_id_str, value in ballot["value"].items():
                     option_id = int(option_id_str)
-
-                    vote_value = value
+                    if option_id not in option_ids:
+                        raise VoteServiceException("Invalid response from vote service")
                     if poll["pollmethod"] in ("Y", "N"):
+                        if not isinstance(value, int):
+                            raise VoteServiceException(
+                                "Invalid response from vote service"
+                            )
                         if value == 0:
                             continue
-                        vote_value = poll["pollmethod"]
-                        vote_weight *= value
-
-                    option_results[option_id][vote_value] += vote_weight
-                    action_data.append(
-                        {
-                            "value": vote_value,
-                            "option_id": option_id,
-                            "weight": str(vote_weight),
-                            **vote_template,
-                        }
-                    )
+                        ballot_values.append(
+                            (option_id, poll["pollmethod"], ballot_weight * value)
+                        )
+                    else:
+                        ballot_values.append((option_id, value, ballot_weight))
             elif isinstance(ballot["value"], str):
-                vote_value = ballot["value"]
-                option_id = poll["global_option_id"]
+                if not poll.get("global_option_id"):
+                    raise VoteServiceException("Invalid response from vote service")
+                ballot_values = [
+                    (poll["global_option_id"], ballot["value"], ballot_weight)
+                ]
+            else:
+                raise VoteServiceException("Invalid response from vote service")
+
+            for option_id, vote_value, vote_weight in ballot_values:
+                if not isinstance(vote_value, str):
+                    raise VoteServiceException("Invalid response from vote service")
                 option_results[option_id][vote_value] += vote_weight
-                action_data.append(
+                votes.append(
                     {
                         "value": vote_value,
                         "option_id": option_id,
@@ -116,96 +177,101 @@ class StopControl(CountdownControl, Action):
                         **vote_template,
                     }
                 )
-            else:
-                raise VoteServiceException("Invalid response from vote service")
-        self.execute_other_action(VoteCreate, action_data)
-        # update results into option
-        self.execute_other_action(
-            OptionSetAutoFields,
-            [
-                {
-                    "id": _id,
-                    "yes": str(option["Y"]),
-                    "no": str(option["N"]),
-                    "abstain": str(option["A"]),
-                }
-                for _id, option in option_results.items()
-            ],
-        )
-        # set voted ids
-        voted_ids = results["user_ids"]
-        instance["voted_ids"] = voted_ids
-
-        # set votescast, votesvalid, votesinvalid
-        instance["votesvalid"] = str(votesvalid)
-        instance["votescast"] = str(Decimal("0.000000") + Decimal(len(voted_ids)))
-        instance["votesinvalid"] = "0.000000"
+        return votes, option_results, votesvalid
 
-        # set entitled users at stop.
-        instance["entitled_users_at_stop"] = self.get_entitled_users(
-            {**poll, **instance}
+    def create_votes(self, meeting_id: int, votes: List[Dict[str, Any]]) -> None:
+        """
+        Creates the votes in bulk. Since the votes are new, the reverse relations
+        only get ids added. These are collected per target and written as list
+        updates, so they do not have to be locked. The new ids are also recorded in
+        the additional models for the following actions of the request.
+        """
+        if not votes:
+            return
+        vote_collection = Collection("vote")
+        ids = self.datastore.reserve_ids(vote_collection, len(votes))
+        events: List[Event] = []
+        information: Dict[FullQualifiedId, List[str]] = {}
+        relation_ids: Dict[FullQualifiedId, Dict[str, List[int]]] = defaultdict(
+            lambda: defaultdict(list)
         )
+        meeting_fqid = FullQualifiedId(Collection("meeting"), meeting_id)
+        for id_, vote in zip(ids, votes):
+            vote["id"] = id_
+            vote["meeting_id"] = meeting_id
+            fqid = FullQualifiedId(vote_collection, id_)
+            events.append(Event(type=EventType.Create, fqid=fqid, fields=vote))
+            information[fqid] = ["Object created"]
+            self.datastore.update_additional_models(fqid, vote)
 
-    def get_entitled_users(self, poll: Dict[str, Any]) -> List[Dict[str, Any]]:
-        entitled_users = []
-        entitled_users_ids = set()
-        all_voted_users = poll.get("voted_ids", [])
-        meeting_id = poll["meeting_id"]
+            option_fqid = FullQualifiedId(Collection("option"), vote["option_id"])
+            relation_ids[option_fqid]["vote_ids"].append(id_)
+            relation_ids[meeting_fqid]["vote_ids"].append(id_)
+            if user_id := vote.get("user_id"):
+                user_fqid = FullQualifiedId(Collection("user"), user_id)
+                relation_ids[user_fqid][f"vote_${meeting_id}_ids"].append(id_)
+            if delegated_user_id := vote.get("delegated_user_id"):
+                user_fqid = FullQualifiedId(Collection("user"), delegated_user_id)
+                relation_ids[user_fqid][
+                    f"vote_delegated_vote_${meeting_id}_ids"
+                ].append(id_)
 
-        # get all users from the groups.
-        meeting = self.datastore.get(
-            FullQualifiedId(Collection("meeting"), meeting_id), ["group_ids"]
+        adds: Dict[FullQualifiedId, Dict[str, List[Union[int, str]]]] = {}
+        for fqid, field_ids in relation_ids.items():
+            add: Dict[str, List[Union[int, str]]] = {}
+            for field, field_ids_list in field_ids.items():
+                add[field] = cast(List[Union[int, str]], field_ids_list)
+                if fqid.collection.collection == "user":
+                    # add the meeting to the corresponding template field
+                    template_field = field.replace(f"${meeting_id}_", "$_")
+                    add[template_field] = [str(meeting_id)]
+            adds[fqid] = add
+            events.append(
+                Event(
+                    type=EventType.Update,
+                    fqid=fqid,
+                    list_fields={"add": add, "remove": {}},
+                )
+            )
+            information[fqid] = ["Object updated"]
+        self.add_to_additional_models(adds)
+        self.write_requests.append(
+            WriteRequest(
+                events=events,
+                information=information,
+                user_id=self.user_id,
+                locked_fields={},
+            )
         )
-        gmr = GetManyRequest(
-            Collection("group"), meeting.get("group_ids", []), ["user_ids"]
+
+    def add_to_additional_models(
+        self, adds: Dict[FullQualifiedId, Dict[str, List[Union[int, str]]]]
+    ) -> None:
+        """
+        Adds the ids of the list updates to the current values of the fields in the
+        additional models, so that later actions of the request see the new votes.
+        The current values are read unlocked with one request, since the list updates
+        do not depend on them.
+        """
+        requests: Dict[Collection, Tuple[List[int], Set[str]]] = {}
+        for fqid, add in adds.items():
+            ids, fields = requests.setdefault(fqid.collection, ([], set()))
+            ids.append(fqid.id)
+            fields.update(add)
+        self.datastore.get_many(
+            [
+                GetManyRequest(collection, ids, sorted(fields))
+                for collection, (ids, fields) in requests.items()
+            ],
+            lock_result=False,
         )
-        gm_result = self.datastore.get_many([gmr])
-        groups = gm_result.get(Collection("group"), {}).values()
-
-        for group in groups:
-            user_ids = group.get("user_ids", [])
-            if not user_ids:
-                continue
-            gmr = GetManyRequest(
-                Collection("user"),
-                list(user_ids),
-                [
-                    "id",
-                    "is_present_in_meeting_ids",
-                    f"vote_delegated_${meeting_id}_to_id",
-                ],
+        for fqid, add in adds.items():
+            model = self.datastore.fetch_model(fqid, list(add), lock_result=False)
+            self.datastore.update_additional_models(
+                fqid,
+                {
+                    field: (model.get(field) or [])
+                    + [id for id in new_ids if id not in (model.get(field) or [])]
+                    for field, new_ids in add.items()
+                },
             )
-            gm_result = self.datastore.get_many([gmr])
-            users = gm_result.get(Collection("user"), {}).values()
-            for user in users:
-                vote_delegated = {}
-                if user.get(f"vote_delegated_${meeting_id}_to_id"):
-                    vote_delegated = self.datastore.get(
-                        FullQualifiedId(
-                            Collection("user"),
-                            user[f"vote_delegated_${meeting_id}_to_id"],
-                        ),
-                        ["is_present_in_meeting_ids"],
-                    )
-
-                if user["id"] in entitled_users_ids:
-                    continue
-                elif poll["meeting_id"] in user.get(
-                    "is_present_in_meeting_ids", []
-                ) or (
-                    user.get(f"vote_delegated_${meeting_id}_to_id")
-                    and poll["meeting_id"]
-                    in vote_delegated.get("is_present_in_meeting_ids", [])
-                ):
-                    entitled_users_ids.add(user["id"])
-                    entitled_users.append(
-                        {
-                            "user_id": user["id"],
-                            "voted": user["id"] in all_voted_users,
-                            "vote_delegated_to_id": user.get(
-                                f"vote_delegated_${meeting_id}_to_id"
-                            ),
-                        }
-                    )
-
-        return entitled_users
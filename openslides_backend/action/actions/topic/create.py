@@ -1,4 +1,4 @@
-from typing import Any, Dict, Type
+from typing import Any, Dict, Optional, Type
 
 from ....models.models import Topic
 from ....permissions.permissions import Permissions
@@ -6,6 +6,7 @@ from ...action import Action
 from ...mixins.create_action_with_dependencies import CreateActionWithDependencies
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
+from ...util.typing import ActionData
 from ..agenda_item.agenda_creation import (
     CreateActionWithAgendaItemMixin,
     agenda_creation_properties,
@@ -44,3 +45,8 @@ class TopicCreate(
         the given action data or metting settings.
         """
         return True
+
+    def count_dependant_action_executions_agenda_item(
+        self, action_data: ActionData, CreateActionClass: Type[Action]
+    ) -> Optional[int]:
+        return len(list(action_data))
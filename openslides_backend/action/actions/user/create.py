@@ -2,14 +2,13 @@ from typing import Any, Dict
 
 from ....models.models import User
 from ....shared.exceptions import ActionException
-from ....shared.filters import FilterOperator
-from ....shared.patterns import Collection
 from ...generics.create import CreateAction
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
 from .create_update_permissions_mixin import CreateUpdatePermissionsMixin
 from .password_mixin import PasswordCreateMixin
 from .user_mixin import LimitOfUserMixin, UserMixin
+from .username_index import UsernameIndex
 
 
 @register_action("user.create")
@@ -74,27 +73,12 @@ class UserCreate(
         return super().update_instance(instance)
 
     def generate_username(self, instance: Dict[str, Any]) -> str:
-        count = 0
-
-        while True:
-            possible_space = (
-                " " if instance.get("first_name") and instance.get("last_name") else ""
-            )
-            new_username = (
-                instance.get("first_name", "")
-                + possible_space
-                + instance.get("last_name", "")
-            )
-            if count > 0:
-                new_username += f" {count}"
-
-            result = self.datastore.filter(
-                Collection("user"),
-                FilterOperator("username", "=", new_username),
-                ["id"],
-            )
-            if result:
-                count += 1
-            else:
-                break
-        return new_username
+        possible_space = (
+            " " if instance.get("first_name") and instance.get("last_name") else ""
+        )
+        base = (
+            instance.get("first_name", "")
+            + possible_space
+            + instance.get("last_name", "")
+        )
+        return UsernameIndex.get(self.datastore).generate(base, instance["id"])
@@ -9,7 +9,7 @@ from smtplib import (
 )
 from ssl import SSLCertVerificationError
 from time import time
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from fastjsonschema import JsonSchemaException
 
@@ -20,18 +20,40 @@ from ....permissions.permission_helper import (
     has_perm,
 )
 from ....permissions.permissions import Permissions
+from ....services.datastore.commands import GetManyRequest
 from ....shared.exceptions import DatastoreException, MissingPermission
 from ....shared.interfaces.write_request import WriteRequest
 from ....shared.patterns import Collection, FullQualifiedId
 from ....shared.schema import optional_id_schema
 from ...generics.update import UpdateAction
-from ...mixins.send_email_mixin import EmailMixin, EmailSettings
+from ...mixins.send_email_mixin import (
+    EmailMixin,
+    EmailSettings,
+    MailConnectionPool,
+    MailNotSent,
+)
 from ...util.default_schema import DefaultSchema
 from ...util.register import register_action
 from ...util.typing import ActionData, ActionResults
 from .helper import get_user_name
 
 ONE_ORGANIZATION = 1
+USER_FIELDS = [
+    "meeting_ids",
+    "email",
+    "username",
+    "last_name",
+    "first_name",
+    "title",
+    "default_password",
+]
+MAIL_DATA_FIELDS = [
+    "name",
+    "users_email_sender",
+    "users_email_replyto",
+    "users_email_subject",
+    "users_email_body",
+]
 
 
 @register_action("user.send_invitation_email")
@@ -58,10 +80,13 @@ class UserSendInvitationMail(EmailMixin, UpdateAction):
             self.results.append(result)
             return (None, self.results)
 
+        super().prefetch(action_data)
         try:
-            with EmailMixin.get_mail_connection() as mail_client:
+            with MailConnectionPool(self.logger) as mail_pool:
                 self.index = -1
-                self.mail_client = mail_client
+                instances = []
+                results = []
+                mails: Dict[int, Dict[str, Any]] = {}
                 for instance in action_data:
                     self.index += 1
                     result = self.get_initial_result_false(instance)
@@ -72,26 +97,20 @@ class UserSendInvitationMail(EmailMixin, UpdateAction):
                         self.check_permissions(instance)
                         instance = self.update_instance(instance)
                         result = instance.pop("result")
-                    except SMTPRecipientsRefused as e:
-                        result["message"] = f"SMTPRecipientsRefused: {str(e)}"
-                    except SMTPServerDisconnected as e:
-                        result[
-                            "message"
-                        ] = f"SMTPServerDisconnected: {str(e)} during transmission"
+                        if mail := instance.pop("mail", None):
+                            mails[self.index] = mail
                     except JsonSchemaException as e:
                         result["message"] = f"JsonSchema: {str(e)}"
                     except DatastoreException as e:
                         result["message"] = f"DatastoreException: {str(e)}"
                     except MissingPermission as e:
                         result["message"] = e.message
-                    except SMTPDataError as e:
-                        result["message"] = f"SMTPDataError: {str(e)}"
-
-                    if result["sent"]:
-                        write_request = self.create_write_requests(instance)
-                        self.write_requests.extend(write_request)
+                    instances.append(instance)
+                    results.append(result)
 
-                    self.results.append(result)
+                # deliver all emails in parallel and evaluate the outcomes in order
+                outcomes = mail_pool.send_all(list(mails.values()))
+                self.process_outcomes(instances, results, dict(zip(mails, outcomes)))
         except SMTPAuthenticationError as e:
             result = {"sent": False, "message": f"SMTPAuthenticationError: {str(e)}"}
             self.results.append(result)
@@ -117,6 +136,40 @@ class UserSendInvitationMail(EmailMixin, UpdateAction):
         final_write_request = self.process_write_requests()
         return (final_write_request, self.results)
 
+    def process_outcomes(
+        self,
+        instances: List[Dict[str, Any]],
+        results: List[Dict[str, Any]],
+        outcomes: Dict[int, Optional[Exception]],
+    ) -> None:
+        """
+        Completes the results with the outcomes of the sent emails. An error which
+        stopped the delivery is raised after all other results were added.
+        """
+        error: Optional[Exception] = None
+        for index, (instance, result) in enumerate(zip(instances, results)):
+            if index in outcomes:
+                outcome = outcomes[index]
+                if outcome is None:
+                    result["sent"] = True
+                    instance["last_email_send"] = round(time())
+                    self.write_requests.extend(self.create_write_requests(instance))
+                elif isinstance(outcome, SMTPRecipientsRefused):
+                    result["message"] = f"SMTPRecipientsRefused: {str(outcome)}"
+                elif isinstance(outcome, SMTPServerDisconnected):
+                    result[
+                        "message"
+                    ] = f"SMTPServerDisconnected: {str(outcome)} during transmission"
+                elif isinstance(outcome, SMTPDataError):
+                    result["message"] = f"SMTPDataError: {str(outcome)}"
+                else:
+                    if not error and not isinstance(outcome, MailNotSent):
+                        error = outcome
+                    continue
+            self.results.append(result)
+        if error:
+            raise error
+
     def update_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
         user_id = instance["id"]
         meeting_id = instance.get("meeting_id")
@@ -125,16 +178,7 @@ class UserSendInvitationMail(EmailMixin, UpdateAction):
         instance["result"] = result
 
         user = self.datastore.get(
-            FullQualifiedId(Collection("user"), user_id),
-            [
-                "meeting_ids",
-                "email",
-                "username",
-                "last_name",
-                "first_name",
-                "title",
-                "default_password",
-            ],
+            FullQualifiedId(Collection("user"), user_id), USER_FIELDS
         )
         if not (to_email := user.get("email")):
             result["message"] = f"User/{user_id} has no email-address."
@@ -198,29 +242,51 @@ class UserSendInvitationMail(EmailMixin, UpdateAction):
 
         body_format = format_dict(None, body_dict)
 
-        self.send_email(
-            self.mail_client,
-            from_email,
-            to_email,
-            mail_data.get("users_email_subject", "").format_map(subject_format),
-            mail_data.get("users_email_body", "").format_map(body_format),
-            reply_to=reply_to,
-            html=False,
-        )
-        result["sent"] = True
-        instance["last_email_send"] = round(time())
+        # the email is sent later on together with all others
+        instance["mail"] = {
+            "from_": from_email,
+            "to": to_email,
+            "subject": mail_data.get("users_email_subject", "").format_map(
+                subject_format
+            ),
+            "content": mail_data.get("users_email_body", "").format_map(body_format),
+            "reply_to": reply_to,
+            "html": False,
+        }
         return super().update_instance(instance)
 
+    def get_prefetch_requests(self, action_data: ActionData) -> List[GetManyRequest]:
+        """
+        Adds all users and all meetings or the organization needed for the emails, so
+        that the single reads in update_instance are served from the cache.
+        """
+        get_many_requests = super().get_prefetch_requests(action_data)
+        if user_ids := self.get_prefetch_ids(action_data, "id"):
+            get_many_requests.append(
+                GetManyRequest(Collection("user"), user_ids, USER_FIELDS)
+            )
+        if meeting_ids := self.get_prefetch_ids(action_data, "meeting_id"):
+            get_many_requests.append(
+                GetManyRequest(
+                    Collection("meeting"),
+                    meeting_ids,
+                    MAIL_DATA_FIELDS + ["users_pdf_url"],
+                )
+            )
+        if any(not instance.get("meeting_id") for instance in action_data):
+            get_many_requests.append(
+                GetManyRequest(
+                    Collection("organization"),
+                    [ONE_ORGANIZATION],
+                    MAIL_DATA_FIELDS + ["url"],
+                )
+            )
+        return get_many_requests
+
     def get_data_from_meeting_or_organization(
         self, meeting_id: Optional[int]
     ) -> Dict[str, Any]:
-        fields = [
-            "name",
-            "users_email_sender",
-            "users_email_replyto",
-            "users_email_subject",
-            "users_email_body",
-        ]
+        fields = list(MAIL_DATA_FIELDS)
         if not meeting_id:
             collection = Collection("organization")
             id_ = ONE_ORGANIZATION
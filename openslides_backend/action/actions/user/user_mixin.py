@@ -9,6 +9,7 @@ from ....shared.exceptions import ActionException
 from ....shared.filters import FilterOperator
 from ....shared.patterns import Collection, FullQualifiedId
 from ...util.assert_belongs_to_meeting import assert_belongs_to_meeting
+from .username_index import UsernameIndex
 
 ONE_ORGANIZATION = 1
 
@@ -33,15 +34,12 @@ class UserMixin(CheckForArchivedMeetingMixin):
         instance = super().update_instance(instance)
         user_fqid = FullQualifiedId(Collection("user"), instance["id"])
         if "username" in instance:
-            result = self.datastore.filter(
-                Collection("user"),
-                FilterOperator("username", "=", instance["username"]),
-                ["id"],
-            )
-            if result and instance["id"] not in result.keys():
+            username_index = UsernameIndex.get(self.datastore)
+            if not username_index.is_available(instance["username"], instance["id"]):
                 raise ActionException(
                     f"A user with the username {instance['username']} already exists."
                 )
+            username_index.reserve(instance["username"], instance["id"])
         self.check_existence_of_to_and_from_users(instance)
         self.check_meeting_and_users(instance, user_fqid)
         if "vote_delegated_$_to_id" in instance:
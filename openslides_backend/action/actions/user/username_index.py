@@ -0,0 +1,136 @@
+from typing import Dict, Optional, Set
+
+from ....services.datastore.interface import DatastoreService
+from ....shared.filters import And, FilterOperator
+from ....shared.patterns import Collection, CollectionField
+
+USERNAME_INDEX_KEY = "username_index"
+
+# number of usernames which are checked with a filter request each, before all
+# usernames are loaded at once
+MAX_FILTER_LOOKUPS = 10
+
+
+class UsernameIndex:
+    """
+    Checks and generates usernames for all actions of a request. It is shared via the
+    request cache of the datastore. Usernames which are given to users during the
+    request are reserved in the index, so that they are not given twice, even if they
+    are not written yet.
+
+    Single usernames are checked with a filter request each, like before. Only for
+    batches, i.e. when MAX_FILTER_LOOKUPS is exceeded or load is called explicitly,
+    all usernames are loaded once into memory. Each username checked in memory is
+    locked with a filter on the username, as if it was read with datastore.filter,
+    so concurrent requests are still detected.
+    """
+
+    # maps the usernames reserved during the request to the ids of their users
+    usernames: Dict[str, int]
+    # usernames reserved for users which have no id yet
+    reserved: Set[str]
+    # maps the base of generated usernames to the next suffix to try
+    next_suffix: Dict[str, int]
+    # maps all usernames in the datastore to the ids of their users, once loaded
+    loaded_usernames: Optional[Dict[str, int]]
+
+    def __init__(self, datastore: DatastoreService) -> None:
+        self.datastore = datastore
+        self.usernames = {}
+        self.reserved = set()
+        self.next_suffix = {}
+        self.loaded_usernames = None
+        self.position = 0
+        self.filter_lookups = 0
+
+    @classmethod
+    def get(cls, datastore: DatastoreService) -> "UsernameIndex":
+        """
+        Returns the index of the current request.
+        """
+        if USERNAME_INDEX_KEY not in datastore.request_cache:
+            datastore.request_cache[USERNAME_INDEX_KEY] = cls(datastore)
+        return datastore.request_cache[USERNAME_INDEX_KEY]
+
+    def load(self) -> None:
+        """
+        Loads all usernames, so that the following checks are done in memory.
+        """
+        if self.loaded_usernames is not None:
+            return
+        users = self.datastore.get_all(
+            Collection("user"), ["username", "meta_position"], lock_result=False
+        )
+        self.loaded_usernames = {
+            user["username"]: id_ for id_, user in users.items() if user.get("username")
+        }
+        # All users have a position less than or equal to this one, so no username
+        # was changed between this position and the read. It is used as position of
+        # the locks.
+        self.position = max(
+            (user["meta_position"] for user in users.values()), default=0
+        )
+
+    def is_available(self, username: str, user_id: Optional[int] = None) -> bool:
+        """
+        Checks whether the username is not used by another user than the given one.
+        """
+        if username in self.reserved:
+            return False
+        owner_id = self.usernames.get(username)
+        if owner_id is not None and owner_id != user_id:
+            return False
+
+        if self.loaded_usernames is None:
+            if self.filter_lookups < MAX_FILTER_LOOKUPS:
+                self.filter_lookups += 1
+                result = self.datastore.filter(
+                    Collection("user"),
+                    FilterOperator("username", "=", username),
+                    ["id"],
+                )
+                return not result or user_id in result
+            self.load()
+        assert self.loaded_usernames is not None
+        self.lock(username)
+        owner_id = self.loaded_usernames.get(username)
+        return owner_id is None or owner_id == user_id
+
+    def reserve(self, username: str, user_id: Optional[int] = None) -> None:
+        """
+        Reserves the username for the user with the given id. Users which have no id
+        yet are not given.
+        """
+        if user_id is None:
+            self.reserved.add(username)
+        else:
+            self.usernames[username] = user_id
+
+    def generate(self, base: str, user_id: Optional[int] = None) -> str:
+        """
+        Returns the base or, if it is taken, the base with the first free numeric
+        suffix, e.g. "Max Mustermann 7". The suffixes already tried for a base are
+        remembered, so that generating many usernames with the same base does not
+        start from the beginning each time. The username is reserved for the given
+        user.
+        """
+        suffix = self.next_suffix.get(base, 0)
+        while True:
+            username = f"{base} {suffix}" if suffix else base
+            suffix += 1
+            if self.is_available(username):
+                self.next_suffix[base] = suffix
+                self.reserve(username, user_id)
+                return username
+
+    def lock(self, username: str) -> None:
+        self.datastore.update_locked_fields(
+            CollectionField(Collection("user"), "username"),
+            {
+                "position": self.position,
+                "filter": And(
+                    FilterOperator("username", "=", username),
+                    FilterOperator("meta_deleted", "=", False),
+                ),
+            },
+        )
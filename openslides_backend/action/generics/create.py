@@ -34,11 +34,8 @@ class CreateAction(Action):
         return instance
 
     def set_defaults(self, instance: Dict[str, Any]) -> Dict[str, Any]:
-        for field in self.model.get_fields():
-            if (
-                field.own_field_name not in instance.keys()
-                and field.default is not None
-            ):
+        for field in self.model.fields_with_default:
+            if field.own_field_name not in instance:
                 instance[field.own_field_name] = field.default
         return instance
 
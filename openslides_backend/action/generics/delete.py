@@ -8,6 +8,7 @@ from ...shared.patterns import Collection, FullQualifiedId, transform_to_fqids
 from ...shared.typing import DeletedModel
 from ..action import Action
 from ..util.actions_map import actions_map
+from ..util.cascade_prefetcher import CascadePrefetcher
 from ..util.typing import ActionData
 
 
@@ -25,8 +26,13 @@ class DeleteAction(Action):
         # Update instance (by default this does nothing)
         instance = self.update_instance(instance)
 
-        # Fetch db instance with all relevant fields
+        # Prefetch the whole cascade once for the model it starts at, so that the
+        # delete actions below read their models from the cache.
         this_fqid = FullQualifiedId(self.model.collection, instance["id"])
+        if not CascadePrefetcher.is_prefetched(self.datastore, this_fqid):
+            CascadePrefetcher(self.datastore).prefetch_cascade(this_fqid)
+
+        # Fetch db instance with all relevant fields
         relevant_fields = [
             field.get_own_field_name()
             for field in self.model.get_relation_fields()
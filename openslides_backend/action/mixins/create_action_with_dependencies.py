@@ -1,7 +1,10 @@
-from typing import Any, Dict, List, Type
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Type
 
+from ...shared.patterns import Collection
 from ..action import Action
 from ..generics.create import CreateAction
+from ..util.typing import ActionData
 
 
 class CreateActionWithDependencies(CreateAction):
@@ -14,18 +17,37 @@ class CreateActionWithDependencies(CreateAction):
     A list of actions which should be executed together with this create action.
     """
 
+    def prepare_action_data(self, action_data: ActionData) -> ActionData:
+        action_data = super().prepare_action_data(action_data)
+        for collection, amount in self.get_dependent_id_amounts(action_data).items():
+            if amount:
+                self.datastore.reserve_ids_in_advance(collection, amount)
+        return action_data
+
+    def get_dependent_id_amounts(
+        self, action_data: ActionData
+    ) -> Dict[Collection, int]:
+        """
+        Returns the amount of ids per collection which the dependent create actions
+        will need for all instances, so that they can be reserved with one request
+        per collection. Dependencies which cannot be counted in advance are skipped,
+        they reserve their ids themselves.
+        """
+        amounts: Dict[Collection, int] = defaultdict(int)
+        for ActionClass in self.dependencies:
+            if not issubclass(ActionClass, CreateAction):
+                continue
+            count_method = self.get_count_method(ActionClass)
+            amount = count_method(action_data, ActionClass)
+            if amount is not None:
+                amounts[ActionClass.model.collection] += amount
+        return amounts
+
     def base_update_instance(self, instance: Dict[str, Any]) -> Dict[str, Any]:
         instance = super().base_update_instance(instance)
         self.apply_instance(instance)
         for ActionClass in self.dependencies:
-            special_check_method_name = "check_dependant_action_execution_" + str(
-                ActionClass.model.collection
-            )
-            check_method = getattr(
-                self,
-                special_check_method_name,
-                self.check_dependant_action_execution,
-            )
+            check_method = self.get_check_method(ActionClass)
             if not check_method(instance, ActionClass):
                 continue
             special_action_data_method_name = "get_dependent_action_data_" + str(
@@ -38,6 +60,43 @@ class CreateActionWithDependencies(CreateAction):
             self.execute_other_action(ActionClass, action_data)
         return instance
 
+    def get_check_method(
+        self, ActionClass: Type[Action]
+    ) -> Callable[[Dict[str, Any], Type[Action]], bool]:
+        special_check_method_name = "check_dependant_action_execution_" + str(
+            ActionClass.model.collection
+        )
+        return getattr(
+            self, special_check_method_name, self.check_dependant_action_execution
+        )
+
+    def get_count_method(
+        self, ActionClass: Type[Action]
+    ) -> Callable[[ActionData, Type[Action]], Optional[int]]:
+        special_count_method_name = "count_dependant_action_executions_" + str(
+            ActionClass.model.collection
+        )
+        return getattr(
+            self, special_count_method_name, self.count_dependant_action_executions
+        )
+
+    def count_dependant_action_executions(
+        self, action_data: ActionData, CreateActionClass: Type[Action]
+    ) -> Optional[int]:
+        """
+        Returns how often the dependency will be executed for the action data or None
+        if this is not known in advance. Default is once per instance if the default
+        check is used and None otherwise. Override in subclass together with a
+        special check method, using only the action data.
+        """
+        check_method = self.get_check_method(CreateActionClass)
+        if (
+            getattr(check_method, "__func__", None)
+            is not CreateActionWithDependencies.check_dependant_action_execution
+        ):
+            return None
+        return len(list(action_data))
+
     def check_dependant_action_execution(
         self, instance: Dict[str, Any], CreateActionClass: Type[Action]
     ) -> bool:
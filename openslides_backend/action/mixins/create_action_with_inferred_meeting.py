@@ -1,9 +1,11 @@
-from typing import Any, Dict, Type
+from typing import Any, Dict, List, Type
 
 from ...models.fields import BaseGenericRelationField, BaseRelationField
+from ...services.datastore.commands import GetManyRequest
 from ...shared.exceptions import ActionException
 from ...shared.patterns import FullQualifiedId, to_fqid
 from ..generics.create import CreateAction
+from ..util.typing import ActionData
 
 
 class CreateActionWithInferredMeetingMixin(CreateAction):
@@ -20,6 +22,20 @@ class CreateActionWithInferredMeetingMixin(CreateAction):
         instance["meeting_id"] = self.get_meeting_id(instance)
         return instance
 
+    def get_prefetch_requests(self, action_data: ActionData) -> List[GetManyRequest]:
+        requests = super().get_prefetch_requests(action_data)
+        field = self.model.get_field(self.relation_field_for_meeting)
+        if isinstance(field, BaseRelationField) and not isinstance(
+            field, BaseGenericRelationField
+        ):
+            if ids := self.get_prefetch_ids(
+                action_data, self.relation_field_for_meeting
+            ):
+                requests.append(
+                    GetManyRequest(field.get_target_collection(), ids, ["meeting_id"])
+                )
+        return requests
+
     def get_meeting_id(self, instance: Dict[str, Any]) -> int:
         field = self.model.get_field(self.relation_field_for_meeting)
         assert isinstance(field, BaseRelationField)
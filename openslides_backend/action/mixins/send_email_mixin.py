@@ -7,7 +7,11 @@ from datetime import datetime
 from email.headerregistry import Address
 from email.message import EmailMessage
 from email.utils import format_datetime, make_msgid
-from typing import Any, Dict, Generator, List, Optional, Tuple, Union
+from queue import Empty, SimpleQueue
+from threading import Event, Thread
+from time import monotonic, sleep
+from types import TracebackType
+from typing import Any, Dict, Generator, List, Optional, Tuple, Type, Union
 
 from lxml import html as lxml_html  # type: ignore
 from lxml.html.clean import clean_html  # type: ignore
@@ -16,6 +20,7 @@ from ...shared.env import is_truthy
 from ...shared.exceptions import ActionException
 
 SendErrors = Dict[str, Tuple[int, bytes]]
+MailConnection = Union[smtplib.SMTP, smtplib.SMTP_SSL]
 
 
 class ConnectionSecurity:
@@ -45,6 +50,8 @@ class EmailSettings:
         os.environ.get("EMAIL_ACCEPT_SELF_SIGNED_CERTIFICATE", "false")
     )
     default_from_email = os.environ.get("DEFAULT_FROM_EMAIL", "noreply@example.com")
+    pool_size: int = int(os.environ.get("EMAIL_POOL_SIZE", "4"))
+    rate_limit: float = float(os.environ.get("EMAIL_RATE_LIMIT", "0"))
 
     @classmethod
     def check_settings(cls) -> None:
@@ -52,6 +59,10 @@ class EmailSettings:
             raise ActionException(
                 'Email-configuration: Choose one of "NONE", "STARTTLS" or "SSL/TLS" for EMAIL_CONNECTION_SECURITY environment variable'
             )
+        if cls.pool_size < 1:
+            raise ActionException(
+                "Email-configuration: EMAIL_POOL_SIZE must be at least 1"
+            )
 
 
 EmailSettings.check_settings()
@@ -185,3 +196,111 @@ class EmailMixin:
             logger.error(f"SMTPDataError: {str(e)}")
             return False, {}
         return True, {}
+
+
+# Errors which only concern the recipient of a single email. All other errors stop
+# the delivery of the remaining emails.
+RECIPIENT_ERRORS = (
+    smtplib.SMTPRecipientsRefused,
+    smtplib.SMTPServerDisconnected,
+    smtplib.SMTPDataError,
+)
+
+
+class MailNotSent(Exception):
+    """
+    Outcome of an email which was not sent since the delivery was stopped before.
+    """
+
+
+class MailConnectionPool:
+    """
+    Delivers emails in parallel over a bounded number of SMTP connections.
+
+    The first connection is opened when entering the context, so that errors of the
+    connection or the authentication are raised there. Further connections are
+    opened on demand by the delivery threads, up to EmailSettings.pool_size. Each
+    connection sends at most EmailSettings.rate_limit emails per second, if it is
+    set.
+    """
+
+    connection: MailConnection
+
+    def __init__(
+        self,
+        logger: Any,
+        size: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+    ) -> None:
+        self.logger = logger
+        self.size = size or EmailSettings.pool_size
+        self.rate_limit = EmailSettings.rate_limit if rate_limit is None else rate_limit
+
+    def __enter__(self) -> "MailConnectionPool":
+        self.connection_context = EmailMixin.get_mail_connection()
+        self.connection = self.connection_context.__enter__()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        exc_traceback: Optional[TracebackType],
+    ) -> None:
+        self.connection_context.__exit__(exc_type, exc_value, exc_traceback)
+
+    def send_all(self, mails: List[Dict[str, Any]]) -> List[Optional[Exception]]:
+        """
+        Sends all given emails. Each email is given as the keyword arguments of
+        EmailMixin.send_email without the client. Returns the outcome for each email
+        in the same order: None if it was sent, else the raised exception. If an
+        error occured which is not a recipient error, no further emails are sent and
+        their outcome is a MailNotSent exception.
+        """
+        outcomes: List[Optional[Exception]] = [MailNotSent()] * len(mails)
+        jobs: SimpleQueue[int] = SimpleQueue()
+        for index in range(len(mails)):
+            jobs.put(index)
+        stop = Event()
+
+        def deliver(connection: MailConnection) -> None:
+            last_sent = 0.0
+            while not stop.is_set():
+                try:
+                    index = jobs.get_nowait()
+                except Empty:
+                    return
+                if self.rate_limit:
+                    sleep(max(0.0, last_sent + 1 / self.rate_limit - monotonic()))
+                    last_sent = monotonic()
+                try:
+                    EmailMixin.send_email(connection, **mails[index])
+                    outcomes[index] = None
+                except RECIPIENT_ERRORS as e:
+                    outcomes[index] = e
+                except Exception as e:
+                    outcomes[index] = e
+                    stop.set()
+
+        def deliver_with_new_connection() -> None:
+            if stop.is_set() or jobs.empty():
+                return
+            try:
+                with EmailMixin.get_mail_connection() as connection:
+                    deliver(connection)
+            except Exception as e:
+                # the emails are delivered by the other connections
+                self.logger.warning(
+                    f"Could not open an additional mail connection: {e}"
+                )
+
+        threads = [
+            Thread(target=deliver_with_new_connection)
+            for _ in range(min(self.size, len(mails)) - 1)
+        ]
+        for thread in threads:
+            thread.start()
+        deliver(self.connection)
+        for thread in threads:
+            thread.join()
+        return outcomes
@@ -1,4 +1,4 @@
-from typing import Any, Dict, TypedDict
+from typing import Any, Dict, List, TypedDict
 
 from ...models.fields import Field
 from ...services.datastore.interface import DatastoreService
@@ -22,3 +22,9 @@ class CalculatedFieldHandler:
         self, field: Field, field_name: str, instance: Dict[str, Any], action: str
     ) -> RelationUpdates:
         pass
+
+    def prefetch(self, calls: List[CalculatedFieldHandlerCall]) -> None:
+        """
+        Called once with all calls of this handler before they are processed. Override
+        to load the needed models for all calls at once. Nothing should be locked here.
+        """
@@ -1,8 +1,8 @@
-from collections import defaultdict
-from typing import Dict, List, Type
+from typing import Dict, List, Tuple, Type
 
 from ...models.fields import Field
 from ...models.models import Group, User
+from ...shared.patterns import Collection
 from .calculated_field_handler import CalculatedFieldHandler
 from .meeting_user_ids_handler import MeetingUserIdsHandler
 from .user_committee_calculate_handler import UserCommitteeCalculateHandler
@@ -15,15 +15,25 @@ handler_to_field_map: Dict[Type[CalculatedFieldHandler], List[Field]] = {
     UserMeetingIdsHandler: [User.group__ids],
     UserCommitteeCalculateHandler: [User.group__ids, User.committee__management_level],
 }
+# This maps the collection and the (template) field name of all fields to their
+# handlers. It is filled once from the map above.
 calculated_field_handlers_map: Dict[
-    Field, List[Type[CalculatedFieldHandler]]
-] = defaultdict(list)
+    Tuple[Collection, str], List[Type[CalculatedFieldHandler]]
+] = {}
 
 
 def prepare_calculated_field_handlers_map() -> None:
     for handler_class, fields in handler_to_field_map.items():
         for field in fields:
-            calculated_field_handlers_map[field].append(handler_class)
+            calculated_field_handlers_map.setdefault(
+                (field.own_collection, field.own_field_name), []
+            ).append(handler_class)
+
+
+def get_calculated_field_handlers(field: Field) -> List[Type[CalculatedFieldHandler]]:
+    return calculated_field_handlers_map.get(
+        (field.own_collection, field.own_field_name), []
+    )
 
 
 prepare_calculated_field_handlers_map()
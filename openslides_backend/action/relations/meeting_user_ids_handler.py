@@ -1,10 +1,11 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from openslides_backend.services.datastore.interface import InstanceAdditionalBehaviour
 
 from ...models.fields import Field
+from ...services.datastore.commands import GetManyRequest
 from ...shared.patterns import Collection, FullQualifiedField, FullQualifiedId
-from .calculated_field_handler import CalculatedFieldHandler
+from .calculated_field_handler import CalculatedFieldHandler, CalculatedFieldHandlerCall
 from .typing import ListUpdateElement, RelationUpdates
 
 
@@ -15,6 +16,18 @@ class MeetingUserIdsHandler(CalculatedFieldHandler):
     This handles all necessary field updates simultaniously.
     """
 
+    def prefetch(self, calls: List[CalculatedFieldHandlerCall]) -> None:
+        requests: Dict[Collection, GetManyRequest] = {}
+        for call in calls:
+            collection = call["field"].own_collection
+            request = requests.setdefault(
+                collection, GetManyRequest(collection, [], ["meeting_id"])
+            )
+            request.ids.append(call["instance"]["id"])
+            assert request.mapped_fields is not None
+            request.mapped_fields.add(call["field_name"])
+        self.datastore.get_many(list(requests.values()), lock_result=False)
+
     def process_field(
         self, field: Field, field_name: str, instance: Dict[str, Any], action: str
     ) -> RelationUpdates:
@@ -38,14 +51,29 @@ class MeetingUserIdsHandler(CalculatedFieldHandler):
         assert isinstance(meeting_id, int)
 
         # check if removed_ids should actually be removed
-        # cast to list to be able to alter it while iterating
-        for id in list(removed_ids):
-            user_fqid = FullQualifiedId(Collection("user"), id)
-            if not self.datastore.is_deleted(user_fqid):
-                group_field = f"group_${meeting_id}_ids"
-                user = self.datastore.fetch_model(user_fqid, [group_field])
-                if user.get(group_field):
-                    removed_ids.remove(id)
+        group_field = f"group_${meeting_id}_ids"
+        user_fqids = [
+            user_fqid
+            for id in removed_ids
+            if not self.datastore.is_deleted(
+                user_fqid := FullQualifiedId(Collection("user"), id)
+            )
+        ]
+        # read all users which were not changed during this request at once
+        if user_ids := [
+            user_fqid.id
+            for user_fqid in user_fqids
+            if group_field
+            not in self.datastore.additional_relation_models.get(user_fqid, {})
+        ]:
+            self.datastore.get_many(
+                [GetManyRequest(Collection("user"), user_ids, [group_field])],
+                lock_result=False,
+            )
+        for user_fqid in user_fqids:
+            user = self.datastore.fetch_model(user_fqid, [group_field])
+            if user.get(group_field):
+                removed_ids.remove(user_fqid.id)
 
         if not added_ids and not removed_ids:
             return {}
@@ -1,7 +1,9 @@
-from typing import Any, Dict, List, cast
+from collections import defaultdict
+from typing import Any, Dict, List, Set, Type, cast
 
-from ...models.base import Model, model_registry
-from ...models.fields import BaseRelationField, BaseTemplateField, Field
+from ...models.base import Model, lookup_field, model_registry
+from ...models.fields import BaseRelationField, BaseTemplateField
+from ...services.datastore.commands import GetManyRequest
 from ...services.datastore.interface import DatastoreService
 from ...shared.exceptions import DatastoreException
 from ...shared.patterns import (
@@ -11,8 +13,8 @@ from ...shared.patterns import (
     transform_to_fqids,
 )
 from ..util.assert_belongs_to_meeting import assert_belongs_to_meeting
-from .calculated_field_handler import CalculatedFieldHandlerCall
-from .calculated_field_handlers_map import calculated_field_handlers_map
+from .calculated_field_handler import CalculatedFieldHandler, CalculatedFieldHandlerCall
+from .calculated_field_handlers_map import get_calculated_field_handlers
 from .single_relation_handler import SingleRelationHandler
 from .typing import (
     FieldUpdateElement,
@@ -44,20 +46,12 @@ class RelationManager:
 
         relations: RelationUpdates = {}
         calculated_field_handler_calls: List[CalculatedFieldHandlerCall] = []
+        handlers: Dict[str, SingleRelationHandler] = {}
         for field_name in instance:
             if not model.has_field(field_name):
                 continue
             field = model.get_field(field_name)
 
-            calculated_field_handler_calls.append(
-                {
-                    "field": field,
-                    "field_name": field_name,
-                    "instance": instance,
-                    "action": action,
-                }
-            )
-
             # only relations are handled here
             if not isinstance(field, BaseRelationField):
                 continue
@@ -67,20 +61,43 @@ class RelationManager:
             ):
                 continue
 
-            handler = SingleRelationHandler(
+            handlers[field_name] = SingleRelationHandler(
                 self.datastore,
                 field,
                 field_name,
                 instance,
             )
+        self.prefetch_relations(model, instance, handlers)
+
+        for field_name in instance:
+            if not model.has_field(field_name):
+                continue
+            field = model.get_field(field_name)
+
+            if get_calculated_field_handlers(field):
+                calculated_field_handler_calls.append(
+                    {
+                        "field": field,
+                        "field_name": field_name,
+                        "instance": instance,
+                        "action": action,
+                    }
+                )
+
+            if not (handler := handlers.get(field_name)):
+                continue
             result = handler.perform()
             for fqfield, relations_element in result.items():
                 self.process_relation_element(fqfield, relations_element, relations)
 
                 # call calculated field handlers again on updated related field
                 related_field_name = fqfield.field
-                related_model = model_registry[fqfield.collection]()
-                related_field = related_model.get_field(related_field_name)
+                related_field = lookup_field(
+                    model_registry[fqfield.collection], related_field_name
+                )
+                assert related_field
+                if not get_calculated_field_handlers(related_field):
+                    continue
                 related_instance = {
                     "id": fqfield.id,
                     related_field_name: relations_element["value"],
@@ -95,12 +112,68 @@ class RelationManager:
                 )
 
         self.apply_relation_updates(relations)
-
-        for call in calculated_field_handler_calls:
-            self.call_calculated_field_handlers(relations, **call)
+        self.call_calculated_field_handlers(relations, calculated_field_handler_calls)
 
         return relations
 
+    def prefetch_relations(
+        self,
+        model: Model,
+        instance: Dict[str, Any],
+        handlers: Dict[str, SingleRelationHandler],
+    ) -> None:
+        """
+        Loads the current values of all relation fields of the instance and afterwards
+        the reverse fields of all models whose relation to the instance changes, with
+        one get_many request each. This way, the reads of the handlers are served from
+        the model cache of the datastore. Nothing is locked here, locking is done by
+        the handlers themselves.
+        """
+        if not handlers:
+            return
+        db_instance = (
+            self.datastore.get_many(
+                [GetManyRequest(model.collection, [instance["id"]], list(handlers))],
+                lock_result=False,
+            )
+            .get(model.collection, {})
+            .get(instance["id"])
+        )
+
+        related_ids: Dict[Collection, Set[int]] = defaultdict(set)
+        related_fields: Dict[Collection, Set[str]] = defaultdict(set)
+        for field_name, handler in handlers.items():
+            handler.db_instance_exists = db_instance is not None
+            target_collection = handler.field.get_target_collection()
+            current_fqids = set(
+                transform_to_fqids(
+                    (db_instance or {}).get(field_name), target_collection
+                )
+            )
+            new_fqids = set(
+                transform_to_fqids(instance.get(field_name), target_collection)
+            )
+            changed_fqids = (new_fqids - current_fqids) | {
+                fqid
+                for fqid in current_fqids - new_fqids
+                if not self.datastore.is_deleted(fqid)
+            }
+            for collection, fqids in handler.partition_by_collection(
+                changed_fqids
+            ).items():
+                if collection not in handler.field.to:
+                    continue
+                related_ids[collection].update(fqid.id for fqid in fqids)
+                related_fields[collection].add(handler.get_related_name(collection))
+        if related_ids:
+            self.datastore.get_many(
+                [
+                    GetManyRequest(collection, sorted(ids), related_fields[collection])
+                    for collection, ids in related_ids.items()
+                ],
+                lock_result=False,
+            )
+
     def process_template_fields(self, model: Model, instance: Dict[str, Any]) -> None:
         """
         Processes all template fields in the given instance. They must be given as
@@ -204,20 +277,29 @@ class RelationManager:
     def call_calculated_field_handlers(
         self,
         relations: RelationUpdates,
-        field: Field,
-        field_name: str,
-        instance: Dict[str, Any],
-        action: str,
+        calls: List[CalculatedFieldHandlerCall],
     ) -> None:
         """
-        Calls all registered CalculatedFieldHandlers for the current field and adds the
-        resulting relation updates to the main map.
+        Calls all registered CalculatedFieldHandlers for the fields of the given calls
+        and adds the resulting relation updates to the main map. Each handler is
+        instantiated once and gets all of its calls to prefetch beforehand.
         """
-        for calculated_field_handler_class in calculated_field_handlers_map[field]:
-            handler_instance = calculated_field_handler_class(self.datastore)
-            result = handler_instance.process_field(field, field_name, instance, action)
-            for fqfield, relations_element in result.items():
-                self.process_relation_element(fqfield, relations_element, relations)
+        handler_calls: Dict[
+            Type[CalculatedFieldHandler], List[CalculatedFieldHandlerCall]
+        ] = defaultdict(list)
+        for call in calls:
+            for handler_class in get_calculated_field_handlers(call["field"]):
+                handler_calls[handler_class].append(call)
+        handlers: Dict[Type[CalculatedFieldHandler], CalculatedFieldHandler] = {}
+        for handler_class, calls_of_handler in handler_calls.items():
+            handlers[handler_class] = handler_class(self.datastore)
+            handlers[handler_class].prefetch(calls_of_handler)
+
+        for call in calls:
+            for handler_class in get_calculated_field_handlers(call["field"]):
+                result = handlers[handler_class].process_field(**call)
+                for fqfield, relations_element in result.items():
+                    self.process_relation_element(fqfield, relations_element, relations)
 
     def process_relation_element(
         self,
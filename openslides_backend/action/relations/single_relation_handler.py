@@ -58,6 +58,8 @@ class SingleRelationHandler:
 
         self.type = self.get_field_type()
         self.chained_fields: List[Dict[str, Any]] = []
+        # set to False if it is known that the instance does not exist in the datastore
+        self.db_instance_exists = True
 
     def get_reverse_field(self, collection: Collection) -> BaseRelationField:
         """
@@ -252,11 +254,15 @@ class SingleRelationHandler:
         remove: Set[FullQualifiedId]
         # We have to compare with the current datastore state.
         # Retrieve current object from datastore
-        current_obj = self.datastore.fetch_model(
-            FullQualifiedId(self.model.collection, self.id),
-            [self.field_name],
-            db_additional_relevance=InstanceAdditionalBehaviour.ONLY_DBINST,
-            exception=False,
+        current_obj = (
+            self.datastore.fetch_model(
+                FullQualifiedId(self.model.collection, self.id),
+                [self.field_name],
+                db_additional_relevance=InstanceAdditionalBehaviour.ONLY_DBINST,
+                exception=False,
+            )
+            if self.db_instance_exists
+            else {}
         )
 
         # Get current ids from relation field
@@ -5,7 +5,7 @@ from openslides_backend.services.datastore.interface import InstanceAdditionalBe
 
 from ...models.fields import Field
 from ...shared.patterns import Collection, FullQualifiedField, FullQualifiedId
-from .calculated_field_handler import CalculatedFieldHandler
+from .calculated_field_handler import CalculatedFieldHandler, CalculatedFieldHandlerCall
 from .typing import ListUpdateElement, RelationUpdates
 
 
@@ -20,6 +20,27 @@ class UserCommitteeCalculateHandler(CalculatedFieldHandler):
     to user.change-actions.
     """
 
+    def prefetch(self, calls: List[CalculatedFieldHandlerCall]) -> None:
+        if user_ids := [
+            call["instance"]["id"]
+            for call in calls
+            if call["field_name"] in ["group_$_ids", "committee_$_management_level"]
+        ]:
+            self.datastore.get_many(
+                [
+                    GetManyRequest(
+                        Collection("user"),
+                        user_ids,
+                        [
+                            "committee_ids",
+                            "group_$_ids",
+                            "committee_$_management_level",
+                        ],
+                    )
+                ],
+                lock_result=False,
+            )
+
     def process_field(
         self, field: Field, field_name: str, instance: Dict[str, Any], action: str
     ) -> RelationUpdates:
@@ -1,10 +1,11 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from openslides_backend.services.datastore.interface import InstanceAdditionalBehaviour
 
 from ...models.fields import Field
+from ...services.datastore.commands import GetManyRequest
 from ...shared.patterns import Collection, FullQualifiedField, FullQualifiedId
-from .calculated_field_handler import CalculatedFieldHandler
+from .calculated_field_handler import CalculatedFieldHandler, CalculatedFieldHandlerCall
 from .typing import ListUpdateElement, RelationUpdates
 
 
@@ -13,6 +14,18 @@ class UserMeetingIdsHandler(CalculatedFieldHandler):
     CalculatedFieldHandler to fill the user.meeting_ids.
     """
 
+    def prefetch(self, calls: List[CalculatedFieldHandlerCall]) -> None:
+        user_ids = [
+            call["instance"]["id"]
+            for call in calls
+            if call["field_name"] == "group_$_ids"
+        ]
+        if user_ids:
+            self.datastore.get_many(
+                [GetManyRequest(Collection("user"), user_ids, ["group_$_ids"])],
+                lock_result=False,
+            )
+
     def process_field(
         self, field: Field, field_name: str, instance: Dict[str, Any], action: str
     ) -> RelationUpdates:
@@ -1,8 +1,17 @@
-from typing import List, Set, Union
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
+from ...services.datastore.commands import GetManyRequest
 from ...services.datastore.interface import DatastoreService
 from ...shared.exceptions import ActionException
-from ...shared.patterns import FullQualifiedId
+from ...shared.patterns import Collection, FullQualifiedField, FullQualifiedId
+from ...shared.typing import DeletedModel
+
+MEETING_MEMBERSHIPS_KEY = "meeting_memberships"
+
+# the value of the meeting field of a model in the datastore and the position it was
+# read at, None if the model does not exist
+MeetingMembership = Tuple[Any, Optional[int]]
 
 
 def assert_belongs_to_meeting(
@@ -13,29 +22,75 @@ def assert_belongs_to_meeting(
     if not isinstance(fqids, list):
         fqids = [fqids]
 
-    errors: Set[str] = set()
+    values = get_meeting_field_values(
+        datastore, [fqid for fqid in fqids if fqid.collection.collection != "meeting"]
+    )
+    # use a dict to keep the order of the fqids
+    errors: Dict[str, None] = {}
     for fqid in fqids:
         if fqid.collection.collection == "meeting":
-            if fqid.id != meeting_id:
-                errors.add(str(fqid))
+            belongs = fqid.id == meeting_id
         elif fqid.collection.collection == "user":
-            instance = datastore.fetch_model(
-                fqid,
-                ["meeting_ids"],
-                exception=False,
-            )
-            if meeting_id not in instance.get("meeting_ids", []):
-                errors.add(str(fqid))
+            belongs = meeting_id in (values[fqid] or [])
         else:
-            instance = datastore.fetch_model(
-                fqid,
-                ["meeting_id"],
-                exception=False,
-            )
-            if instance.get("meeting_id") != meeting_id:
-                errors.add(str(fqid))
+            belongs = values[fqid] == meeting_id
+        if not belongs:
+            errors[str(fqid)] = None
 
     if errors:
         raise ActionException(
             f"The following models do not belong to meeting {meeting_id}: {list(errors)}"
         )
+
+
+def get_meeting_field(collection: Collection) -> str:
+    return "meeting_ids" if collection.collection == "user" else "meeting_id"
+
+
+def get_meeting_field_values(
+    datastore: DatastoreService, fqids: List[FullQualifiedId]
+) -> Dict[FullQualifiedId, Any]:
+    """
+    Returns the value of the field meeting_id (meeting_ids for users) of all given
+    models. Changes of the current request are taken from the additional models,
+    all other models are read with one get_many request. The values from the
+    datastore are remembered for the rest of the request and locked again on every
+    use.
+    """
+    memo: Dict[FullQualifiedId, MeetingMembership] = datastore.request_cache.setdefault(
+        MEETING_MEMBERSHIPS_KEY, {}
+    )
+    values: Dict[FullQualifiedId, Any] = {}
+    missing_ids: Dict[Collection, Set[int]] = defaultdict(set)
+    for fqid in fqids:
+        field = get_meeting_field(fqid.collection)
+        model = datastore.additional_relation_models.get(fqid)
+        if model and not isinstance(model, DeletedModel) and field in model:
+            # fetch_model resolves the value from the additional models and locks it
+            values[fqid] = datastore.fetch_model(fqid, [field]).get(field)
+        elif fqid in memo:
+            values[fqid], position = memo[fqid]
+            if position is not None:
+                datastore.update_locked_fields(
+                    FullQualifiedField(fqid.collection, fqid.id, field), position
+                )
+        else:
+            missing_ids[fqid.collection].add(fqid.id)
+
+    if missing_ids:
+        response = datastore.get_many(
+            [
+                GetManyRequest(collection, sorted(ids), [get_meeting_field(collection)])
+                for collection, ids in missing_ids.items()
+            ]
+        )
+        for collection, ids in missing_ids.items():
+            field = get_meeting_field(collection)
+            for id in ids:
+                fqid = FullQualifiedId(collection, id)
+                if instance := response.get(collection, {}).get(id):
+                    memo[fqid] = (instance.get(field), instance.get("meta_position"))
+                else:
+                    memo[fqid] = (None, None)
+                values[fqid] = memo[fqid][0]
+    return values
@@ -0,0 +1,156 @@
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from ...models.base import model_registry
+from ...models.fields import BaseRelationField, BaseTemplateRelationField, OnDelete
+from ...services.datastore.commands import GetManyRequest
+from ...services.datastore.interface import DatastoreService
+from ...shared.patterns import Collection, FullQualifiedId, transform_to_fqids
+from ...shared.typing import DeletedModel
+
+PREFETCHED_CASCADES_KEY = "prefetched_cascades"
+
+
+class CascadePrefetcher:
+    """
+    Loads all models which are deleted together with a model because of cascading
+    relations into the model cache of the datastore, before any delete action is
+    executed.
+
+    The relation graph is loaded breadth-first with one get_many request per level
+    (and one more for structured fields), so that the following delete actions are
+    served from the cache instead of reading model by model. Nothing is checked,
+    locked or written here, the delete actions still run one by one as before.
+    """
+
+    models: Dict[FullQualifiedId, Dict[str, Any]]
+
+    def __init__(self, datastore: DatastoreService) -> None:
+        self.datastore = datastore
+        self.models = {}
+
+    @staticmethod
+    def is_prefetched(datastore: DatastoreService, fqid: FullQualifiedId) -> bool:
+        """
+        Returns whether the model was already prefetched during this request as part
+        of the cascade of another model.
+        """
+        return fqid in datastore.request_cache.get(PREFETCHED_CASCADES_KEY, ())
+
+    def prefetch_cascade(self, fqid: FullQualifiedId) -> None:
+        """
+        Loads the given model and all models it cascades to and remembers them for the
+        rest of the request.
+        """
+        self.datastore.request_cache.setdefault(PREFETCHED_CASCADES_KEY, set()).update(
+            self.load(fqid)
+        )
+
+    def load(self, fqid: FullQualifiedId) -> Set[FullQualifiedId]:
+        seen = {fqid}
+        level = [fqid]
+        while level:
+            self.fetch(level)
+            next_level = []
+            for level_fqid in level:
+                for field, value in self.get_cascading_relations(level_fqid):
+                    for foreign_fqid in transform_to_fqids(
+                        value, field.get_target_collection()
+                    ):
+                        if foreign_fqid not in seen and not self.datastore.is_deleted(
+                            foreign_fqid
+                        ):
+                            seen.add(foreign_fqid)
+                            next_level.append(foreign_fqid)
+            level = next_level
+        return seen
+
+    def fetch(self, fqids: List[FullQualifiedId]) -> None:
+        """
+        Loads all cascading relation fields of the given models. Changes of the current request
+        are taken from the additional models.
+        """
+        ids_per_collection: Dict[Collection, List[int]] = defaultdict(list)
+        for fqid in fqids:
+            ids_per_collection[fqid.collection].append(fqid.id)
+        self.fetch_fields(
+            {
+                collection: (
+                    ids,
+                    {
+                        field.get_own_field_name()
+                        for field in get_cascading_fields(collection)
+                    },
+                )
+                for collection, ids in ids_per_collection.items()
+            }
+        )
+
+        # the structured fields can only be read after their template fields
+        structured_fields: Dict[Collection, Tuple[List[int], Set[str]]] = {}
+        for fqid in fqids:
+            model = self.models.get(fqid, {})
+            for field in get_cascading_fields(fqid.collection):
+                if not isinstance(field, BaseTemplateRelationField):
+                    continue
+                ids, field_names = structured_fields.setdefault(
+                    fqid.collection, ([], set())
+                )
+                if not ids or ids[-1] != fqid.id:
+                    ids.append(fqid.id)
+                field_names.update(
+                    field.get_structured_field_name(replacement)
+                    for replacement in model.get(field.get_template_field_name()) or []
+                )
+        self.fetch_fields(
+            {
+                collection: (ids, field_names)
+                for collection, (ids, field_names) in structured_fields.items()
+                if field_names
+            }
+        )
+
+    def fetch_fields(
+        self, requests: Dict[Collection, Tuple[List[int], Set[str]]]
+    ) -> None:
+        if not requests:
+            return
+        response = self.datastore.get_many(
+            [
+                GetManyRequest(collection, ids, field_names)
+                for collection, (ids, field_names) in requests.items()
+            ],
+            lock_result=False,
+        )
+        for collection, (ids, _) in requests.items():
+            for id in ids:
+                fqid = FullQualifiedId(collection, id)
+                model = dict(response.get(collection, {}).get(id, {}))
+                additional_model = self.datastore.additional_relation_models.get(fqid)
+                if additional_model and not isinstance(additional_model, DeletedModel):
+                    model.update(additional_model)
+                if model:
+                    self.models.setdefault(fqid, {}).update(model)
+
+    def get_cascading_relations(
+        self, fqid: FullQualifiedId
+    ) -> Iterable[Tuple[BaseRelationField, Any]]:
+        """
+        Yields all cascading relation fields of the model together with their values.
+        """
+        if (model := self.models.get(fqid)) is None:
+            return
+        for field in get_cascading_fields(fqid.collection):
+            if isinstance(field, BaseTemplateRelationField):
+                for replacement in model.get(field.get_template_field_name()) or []:
+                    yield field, model.get(field.get_structured_field_name(replacement))
+            else:
+                yield field, model.get(field.get_own_field_name())
+
+
+def get_cascading_fields(collection: Collection) -> List[BaseRelationField]:
+    return [
+        field
+        for field in model_registry[collection]().get_relation_fields()
+        if field.on_delete == OnDelete.CASCADE
+    ]
@@ -0,0 +1,86 @@
+from typing import Any, Dict, Iterable, List
+
+from ...services.datastore.commands import GetManyRequest
+from ...services.datastore.interface import DatastoreService
+from ...shared.patterns import Collection, FullQualifiedId
+
+
+def get_entitled_users(
+    datastore: DatastoreService, meeting_id: int, voted_ids: Iterable[int] = []
+) -> List[Dict[str, Any]]:
+    """
+    Returns all users of the groups of the meeting which are present in the meeting
+    themselves or have delegated their vote to a user present in the meeting.
+    Every user is listed once, together with the information whether they voted
+    and to whom their vote was delegated.
+
+    The users are read set-based: all groups with one request, then all users and
+    at last all delegation targets which were not read already.
+    """
+    delegated_to_field = f"vote_delegated_${meeting_id}_to_id"
+    meeting = datastore.get(
+        FullQualifiedId(Collection("meeting"), meeting_id), ["group_ids"]
+    )
+    groups = datastore.get_many(
+        [
+            GetManyRequest(
+                Collection("group"), meeting.get("group_ids") or [], ["user_ids"]
+            )
+        ]
+    ).get(Collection("group"), {})
+
+    # collect the user ids in order of their first occurence
+    user_ids: Dict[int, None] = {}
+    for group in groups.values():
+        user_ids.update(dict.fromkeys(group.get("user_ids") or []))
+    if not user_ids:
+        return []
+
+    users = get_users(
+        datastore,
+        list(user_ids),
+        ["id", "is_present_in_meeting_ids", delegated_to_field],
+    )
+    delegate_ids = {
+        user[delegated_to_field]
+        for user in users.values()
+        if user.get(delegated_to_field)
+    }
+    delegates = {
+        **users,
+        **get_users(
+            datastore, list(delegate_ids - set(users)), ["is_present_in_meeting_ids"]
+        ),
+    }
+
+    voted_ids = set(voted_ids)
+    entitled_users = []
+    for user_id in user_ids:
+        if not (user := users.get(user_id)):
+            continue
+        delegated_to_id = user.get(delegated_to_field)
+        if is_present(user, meeting_id) or (
+            delegated_to_id and is_present(delegates.get(delegated_to_id), meeting_id)
+        ):
+            entitled_users.append(
+                {
+                    "user_id": user_id,
+                    "voted": user_id in voted_ids,
+                    "vote_delegated_to_id": delegated_to_id,
+                }
+            )
+    return entitled_users
+
+
+def get_users(
+    datastore: DatastoreService, user_ids: List[int], mapped_fields: List[str]
+) -> Dict[int, Dict[str, Any]]:
+    if not user_ids:
+        return {}
+    return datastore.get_many(
+        [GetManyRequest(Collection("user"), user_ids, mapped_fields)]
+    ).get(Collection("user"), {})
+
+
+def is_present(user: Any, meeting_id: int) -> bool:
+    return bool(user) and meeting_id in (user.get("is_present_in_meeting_ids") or [])
@@ -1,13 +1,19 @@
 import os
 from typing import TypedDict
 
+from .shared.http_session import HTTPSessionSettings
+
 Environment = TypedDict(
     "Environment",
     {
         "media_url": str,
         "datastore_reader_url": str,
         "datastore_writer_url": str,
+        "datastore_id_block_size": int,
         "vote_url": str,
+        "datastore_writer_session": HTTPSessionSettings,
+        "media_session": HTTPSessionSettings,
+        "vote_session": HTTPSessionSettings,
     },
 )
 
@@ -24,10 +30,26 @@ DEFAULTS = {
     "DATASTORE_WRITER_HOST": "localhost",
     "DATASTORE_WRITER_PORT": "9011",
     "DATASTORE_WRITER_PATH": "/internal/datastore/writer",
+    "DATASTORE_ID_BLOCK_SIZE": "1",
     "VOTE_PROTOCOL": "http",
     "VOTE_HOST": "vote",
     "VOTE_PORT": "9013",
     "VOTE_PATH": "/internal/vote",
+    "DATASTORE_WRITER_POOL_SIZE": "10",
+    "DATASTORE_WRITER_CONNECT_TIMEOUT": "5",
+    "DATASTORE_WRITER_READ_TIMEOUT": "0",
+    "DATASTORE_WRITER_RETRIES": "3",
+    "DATASTORE_WRITER_BACKOFF_FACTOR": "0.1",
+    "MEDIA_POOL_SIZE": "4",
+    "MEDIA_CONNECT_TIMEOUT": "5",
+    "MEDIA_READ_TIMEOUT": "0",
+    "MEDIA_RETRIES": "3",
+    "MEDIA_BACKOFF_FACTOR": "0.1",
+    "VOTE_POOL_SIZE": "4",
+    "VOTE_CONNECT_TIMEOUT": "5",
+    "VOTE_READ_TIMEOUT": "0",
+    "VOTE_RETRIES": "3",
+    "VOTE_BACKOFF_FACTOR": "0.1",
 }
 
 
@@ -39,20 +61,42 @@ def get_environment() -> Environment:
         media_url=get_endpoint("MEDIA"),
         datastore_reader_url=get_endpoint("DATASTORE_READER"),
         datastore_writer_url=get_endpoint("DATASTORE_WRITER"),
+        datastore_id_block_size=int(get_variable("DATASTORE", "ID_BLOCK_SIZE")),
         vote_url=get_endpoint("VOTE"),
+        datastore_writer_session=get_session_settings("DATASTORE_WRITER"),
+        media_session=get_session_settings("MEDIA"),
+        vote_session=get_session_settings("VOTE"),
     )
 
 
 def get_endpoint(service: str) -> str:
-    parts = {}
-    for suffix in ("PROTOCOL", "HOST", "PORT", "PATH"):
-        variable = "_".join((service, suffix))
-        value = os.environ.get(variable)
-        if value is None:
-            default = DEFAULTS.get(variable)
-            if default is None:
-                raise ValueError(f"Environment variable {variable} does not exist.")
-            parts[suffix] = default
-        else:
-            parts[suffix] = value
+    parts = {
+        suffix: get_variable(service, suffix)
+        for suffix in ("PROTOCOL", "HOST", "PORT", "PATH")
+    }
     return f"{parts['PROTOCOL']}://{parts['HOST']}:{parts['PORT']}{parts['PATH']}"
+
+
+def get_session_settings(service: str) -> HTTPSessionSettings:
+    """
+    Returns the settings of the connection pool to the given service. A read timeout
+    of 0 means that there is no read timeout.
+    """
+    read_timeout = float(get_variable(service, "READ_TIMEOUT"))
+    return HTTPSessionSettings(
+        pool_size=int(get_variable(service, "POOL_SIZE")),
+        connect_timeout=float(get_variable(service, "CONNECT_TIMEOUT")),
+        read_timeout=read_timeout or None,
+        retries=int(get_variable(service, "RETRIES")),
+        backoff_factor=float(get_variable(service, "BACKOFF_FACTOR")),
+    )
+
+
+def get_variable(service: str, suffix: str) -> str:
+    variable = "_".join((service, suffix))
+    value = os.environ.get(variable)
+    if value is None:
+        value = DEFAULTS.get(variable)
+        if value is None:
+            raise ValueError(f"Environment variable {variable} does not exist.")
+    return value
@@ -31,6 +31,8 @@ class OpenSlidesBackendWSGIApplication:
         self.logger.debug("Initialize OpenSlides Backend WSGI application.")
         self.view = view
         self.services = services
+        # The view is stateless, so one instance serves all requests.
+        self.view_instance = view(logging, services)
 
     def dispatch_request(self, request: Request) -> Union[Response, HTTPException]:
         """
@@ -39,9 +41,8 @@ class OpenSlidesBackendWSGIApplication:
         applications themselves.
         """
         # Dispatch view and return response.
-        view_instance = self.view(self.logging, self.services)
         try:
-            response_body, access_token = view_instance.dispatch(request)
+            response_body, access_token = self.view_instance.dispatch(request)
         except ViewException as exception:
             env_var = os.environ.get("OPENSLIDES_BACKEND_RAISE_4XX", "off")
             if is_truthy(env_var):
@@ -1,6 +1,7 @@
 import inspect
 import re
-from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple, Union
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from werkzeug.exceptions import BadRequest as WerkzeugBadRequest
 
@@ -14,6 +15,7 @@ from ..request import Request
 ROUTE_OPTIONS_ATTR = "__route_options"
 
 RouteFunction = Callable[[Any, Request], Tuple[ResponseBody, Optional[str]]]
+BoundRouteFunction = Callable[[Request], Tuple[ResponseBody, Optional[str]]]
 
 
 def route(
@@ -58,16 +60,32 @@ class BaseView(View):
     """
     Base class for views of this service.
 
-    During initialization we bind the dependencies to the instance.
+    During initialization we bind the dependencies to the instance and build the
+    route table. The instance is reused for all requests.
     """
 
-    routes: Dict[Pattern, Callable[[Request], Tuple[ResponseBody, Optional[str]]]]
+    # Maps (method, path) to the route function and the route options.
+    routes: Dict[Tuple[str, str], Tuple[BoundRouteFunction, Dict[str, Any]]]
+    # Maps a path to all methods available for it.
+    route_methods: Dict[str, List[str]]
 
     def __init__(self, logging: LoggingModule, services: Services) -> None:
         self.services = services
         self.logging = logging
         self.logger = logging.getLogger(__name__)
         self.routes = {}
+        self.route_methods = {}
+        functions = inspect.getmembers(
+            self,
+            predicate=lambda attr: inspect.ismethod(attr)
+            and hasattr(attr, ROUTE_OPTIONS_ATTR),
+        )
+        for _, func in functions:
+            for route_options in getattr(func, ROUTE_OPTIONS_ATTR):
+                path = route_options["raw_path"]
+                method = route_options["method"]
+                self.routes[(method, path)] = (func, route_options)
+                self.route_methods.setdefault(path, []).append(method)
 
     def get_user_id_from_headers(
         self, headers: Headers, cookies: Dict
@@ -82,31 +100,34 @@ class BaseView(View):
         return user_id, access_token
 
     def dispatch(self, request: Request) -> Tuple[ResponseBody, Optional[str]]:
-        functions = inspect.getmembers(
-            self,
-            predicate=lambda attr: inspect.ismethod(attr)
-            and hasattr(attr, ROUTE_OPTIONS_ATTR),
-        )
-        for _, func in functions:
-            route_options_list = getattr(func, ROUTE_OPTIONS_ATTR)
-            for route_options in route_options_list:
-                if route_options["path"].match(request.environ["RAW_URI"]):
-                    # Check request method
-                    if request.method != route_options["method"]:
-                        raise MethodNotAllowed(valid_methods=[route_options["method"]])
-                    self.logger.debug(f"Request method is {request.method}.")
-
-                    if route_options["json"]:
-                        # Check mimetype and parse JSON body. The result is cached in request.json
-                        if not request.is_json:
-                            raise View400Exception(
-                                "Wrong media type. Use 'Content-Type: application/json' instead."
-                            )
-                        try:
-                            request_body = request.get_json()
-                        except WerkzeugBadRequest as exception:
-                            raise View400Exception(exception.description)
-                        self.logger.debug(f"Request contains JSON: {request_body}.")
-
-                    return func(request)
-        raise NotFound()
+        path = request.environ["RAW_URI"]
+        if path.endswith("/"):
+            path = path[:-1]
+        route_entry = self.routes.get((request.method, path))
+        if route_entry is None:
+            if path in self.route_methods:
+                raise MethodNotAllowed(valid_methods=self.route_methods[path])
+            raise NotFound()
+        func, route_options = route_entry
+        self.logger.debug(f"Request method is {request.method}.")
+
+        if route_options["json"]:
+            # Check mimetype and parse JSON body. The result is cached in request.json
+            if not request.is_json:
+                raise View400Exception(
+                    "Wrong media type. Use 'Content-Type: application/json' instead."
+                )
+            try:
+                request_body = request.get_json()
+            except WerkzeugBadRequest as exception:
+                raise View400Exception(exception.description)
+            self.logger.debug(f"Request contains JSON: {request_body}.")
+
+        start = perf_counter()
+        try:
+            return func(request)
+        finally:
+            self.logger.debug(
+                f"Dispatched {request.method} {path} in "
+                f"{(perf_counter() - start) * 1000:.2f} ms."
+            )
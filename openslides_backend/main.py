@@ -60,8 +60,14 @@ class OpenSlidesBackendGunicornApplication(BaseApplication):  # pragma: no cover
 
     def load(self) -> WSGIApplication:
         # We import this here so Gunicorn can use its reload feature properly.
+        start = time.perf_counter()
         from .wsgi import create_wsgi_application
 
+        logging.getLogger(__name__).info(
+            f"Imported application for {self.view_name} in "
+            f"{(time.perf_counter() - start) * 1000:.2f} ms."
+        )
+
         # TODO: Fix this typing problem.
         logging_module: LoggingModule = logging  # type: ignore
 
@@ -1,5 +1,5 @@
-import re
-from typing import Dict, Iterable, Optional, Type
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple, Type
 
 from ..shared.exceptions import ActionException
 from ..shared.patterns import Collection
@@ -35,10 +35,48 @@ class ModelMetaClass(type):
                     if isinstance(attr, fields.BaseTemplateField):
                         prefix = attr_name[: attr.index]
                         new_class.field_prefix_map[prefix] = attr
+
+            # Precompute the field lists, the fields never change after the class
+            # is created.
+            new_class.all_fields = tuple(
+                attr
+                for attr_name in dir(new_class)
+                if isinstance(attr := getattr(new_class, attr_name), fields.Field)
+            )
+            new_class.relation_fields = tuple(
+                field
+                for field in new_class.all_fields
+                if isinstance(field, fields.BaseRelationField)
+            )
+            new_class.required_fields = tuple(
+                field for field in new_class.all_fields if field.required
+            )
+            new_class.fields_with_default = tuple(
+                field for field in new_class.all_fields if field.default is not None
+            )
             model_registry[new_class.collection] = new_class
         return new_class
 
 
+@lru_cache(maxsize=4096)
+def lookup_field(model_class: Type["Model"], field_name: str) -> Optional[fields.Field]:
+    """
+    Returns the field of the model class for the given field name, which may also be
+    a populated template field. The results are cached since the same populated
+    template fields are looked up over and over again.
+    """
+    prefix = field_name.split("$")[0]
+    if prefix not in model_class.field_prefix_map:
+        return None
+
+    field = model_class.field_prefix_map[prefix]
+    if isinstance(field, fields.BaseTemplateField):
+        # We use the regex here since we want to also match template fields.
+        if "$" in field_name and not field.match(field_name):
+            return None
+    return field
+
+
 class Model(metaclass=ModelMetaClass):
     """
     Base class for models in OpenSlides.
@@ -52,6 +90,12 @@ class Model(metaclass=ModelMetaClass):
     # once only with the prefix.
     field_prefix_map: Dict[str, fields.BaseRelationField]
 
+    # All fields, sorted by name, and subsets of them. Computed by the metaclass.
+    all_fields: Tuple[fields.Field, ...]
+    relation_fields: Tuple[fields.BaseRelationField, ...]
+    required_fields: Tuple[fields.Field, ...]
+    fields_with_default: Tuple[fields.Field, ...]
+
     def __str__(self) -> str:
         return self.verbose_name
 
@@ -80,33 +124,19 @@ class Model(metaclass=ModelMetaClass):
 
         Returns None if field is not found.
         """
-        prefix = field_name.split("$")[0]
-        if prefix not in self.field_prefix_map:
-            return None
-
-        field = self.field_prefix_map[prefix]
-        if isinstance(field, fields.BaseTemplateField):
-            # We use the regex here since we want to also match template fields.
-            if "$" in field_name and not re.match(field.get_regex(), field_name):
-                return None
-        return field
+        return lookup_field(type(self), field_name)
 
     def get_fields(self) -> Iterable[fields.Field]:
         """
-        Yields all fields of this model.
+        Returns all fields of this model.
         """
-        for attr_name in dir(self):
-            attr = getattr(self, attr_name)
-            if isinstance(attr, fields.Field):
-                yield attr
+        return self.all_fields
 
     def get_relation_fields(self) -> Iterable[fields.BaseRelationField]:
         """
-        Yields all relation fields (using BaseRelationField).
+        Returns all relation fields (using BaseRelationField).
         """
-        for model_field in self.get_fields():
-            if isinstance(model_field, fields.BaseRelationField):
-                yield model_field
+        return self.relation_fields
 
     def get_property(
         self, field_name: str, replacement_pattern: Optional[str] = None
@@ -135,18 +165,16 @@ class Model(metaclass=ModelMetaClass):
         """
         Yields all required fields
         """
-        for model_field in self.get_fields():
-            if model_field.required:
-
-                if isinstance(
-                    model_field,
-                    (
-                        fields.RelationListField,
-                        fields.GenericRelationListField,
-                        fields.BaseTemplateField,
-                    ),
-                ):
-                    raise NotImplementedError(
-                        f"{self.collection.collection}.{model_field.own_field_name}"
-                    )
-                yield model_field
+        for model_field in self.required_fields:
+            if isinstance(
+                model_field,
+                (
+                    fields.RelationListField,
+                    fields.GenericRelationListField,
+                    fields.BaseTemplateField,
+                ),
+            ):
+                raise NotImplementedError(
+                    f"{self.collection.collection}.{model_field.own_field_name}"
+                )
+            yield model_field
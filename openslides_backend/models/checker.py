@@ -1,4 +1,5 @@
 import re
+import time
 from collections import defaultdict
 from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, cast
 
@@ -95,17 +96,16 @@ def check_x_list(value: Any, fn: Callable) -> bool:
         return True
     if not isinstance(value, list):
         return False
-    return all([fn(sv) for sv in value])
+    return all(fn(sv) for sv in value)
+
+
+decimal_regex = re.compile(r"^-?(\d|[1-9]\d+)\.\d{6}$")
 
 
 def check_decimal(value: Any) -> bool:
     if value is None:
         return True
-    if isinstance(value, str):
-        pattern = r"^-?(\d|[1-9]\d+)\.\d{6}$"
-        if re.match(pattern, value):
-            return True
-    return False
+    return isinstance(value, str) and bool(decimal_regex.match(value))
 
 
 def check_json(value: Any, root: bool = True) -> bool:
@@ -120,6 +120,8 @@ def check_json(value: Any, root: bool = True) -> bool:
     return False
 
 
+RECOMMENDATION_EXTENSION_REFERENCE_IDS_PATTERN = re.compile(r"\[(?P<fqid>\w+/\d+)\]")
+
 checker_map: Dict[Type[Field], Callable[..., bool]] = {
     CharField: check_string,
     HTMLStrictField: check_string,
@@ -233,6 +235,17 @@ class Checker:
 
         self.errors: List[str] = []
 
+        # Everything derived from the model definitions is computed once per
+        # collection or field and reused for all models of the data.
+        self.fields: Dict[str, List[Field]] = {}
+        self.template_fields: Dict[str, List[BaseTemplateField]] = {}
+        self.field_names: Dict[str, Tuple[Set[str], Set[str]]] = {}
+        self.field_types: Dict[Tuple[str, str], Field] = {}
+        self.type_checkers: Dict[Type[Field], Callable[..., bool]] = {}
+
+        # Time in seconds spent on the check of each collection
+        self.timings: Dict[str, float] = {}
+
         self.check_migration_index()
 
         self.template_prefixes: Dict[
@@ -253,7 +266,48 @@ class Checker:
                 )
 
     def get_fields(self, collection: str) -> Iterable[Field]:
-        return self.models[collection]().get_fields()
+        if collection not in self.fields:
+            self.fields[collection] = list(self.models[collection]().get_fields())
+        return self.fields[collection]
+
+    def get_template_fields(self, collection: str) -> List[BaseTemplateField]:
+        if collection not in self.template_fields:
+            self.template_fields[collection] = [
+                field
+                for field in self.get_fields(collection)
+                if isinstance(field, BaseTemplateField)
+            ]
+        return self.template_fields[collection]
+
+    def get_field_names(self, collection: str) -> Tuple[Set[str], Set[str]]:
+        """
+        Returns the names of all fields and of all required fields or fields with
+        default of the collection.
+        """
+        if collection not in self.field_names:
+            fields = self.get_fields(collection)
+            self.field_names[collection] = (
+                set(field.get_own_field_name() for field in fields),
+                set(
+                    field.get_own_field_name()
+                    for field in fields
+                    if field.required or field.default is not None
+                ),
+            )
+        return self.field_names[collection]
+
+    def get_type_checker(self, field_type: Field) -> Callable[..., bool]:
+        field_class = type(field_type)
+        if field_class not in self.type_checkers:
+            for _type in field_class.mro():
+                if _type in checker_map:
+                    self.type_checkers[field_class] = checker_map[_type]
+                    break
+            else:
+                raise NotImplementedError(
+                    f"TODO implement check for field type {field_type}"
+                )
+        return self.type_checkers[field_class]
 
     def generate_template_prefixes(self) -> None:
         for collection in self.allowed_collections:
@@ -309,12 +363,14 @@ class Checker:
         self.check_json()
         self.check_collections()
         for collection, models in self.data.items():
+            start = time.perf_counter()
             for id_, model in models.items():
                 if model["id"] != int(id_):
                     self.errors.append(
                         f"{collection}/{id_}: Id must be the same as model['id']"
                     )
                 self.check_model(collection, model)
+            self.timings[collection] = time.perf_counter() - start
         if self.errors:
             errors = [f"\t{error}" for error in self.errors]
             raise CheckException("\n".join(errors))
@@ -353,15 +409,10 @@ class Checker:
             for x in model.keys()
             if self.is_normal_field(x) or self.is_template_field(x)
         )
-        all_collection_fields = set(
-            field.get_own_field_name()
-            for field in self.models[collection]().get_fields()
-        )
-        required_or_default_collection_fields = set(
-            field.get_own_field_name()
-            for field in self.models[collection]().get_fields()
-            if field.required or field.default is not None
-        )
+        (
+            all_collection_fields,
+            required_or_default_collection_fields,
+        ) = self.get_field_names(collection)
         necessary_fields = (
             required_or_default_collection_fields
             if self.is_partial
@@ -378,7 +429,7 @@ class Checker:
             self.errors.append(error)
             errors = True
 
-        for field in self.models[collection]().get_fields():
+        for field in self.get_fields(collection):
             if (fieldname := field.get_own_field_name()) in model_fields:
                 try:
                     field.validate(model[fieldname], model)
@@ -396,9 +447,7 @@ class Checker:
         Returns True on errors.
         """
         errors = False
-        for template_field in self.get_fields(collection):
-            if not isinstance(template_field, BaseTemplateField):
-                continue
+        for template_field in self.get_template_fields(collection):
             field_error = False
             replacements = model.get(template_field.get_template_field_name())
 
@@ -475,18 +524,9 @@ class Checker:
                 continue
 
             field_type = self.get_type_from_collection(field, collection)
-            enum = self.get_enum_from_collection_field(field, collection)
-
-            checker: Optional[Callable[..., bool]] = None
-            for _type in type(field_type).mro():
-                if _type in checker_map:
-                    checker = checker_map[_type]
-                    break
-            else:
-                raise NotImplementedError(
-                    f"TODO implement check for field type {field_type}"
-                )
+            enum = field_type.constraints.get("enum")
 
+            checker = self.get_type_checker(field_type)
             if not checker(model[field]):
                 error = f"{collection}/{model['id']}/{field}: Type error: Type is not {field_type}"
                 self.errors.append(error)
@@ -509,20 +549,19 @@ class Checker:
                 self.errors.append(error)
 
     def get_type_from_collection(self, field: str, collection: str) -> Field:
+        if (key := (collection, field)) in self.field_types:
+            return self.field_types[key]
         if self.is_structured_field(field):
             field, _ = self.to_template_field(collection, field)
 
         field_type = self.models[collection]().get_field(field)
+        self.field_types[key] = field_type
         return field_type
 
     def get_enum_from_collection_field(
         self, field: str, collection: str
     ) -> Optional[Set[str]]:
-        if self.is_structured_field(field):
-            field, _ = self.to_template_field(collection, field)
-
-        field_type = self.models[collection]().get_field(field)
-        return field_type.constraints.get("enum")
+        return self.get_type_from_collection(field, collection).constraints.get("enum")
 
     def check_relations(self, model: Dict[str, Any], collection: str) -> None:
         for field in model.keys():
@@ -640,9 +679,6 @@ class Checker:
                     )
 
         elif collection == "motion" and field == "recommendation_extension":
-            RECOMMENDATION_EXTENSION_REFERENCE_IDS_PATTERN = re.compile(
-                r"\[(?P<fqid>\w+/\d+)\]"
-            )
             recommendation_extension = model["recommendation_extension"]
             if recommendation_extension is None:
                 recommendation_extension = ""
@@ -663,10 +699,9 @@ class Checker:
                     )
 
     def get_to(self, field: str, collection: str) -> Tuple[str, Optional[str]]:
-        if self.is_structured_field(field):
-            field, _ = self.to_template_field(collection, field)
-
-        field_type = cast(BaseRelationField, self.models[collection]().get_field(field))
+        field_type = cast(
+            BaseRelationField, self.get_type_from_collection(field, collection)
+        )
         return (
             field_type.get_target_collection().collection,
             field_type.to.get(field_type.get_target_collection()),
@@ -797,7 +832,9 @@ class Checker:
         self, collection: str, field: str, foreign_collection: str
     ) -> str:
         """Returns all reverse relations as collectionfields"""
-        to = cast(BaseRelationField, self.models[collection]().get_field(field)).to
+        to = cast(
+            BaseRelationField, self.get_type_from_collection(field, collection)
+        ).to
         if isinstance(to, dict):
             if Collection(foreign_collection) not in to.keys():
                 raise CheckException(
@@ -1,7 +1,7 @@
 import re
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, List, Match, Optional, Pattern, Union, cast
 
 from ..shared.patterns import COLOR_PATTERN, ID_REGEX, Collection, string_to_fqid
 from ..shared.schema import (
@@ -337,10 +337,12 @@ class BaseTemplateField(Field):
 
     replacement_collection: Optional[Collection]
     index: int
+    regex: Optional[Pattern[str]]
 
     def __init__(self, **kwargs: Any) -> None:
         self.replacement_collection = kwargs.pop("replacement_collection", None)
         self.index = kwargs.pop("index")
+        self.regex = None
         super().__init__(**kwargs)
 
     def get_own_field_name(self) -> str:
@@ -373,6 +375,15 @@ class BaseTemplateField(Field):
             + r"$"
         )
 
+    def match(self, field_name: str) -> Optional[Match[str]]:
+        """
+        Matches the field name against the compiled regex of this field. The regex is
+        compiled on first usage since the own field name is only set by the model.
+        """
+        if self.regex is None:
+            self.regex = re.compile(self.get_regex())
+        return self.regex.match(field_name)
+
     def get_replacement(self, field_name: str) -> str:
         replacement = self.try_get_replacement(field_name)
         if not replacement:
@@ -396,7 +407,7 @@ class BaseTemplateField(Field):
         return field_name == self.get_template_field_name()
 
     def try_get_replacement(self, field_name: str) -> Optional[str]:
-        match = re.match(self.get_regex(), field_name)
+        match = self.match(field_name)
         if not match:
             return None
         replacement = match.group(1)
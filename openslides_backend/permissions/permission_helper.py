@@ -1,16 +1,59 @@
-from typing import List
+from typing import Dict, List, Optional, Set
 
 from ..services.datastore.commands import GetManyRequest
 from ..services.datastore.interface import DatastoreService
 from ..shared.exceptions import PermissionDenied
-from ..shared.patterns import Collection, FullQualifiedId
+from ..shared.patterns import Collection, FullQualifiedField, FullQualifiedId
 from .management_levels import CommitteeManagementLevel, OrganizationManagementLevel
-from .permissions import Permission, permission_parents
+from .permissions import Permission, implied_permissions
 
 
-def has_perm(
-    datastore: DatastoreService, user_id: int, permission: Permission, meeting_id: int
-) -> bool:
+class MeetingPermissions:
+    """
+    Holds the resolved permissions of one user in one meeting, including all implied
+    permissions, and the locks of the fields they were resolved from.
+    """
+
+    def __init__(
+        self,
+        permissions: Set[Permission],
+        is_superadmin: bool = False,
+        is_admin: bool = False,
+        locks: Optional[Dict[FullQualifiedField, int]] = None,
+    ) -> None:
+        self.permissions = permissions
+        self.is_superadmin = is_superadmin
+        self.is_admin = is_admin
+        self.locks = locks or {}
+
+    def has_perm(self, permission: Permission) -> bool:
+        return self.is_superadmin or self.is_admin or permission in self.permissions
+
+
+def get_meeting_permissions(
+    datastore: DatastoreService, user_id: int, meeting_id: int
+) -> MeetingPermissions:
+    """
+    Returns the resolved permissions of the user in the meeting. They are computed
+    only once per request and (user_id, meeting_id). The locks of the underlying
+    fields are applied on each call, since the locked fields are reset per action.
+    """
+    key = ("meeting_permissions", user_id, meeting_id)
+    if key in datastore.request_cache:
+        meeting_permissions = datastore.request_cache[key]
+        for fqfield, position in meeting_permissions.locks.items():
+            datastore.update_locked_fields(fqfield, position)
+    else:
+        meeting_permissions = resolve_meeting_permissions(
+            datastore, user_id, meeting_id
+        )
+        datastore.request_cache[key] = meeting_permissions
+    return meeting_permissions
+
+
+def resolve_meeting_permissions(
+    datastore: DatastoreService, user_id: int, meeting_id: int
+) -> MeetingPermissions:
     # anonymous cannot be fetched from db
     if user_id > 0:
         user = datastore.get(
@@ -29,8 +72,9 @@ def has_perm(
         user.get("organization_management_level")
         == OrganizationManagementLevel.SUPERADMIN
     ):
-        return True
+        return MeetingPermissions(set(), is_superadmin=True)
 
+    locks: Dict[FullQualifiedField, int] = {}
     # get correct group ids for this user
     if user.get(f"group_${meeting_id}_ids"):
         group_ids = user[f"group_${meeting_id}_ids"]
@@ -46,9 +90,13 @@ def has_perm(
                 raise PermissionDenied(
                     f"Anonymous is not enabled for meeting {meeting_id}"
                 )
+            for field in ("default_group_id", "enable_anonymous"):
+                locks[
+                    FullQualifiedField(Collection("meeting"), meeting_id, field)
+                ] = meeting["meta_position"]
             group_ids = [meeting["default_group_id"]]
         else:
-            return False
+            return MeetingPermissions(set())
 
     gmr = GetManyRequest(
         Collection("group"),
@@ -56,30 +104,33 @@ def has_perm(
         ["permissions", "admin_group_for_meeting_id"],
     )
     result = datastore.get_many([gmr])
-    for group in result[Collection("group")].values():
+    permissions: Set[Permission] = set()
+    is_admin = False
+    for group_id, group in result[Collection("group")].items():
+        for field in ("permissions", "admin_group_for_meeting_id"):
+            locks[FullQualifiedField(Collection("group"), group_id, field)] = group[
+                "meta_position"
+            ]
         # admins implicitly have all permissions
         if group.get("admin_group_for_meeting_id") == meeting_id:
-            return True
-        # check if the current group has the needed permission (or a higher one)
+            is_admin = True
         for group_permission in group.get("permissions", []):
-            if is_child_permission(permission, group_permission):
-                return True
-    return False
+            permissions.update(implied_permissions.get(group_permission, []))
+    return MeetingPermissions(permissions, is_admin=is_admin, locks=locks)
+
+
+def has_perm(
+    datastore: DatastoreService, user_id: int, permission: Permission, meeting_id: int
+) -> bool:
+    return get_meeting_permissions(datastore, user_id, meeting_id).has_perm(permission)
 
 
 def is_child_permission(child: Permission, parent: Permission) -> bool:
     """
-    Iterate the permission tree (represented in the permissions object) from child to
-    parent or until there are no parents anymore
+    Looks up whether the child is implied by the parent in the precomputed transitive
+    closure of the permission tree.
     """
-    queue: List[Permission] = [child]
-    while queue:
-        current = queue.pop()
-        if current == parent:
-            return True
-        parents = permission_parents[current]
-        queue.extend(parents)
-    return False
+    return child == parent or child in implied_permissions.get(parent, [])
 
 
 def has_organization_management_level(
@@ -142,6 +193,12 @@ def is_admin(datastore: DatastoreService, user_id: int, meeting_id: int) -> bool
     ):
         return True
 
+    # anonymous is never admin
+    if user_id <= 0:
+        return False
+
+    # the fields are read with locks, so that a concurrent change of the admin group
+    # or of the groups of the user is detected on write
     meeting = datastore.get(
         FullQualifiedId(Collection("meeting"), meeting_id),
         ["admin_group_id"],
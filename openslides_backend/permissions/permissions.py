@@ -139,3 +139,71 @@ permission_parents: Dict[Permission, List[Permission]] = {
     _User.CAN_SEE: [_User.CAN_MANAGE],
     _User.CAN_MANAGE: [],
 }
+
+# Holds all implied permissions (including itself) for each permission.
+implied_permissions: Dict[Permission, List[Permission]] = {
+    _AgendaItem.CAN_SEE: [_AgendaItem.CAN_SEE],
+    _AgendaItem.CAN_SEE_INTERNAL: [_AgendaItem.CAN_SEE, _AgendaItem.CAN_SEE_INTERNAL],
+    _AgendaItem.CAN_MANAGE: [
+        _AgendaItem.CAN_MANAGE,
+        _AgendaItem.CAN_SEE,
+        _AgendaItem.CAN_SEE_INTERNAL,
+    ],
+    _Assignment.CAN_SEE: [_Assignment.CAN_SEE],
+    _Assignment.CAN_NOMINATE_OTHER: [
+        _Assignment.CAN_NOMINATE_OTHER,
+        _Assignment.CAN_SEE,
+    ],
+    _Assignment.CAN_MANAGE: [
+        _Assignment.CAN_MANAGE,
+        _Assignment.CAN_NOMINATE_OTHER,
+        _Assignment.CAN_SEE,
+    ],
+    _Assignment.CAN_NOMINATE_SELF: [_Assignment.CAN_NOMINATE_SELF, _Assignment.CAN_SEE],
+    _Chat.CAN_MANAGE: [_Chat.CAN_MANAGE],
+    _ListOfSpeakers.CAN_SEE: [_ListOfSpeakers.CAN_SEE],
+    _ListOfSpeakers.CAN_MANAGE: [_ListOfSpeakers.CAN_MANAGE, _ListOfSpeakers.CAN_SEE],
+    _ListOfSpeakers.CAN_BE_SPEAKER: [
+        _ListOfSpeakers.CAN_BE_SPEAKER,
+        _ListOfSpeakers.CAN_SEE,
+    ],
+    _Mediafile.CAN_SEE: [_Mediafile.CAN_SEE],
+    _Mediafile.CAN_MANAGE: [_Mediafile.CAN_MANAGE, _Mediafile.CAN_SEE],
+    _Meeting.CAN_MANAGE_SETTINGS: [_Meeting.CAN_MANAGE_SETTINGS],
+    _Meeting.CAN_MANAGE_LOGOS_AND_FONTS: [_Meeting.CAN_MANAGE_LOGOS_AND_FONTS],
+    _Meeting.CAN_SEE_FRONTPAGE: [_Meeting.CAN_SEE_FRONTPAGE],
+    _Meeting.CAN_SEE_AUTOPILOT: [_Meeting.CAN_SEE_AUTOPILOT],
+    _Meeting.CAN_SEE_LIVESTREAM: [_Meeting.CAN_SEE_LIVESTREAM],
+    _Meeting.CAN_SEE_HISTORY: [_Meeting.CAN_SEE_HISTORY],
+    _Motion.CAN_SEE: [_Motion.CAN_SEE],
+    _Motion.CAN_MANAGE_METADATA: [_Motion.CAN_MANAGE_METADATA, _Motion.CAN_SEE],
+    _Motion.CAN_MANAGE_POLLS: [_Motion.CAN_MANAGE_POLLS, _Motion.CAN_SEE],
+    _Motion.CAN_SEE_INTERNAL: [_Motion.CAN_SEE, _Motion.CAN_SEE_INTERNAL],
+    _Motion.CAN_FORWARD_INTO_THIS_MEETING: [
+        _Motion.CAN_FORWARD_INTO_THIS_MEETING,
+        _Motion.CAN_SEE,
+    ],
+    _Motion.CAN_CREATE: [
+        _Motion.CAN_CREATE,
+        _Motion.CAN_FORWARD_INTO_THIS_MEETING,
+        _Motion.CAN_SEE,
+    ],
+    _Motion.CAN_CREATE_AMENDMENTS: [_Motion.CAN_CREATE_AMENDMENTS, _Motion.CAN_SEE],
+    _Motion.CAN_MANAGE: [
+        _Motion.CAN_CREATE,
+        _Motion.CAN_CREATE_AMENDMENTS,
+        _Motion.CAN_FORWARD_INTO_THIS_MEETING,
+        _Motion.CAN_MANAGE,
+        _Motion.CAN_MANAGE_METADATA,
+        _Motion.CAN_MANAGE_POLLS,
+        _Motion.CAN_SEE,
+        _Motion.CAN_SEE_INTERNAL,
+    ],
+    _Motion.CAN_SUPPORT: [_Motion.CAN_SEE, _Motion.CAN_SUPPORT],
+    _Poll.CAN_MANAGE: [_Poll.CAN_MANAGE],
+    _Projector.CAN_SEE: [_Projector.CAN_SEE],
+    _Projector.CAN_MANAGE: [_Projector.CAN_MANAGE, _Projector.CAN_SEE],
+    _Tag.CAN_MANAGE: [_Tag.CAN_MANAGE],
+    _User.CAN_SEE: [_User.CAN_SEE],
+    _User.CAN_MANAGE: [_User.CAN_MANAGE, _User.CAN_SEE],
+}
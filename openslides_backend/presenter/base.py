@@ -1,7 +1,8 @@
-from typing import Any, Callable, Optional
+from typing import Any, Callable, List, Optional
 
 from fastjsonschema import JsonSchemaException
 
+from ..services.datastore.commands import GetManyRequest
 from ..services.datastore.interface import DatastoreService
 from ..shared.exceptions import PresenterException
 from ..shared.interfaces.logging import LoggingModule
@@ -48,6 +49,14 @@ class BasePresenter:
             if self.data is not None:
                 raise PresenterException("This presenter does not take data.")
 
+    def get_prefetch_requests(self) -> List[GetManyRequest]:
+        """
+        Returns the reads which are already known from the validated data. They are
+        loaded for all presenters of a request with one get_many request before any
+        result is computed.
+        """
+        return []
+
     def get_result(self) -> Any:
         """Does the actual work and returns the result depending on the data."""
         ...
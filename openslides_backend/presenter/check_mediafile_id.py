@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import fastjsonschema
 
@@ -10,6 +10,7 @@ from ..permissions.permission_helper import (
     is_admin,
 )
 from ..permissions.permissions import Permissions
+from ..services.datastore.commands import GetManyRequest
 from ..shared.exceptions import PermissionDenied
 from ..shared.patterns import Collection, FullQualifiedId
 from ..shared.schema import required_id_schema, schema_version
@@ -37,6 +38,24 @@ class CheckMediafileId(BasePresenter):
 
     schema = check_mediafile_id_schema
 
+    def get_prefetch_requests(self) -> List[GetManyRequest]:
+        return [
+            GetManyRequest(
+                Mediafile.collection,
+                [self.data["mediafile_id"]],
+                [
+                    "filename",
+                    "is_directory",
+                    "meeting_id",
+                    "used_as_logo_$_in_meeting_id",
+                    "used_as_font_$_in_meeting_id",
+                    "projection_ids",
+                    "is_public",
+                    "inherited_access_group_ids",
+                ],
+            )
+        ]
+
     def get_result(self) -> Any:
         mediafile = self.datastore.get(
             FullQualifiedId(Mediafile.collection, self.data["mediafile_id"]),
@@ -87,13 +106,20 @@ class CheckMediafileId(BasePresenter):
         if has_perm(
             self.datastore, self.user_id, Permissions.Projector.CAN_SEE, meeting_id
         ):
-            for projection_id in mediafile.get("projection_ids", []):
-                projection = self.datastore.get(
-                    FullQualifiedId(Collection("projection"), projection_id),
-                    ["current_projector_id"],
-                )
-                if projection.get("current_projector_id"):
-                    return
+            projections = self.datastore.get_many(
+                [
+                    GetManyRequest(
+                        Collection("projection"),
+                        mediafile.get("projection_ids", []),
+                        ["current_projector_id"],
+                    )
+                ]
+            ).get(Collection("projection"), {})
+            if any(
+                projection.get("current_projector_id")
+                for projection in projections.values()
+            ):
+                return
         # The user has mediafile.can_see and either:
         #  - mediafile/is_public is true, or
         #   - The user has groups in common with mediafile/inherited_access_group_ids
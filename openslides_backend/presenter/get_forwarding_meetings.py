@@ -1,9 +1,10 @@
-from typing import Any
+from typing import Any, List
 
 import fastjsonschema
 
 from ..permissions.permission_helper import has_perm
 from ..permissions.permissions import Permissions
+from ..services.datastore.commands import GetManyRequest
 from ..shared.exceptions import PermissionDenied, PresenterException
 from ..shared.patterns import Collection, FullQualifiedId
 from ..shared.schema import required_id_schema, schema_version
@@ -31,6 +32,15 @@ class GetForwardingMeetings(BasePresenter):
 
     schema = get_forwarding_meetings_schema
 
+    def get_prefetch_requests(self) -> List[GetManyRequest]:
+        return [
+            GetManyRequest(
+                Collection("meeting"),
+                [self.data["meeting_id"]],
+                ["committee_id", "is_active_in_organization_id", "name"],
+            )
+        ]
+
     def get_result(self) -> Any:
         # check permission
         if not has_perm(
@@ -61,11 +71,34 @@ class GetForwardingMeetings(BasePresenter):
             ["forward_to_committee_ids"],
         )
 
+        forward_to_committee_ids = committee.get("forward_to_committee_ids", [])
+        forward_to_committees = self.datastore.get_many(
+            [
+                GetManyRequest(
+                    Collection("committee"),
+                    forward_to_committee_ids,
+                    ["meeting_ids", "name", "default_meeting_id"],
+                )
+            ]
+        ).get(Collection("committee"), {})
+        meetings = self.datastore.get_many(
+            [
+                GetManyRequest(
+                    Collection("meeting"),
+                    [
+                        meeting_id
+                        for forward_to_committee in forward_to_committees.values()
+                        for meeting_id in forward_to_committee.get("meeting_ids", [])
+                    ],
+                    ["name", "is_active_in_organization_id"],
+                )
+            ]
+        ).get(Collection("meeting"), {})
+
         result = []
-        for forward_to_committee_id in committee.get("forward_to_committee_ids", []):
-            forward_to_committee = self.datastore.get(
-                FullQualifiedId(Collection("committee"), forward_to_committee_id),
-                ["meeting_ids", "name", "default_meeting_id"],
+        for forward_to_committee_id in forward_to_committee_ids:
+            forward_to_committee = forward_to_committees.get(
+                forward_to_committee_id, {}
             )
 
             meeting_result = []
@@ -77,10 +110,7 @@ class GetForwardingMeetings(BasePresenter):
                     meeting_id2,
                 ):
                     continue
-                meeting2 = self.datastore.get(
-                    FullQualifiedId(Collection("meeting"), meeting_id2),
-                    ["name", "is_active_in_organization_id"],
-                )
+                meeting2 = meetings.get(meeting_id2, {})
                 if meeting2.get("is_active_in_organization_id"):
                     meeting_result.append(
                         {"id": meeting_id2, "name": meeting2.get("name", "")}
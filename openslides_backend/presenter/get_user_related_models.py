@@ -1,4 +1,5 @@
-from typing import Any, Dict, List
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
 
 import fastjsonschema
 
@@ -14,12 +15,15 @@ from ..permissions.permission_helper import (
 from ..permissions.permissions import Permissions
 from ..services.datastore.commands import GetManyRequest
 from ..shared.exceptions import MissingPermission
-from ..shared.filters import And, FilterOperator
+from ..shared.filters import FilterOperator, Or
 from ..shared.patterns import Collection, FullQualifiedId
 from ..shared.schema import schema_version
 from .base import BasePresenter
 from .presenter import register_presenter
 
+# maximum number of users which are combined into one filter request
+FILTER_CHUNK_SIZE = 500
+
 get_user_related_models_schema = fastjsonschema.compile(
     {
         "$schema": schema_version,
@@ -46,124 +50,202 @@ class GetUserRelatedModels(BasePresenter):
 
     schema = get_user_related_models_schema
 
+    def get_prefetch_requests(self) -> List[GetManyRequest]:
+        return [
+            GetManyRequest(
+                Collection("user"),
+                self.data["user_ids"],
+                ["committee_ids", "committee_$_management_level", "meeting_ids"],
+            )
+        ]
+
     def get_result(self) -> Any:
+        users = self.get_users()
+        committees_data = self.get_committees_data(users)
+        meetings_data = self.get_meetings_data(users)
         result: Dict[str, Any] = {}
         for user_id in self.data["user_ids"]:
             result[str(user_id)] = {}
-            committees_data = self.get_committees_data(user_id)
-            meetings_data = self.get_meetings_data(user_id)
-            if committees_data:
-                result[str(user_id)]["committees"] = committees_data
-            if meetings_data:
-                result[str(user_id)]["meetings"] = meetings_data
+            if committees_data.get(user_id):
+                result[str(user_id)]["committees"] = committees_data[user_id]
+            if meetings_data.get(user_id):
+                result[str(user_id)]["meetings"] = meetings_data[user_id]
         self.check_permissions(result)
         return result
 
     def check_permissions(self, result: Any) -> None:
-        """It first collects the meetings which are included and checks them."""
+        """
+        It first collects the meetings and committees which are included and checks
+        each of them once.
+        """
         if has_organization_management_level(
             self.datastore, self.user_id, OrganizationManagementLevel.CAN_MANAGE_USERS
         ):
             return
-        for user_id in result:
-            meeting_ids = []
-            for meeting in result[user_id].get("meetings", []):
-                meeting_ids.append(meeting["id"])
-            if not all(
-                has_perm(
-                    self.datastore,
-                    self.user_id,
-                    Permissions.User.CAN_MANAGE,
-                    meeting_id,
-                )
-                for meeting_id in meeting_ids
-            ):
-                raise MissingPermission(OrganizationManagementLevel.CAN_MANAGE_USERS)
-            committee_ids = []
-            for committee in result[user_id].get("committees", []):
-                committee_ids.append(committee["id"])
-            if not all(
-                has_committee_management_level(
-                    self.datastore,
-                    self.user_id,
-                    CommitteeManagementLevel.CAN_MANAGE,
-                    committee_id,
+        meeting_ids = {
+            meeting["id"]
+            for user_result in result.values()
+            for meeting in user_result.get("meetings", [])
+        }
+        if not all(
+            has_perm(
+                self.datastore,
+                self.user_id,
+                Permissions.User.CAN_MANAGE,
+                meeting_id,
+            )
+            for meeting_id in sorted(meeting_ids)
+        ):
+            raise MissingPermission(OrganizationManagementLevel.CAN_MANAGE_USERS)
+        committee_ids = {
+            committee["id"]
+            for user_result in result.values()
+            for committee in user_result.get("committees", [])
+        }
+        if not all(
+            has_committee_management_level(
+                self.datastore,
+                self.user_id,
+                CommitteeManagementLevel.CAN_MANAGE,
+                committee_id,
+            )
+            for committee_id in sorted(committee_ids)
+        ):
+            raise MissingPermission(OrganizationManagementLevel.CAN_MANAGE_USERS)
+
+    def get_users(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Reads all requested users with their committee management levels.
+        """
+        user_ids = list(dict.fromkeys(self.data["user_ids"]))
+        users = self.datastore.get_many(
+            [
+                GetManyRequest(
+                    Collection("user"),
+                    user_ids,
+                    ["committee_ids", "committee_$_management_level", "meeting_ids"],
                 )
-                for committee_id in committee_ids
-            ):
-                raise MissingPermission(OrganizationManagementLevel.CAN_MANAGE_USERS)
+            ]
+        ).get(Collection("user"), {})
+        for user_id in user_ids:
+            if user_id not in users:
+                # raises the error of the datastore for the missing user
+                self.datastore.get(FullQualifiedId(Collection("user"), user_id))
+
+        management_level_fields = {
+            f"committee_${committee_id}_management_level"
+            for user in users.values()
+            for committee_id in user.get("committee_$_management_level", [])
+        }
+        if management_level_fields:
+            management_levels = self.datastore.get_many(
+                [GetManyRequest(Collection("user"), user_ids, management_level_fields)]
+            ).get(Collection("user"), {})
+            for user_id, user in users.items():
+                user.update(management_levels.get(user_id, {}))
+        return users
 
-    def get_committees_data(self, user_id: int) -> List[Dict[str, Any]]:
-        committees_data = []
-        user = self.datastore.get(
-            FullQualifiedId(Collection("user"), user_id),
-            ["committee_ids", "committee_$_management_level"],
-        )
-        if not user.get("committee_ids"):
-            return []
-        gmr = GetManyRequest(
-            Collection("committee"), user["committee_ids"], ["id", "name"]
-        )
-        committees = (
-            self.datastore.get_many([gmr]).get(Collection("committee"), {}).values()
-        )
-        user2 = self.datastore.get(
-            FullQualifiedId(Collection("user"), user_id),
+    def get_committees_data(
+        self, users: Dict[int, Dict[str, Any]]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        committees = self.datastore.get_many(
             [
-                "committee_${}_management_level".format(committee_id)
-                for committee_id in user.get("committee_$_management_level", [])
-            ],
-        )
-        for committee in committees:
-            committees_data.append(
-                {
-                    "id": committee["id"],
-                    "name": committee.get("name", ""),
-                    "cml": user2.get(
-                        f"committee_${committee['id']}_management_level", ""
+                GetManyRequest(
+                    Collection("committee"),
+                    sorted(
+                        {
+                            committee_id
+                            for user in users.values()
+                            for committee_id in user.get("committee_ids") or []
+                        }
                     ),
+                    ["id", "name"],
+                )
+            ]
+        ).get(Collection("committee"), {})
+        committees_data: Dict[int, List[Dict[str, Any]]] = {}
+        for user_id, user in users.items():
+            committees_data[user_id] = [
+                {
+                    "id": committee_id,
+                    "name": committees[committee_id].get("name", ""),
+                    "cml": user.get(f"committee_${committee_id}_management_level", ""),
                 }
-            )
+                for committee_id in user.get("committee_ids") or []
+                if committee_id in committees
+            ]
         return committees_data
 
-    def get_meetings_data(self, user_id: int) -> List[Dict[str, Any]]:
-        meetings_data = []
-        user = self.datastore.get(
-            FullQualifiedId(Collection("user"), user_id), ["meeting_ids"]
-        )
-        if not user.get("meeting_ids"):
-            return []
-        gmr = GetManyRequest(
-            Collection("meeting"),
-            user["meeting_ids"],
-            ["id", "name", "is_active_in_organization_id"],
-        )
-        meetings = (
-            self.datastore.get_many([gmr]).get(Collection("meeting"), {}).values()
-        )
-        for meeting in meetings:
-            filter_ = And(
-                FilterOperator("meeting_id", "=", meeting["id"]),
-                FilterOperator("user_id", "=", user_id),
-            )
-            submitter_ids = self.datastore.filter(
-                Collection("motion_submitter"), filter_
-            )
-            candidate_ids = self.datastore.filter(
-                Collection("assignment_candidate"), filter_
-            )
-            speaker_ids = self.datastore.filter(Collection("speaker"), filter_)
-            if submitter_ids or candidate_ids or speaker_ids:
-                meetings_data.append(
-                    {
-                        "id": meeting["id"],
-                        "name": meeting.get("name"),
-                        "is_active_in_organization_id": meeting.get(
-                            "is_active_in_organization_id"
-                        ),
-                        "submitter_ids": list(submitter_ids),
-                        "candidate_ids": list(candidate_ids),
-                        "speaker_ids": list(speaker_ids),
-                    }
+    def get_meetings_data(
+        self, users: Dict[int, Dict[str, Any]]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        meetings = self.datastore.get_many(
+            [
+                GetManyRequest(
+                    Collection("meeting"),
+                    sorted(
+                        {
+                            meeting_id
+                            for user in users.values()
+                            for meeting_id in user.get("meeting_ids") or []
+                        }
+                    ),
+                    ["id", "name", "is_active_in_organization_id"],
                 )
+            ]
+        ).get(Collection("meeting"), {})
+        related_ids = {
+            field: self.get_related_ids(collection, list(users))
+            for field, collection in (
+                ("submitter_ids", "motion_submitter"),
+                ("candidate_ids", "assignment_candidate"),
+                ("speaker_ids", "speaker"),
+            )
+        }
+        meetings_data: Dict[int, List[Dict[str, Any]]] = {}
+        for user_id, user in users.items():
+            meetings_data[user_id] = []
+            for meeting_id in user.get("meeting_ids") or []:
+                if meeting_id not in meetings:
+                    continue
+                ids = {
+                    field: related_ids[field].get((user_id, meeting_id), [])
+                    for field in related_ids
+                }
+                if any(ids.values()):
+                    meeting = meetings[meeting_id]
+                    meetings_data[user_id].append(
+                        {
+                            "id": meeting_id,
+                            "name": meeting.get("name"),
+                            "is_active_in_organization_id": meeting.get(
+                                "is_active_in_organization_id"
+                            ),
+                            **ids,
+                        }
+                    )
         return meetings_data
+
+    def get_related_ids(
+        self, collection: str, user_ids: List[int]
+    ) -> Dict[Tuple[int, int], List[int]]:
+        """
+        Returns the ids of all models of the collection which belong to one of the
+        users, grouped by user and meeting. The users are queried in chunks of
+        FILTER_CHUNK_SIZE with one filter each.
+        """
+        related_ids: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for i in range(0, len(user_ids), FILTER_CHUNK_SIZE):
+            operators = [
+                FilterOperator("user_id", "=", user_id)
+                for user_id in user_ids[i : i + FILTER_CHUNK_SIZE]
+            ]
+            models = self.datastore.filter(
+                Collection(collection),
+                operators[0] if len(operators) == 1 else Or(*operators),
+                ["user_id", "meeting_id"],
+                lock_result=False,
+            )
+            for id, model in sorted(models.items()):
+                related_ids[(model["user_id"], model["meeting_id"])].append(id)
+        return related_ids
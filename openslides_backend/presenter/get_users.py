@@ -1,4 +1,3 @@
-from operator import itemgetter
 from typing import Any, Dict, List
 
 import fastjsonschema
@@ -11,6 +10,13 @@ from ..shared.patterns import Collection
 from ..shared.schema import schema_version
 from .base import BasePresenter
 from .presenter import register_presenter
+from .sorted_user_index import (
+    FILTER_FIELDS,
+    SortedUserIndex,
+    get_sorted_user_index,
+    get_user_index_version,
+    store_sorted_user_index,
+)
 
 get_users_schema = fastjsonschema.compile(
     {
@@ -64,11 +70,14 @@ class GetUsers(BasePresenter):
     def get_result(self) -> Any:
         self.check_permissions()
         criteria = self.get_and_check_criteria()
-        users = self.get_all_users(criteria)
-        users = self.filter_keyword(users)
-        users = self.sort_users(users, criteria)
-        users = self.paginate_users(users)
-        return {"users": [user["id"] for user in users]}
+        index = self.get_index(criteria)
+        return {
+            "users": index.get_page(
+                self.data.get("start_index", 0),
+                self.data.get("entries", 100),
+                self.data.get("filter"),
+            )
+        }
 
     def check_permissions(self) -> None:
         if not has_organization_management_level(
@@ -85,47 +94,37 @@ class GetUsers(BasePresenter):
             raise PresenterException(f"Sort criteria '{not_allowed}' are not allowed")
         return criteria
 
-    def get_all_users(self, criteria: List[str]) -> List[Dict[str, Any]]:
+    def get_index(self, criteria: List[str]) -> SortedUserIndex:
+        """
+        Returns the sorted index for the criteria from the worker. It is only built
+        from all users if the users changed since it was built.
+        """
+        reverse = self.data.get("reverse", False)
+        key = (tuple(criteria), reverse)
+        version = get_user_index_version(self.datastore)
+        if index := get_sorted_user_index(key, version):
+            return index
+        index = SortedUserIndex(
+            self.get_all_users(criteria),
+            lambda user: tuple(
+                ALLOWED[crit] if user.get(crit) is None else user[crit]
+                for crit in criteria
+            ),
+            reverse,
+            version,
+        )
+        store_sorted_user_index(key, index)
+        return index
+
+    def get_all_users(self, criteria: List[str]) -> Dict[int, Dict[str, Any]]:
         fields = criteria[:]
-        for name in ("username", "first_name", "last_name", "id"):
+        for name in FILTER_FIELDS:
             if name not in fields:
                 fields.append(name)
 
-        return list(
-            self.datastore.get_all(
-                Collection("user"),
-                fields,
-                DeletedModelsBehaviour.NO_DELETED,
-            ).values()
+        return self.datastore.get_all(
+            Collection("user"),
+            fields,
+            DeletedModelsBehaviour.NO_DELETED,
+            lock_result=False,
         )
-
-    def _check_name(self, user: Dict[str, Any], name: str) -> bool:
-        return user.get(name) is not None and self.data["filter"] in user[name]
-
-    def filter_keyword(self, users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        if self.data.get("filter"):
-            users = [
-                user
-                for user in users
-                if self._check_name(user, "username")
-                or self._check_name(user, "first_name")
-                or self._check_name(user, "last_name")
-            ]
-        return users
-
-    def sort_users(
-        self, users: List[Dict[str, Any]], criteria: List[str]
-    ) -> List[Dict[str, Any]]:
-        for user in users:
-            for crit in criteria:
-                if user.get(crit) is None:
-                    user[crit] = ALLOWED[crit]
-
-        users.sort(key=itemgetter(*criteria), reverse=self.data.get("reverse", False))
-        return users
-
-    def paginate_users(self, users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        start_index = self.data.get("start_index", 0)
-        end_index = start_index + self.data.get("entries", 100)
-        users = users[start_index:end_index]
-        return users
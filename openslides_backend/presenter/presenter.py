@@ -1,9 +1,11 @@
-from typing import Callable, Dict, Optional, Tuple, Type
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple, Type
 
 import fastjsonschema
 from fastjsonschema import JsonSchemaException
 
 from ..http.request import Request
+from ..services.datastore.commands import GetManyRequest
 from ..shared.exceptions import PresenterException
 from ..shared.handlers.base_handler import BaseHandler
 from ..shared.schema import schema_version
@@ -120,8 +122,8 @@ class PresenterHandler(BaseHandler):
                 request.headers, request.cookies
             )
 
-        response = []
-        for PresenterClass in presenters:
+        presenter_instances = []
+        for PresenterClass, presenter_blob in zip(presenters, request.json):
             presenter_instance = PresenterClass(
                 presenter_blob.get("data"),
                 self.services,
@@ -130,8 +132,39 @@ class PresenterHandler(BaseHandler):
                 user_id,
             )
             presenter_instance.validate()
-            with self.datastore.get_database_context():
-                result = presenter_instance.get_result()
-            response.append(result)
+            presenter_instances.append(presenter_instance)
+
+        response = []
+        with self.datastore.get_database_context():
+            self.prefetch(presenter_instances)
+            for presenter_blob, presenter_instance in zip(
+                request.json, presenter_instances
+            ):
+                start = perf_counter()
+                response.append(presenter_instance.get_result())
+                self.logger.debug(
+                    f"Presenter {presenter_blob['presenter']} took "
+                    f"{(perf_counter() - start) * 1000:.2f} ms."
+                )
+        self.logger.debug(
+            f"Model cache of the datastore had {self.datastore.cache_hits} hits and "
+            f"{self.datastore.cache_misses} misses."
+        )
         self.logger.debug("Presenter data ready.")
         return response, access_token
+
+    def prefetch(self, presenter_instances: List[BasePresenter]) -> None:
+        """
+        Loads the declared reads of all presenters with one get_many request into the
+        model cache of the datastore, which is shared by all presenters.
+        """
+        get_many_requests: List[GetManyRequest] = []
+        for presenter_instance in presenter_instances:
+            get_many_requests.extend(presenter_instance.get_prefetch_requests())
+        if get_many_requests:
+            start = perf_counter()
+            self.datastore.get_many(get_many_requests, lock_result=False)
+            self.logger.debug(
+                f"Prefetched reads of {len(presenter_instances)} presenters in "
+                f"{(perf_counter() - start) * 1000:.2f} ms."
+            )
@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Union
+from collections import defaultdict
+from typing import Any, Dict, List, Set, Union
 
 import fastjsonschema
 
@@ -14,12 +15,17 @@ from ..permissions.permission_helper import (
 )
 from ..permissions.permissions import Permissions
 from ..shared.exceptions import MissingPermission, PresenterException
-from ..shared.filters import Filter, FilterOperator, Or
+from ..shared.filters import FilterOperator, Or
 from ..shared.patterns import Collection, FullQualifiedId
 from ..shared.schema import schema_version
 from .base import BasePresenter
 from .presenter import register_presenter
 
+# maximum number of values which are combined into one filter request
+SEARCH_CHUNK_SIZE = 500
+
+RESULT_FIELDS = ["id", "first_name", "last_name", "email"]
+
 search_users_by_name_or_email_schema = fastjsonschema.compile(
     {
         "$schema": schema_version,
@@ -63,31 +69,67 @@ class SearchUsersByNameEmail(BasePresenter):
 
     def get_result(self) -> Any:
         self.check_permissions(self.data["permission_type"], self.data["permission_id"])
+        searches = [
+            (search.get("username", ""), search.get("email", ""))
+            for search in self.data["search"]
+        ]
+        users = self.get_users(
+            {username for username, _ in searches if username},
+            {email for _, email in searches if email},
+        )
+        ids_by_field: Dict[str, Dict[str, Set[int]]] = {
+            "username": defaultdict(set),
+            "email": defaultdict(set),
+        }
+        for id, user in users.items():
+            for field, ids_by_value in ids_by_field.items():
+                if user.get(field):
+                    ids_by_value[user[field]].add(id)
+
         result: Dict[str, List[Dict[str, Union[str, int]]]] = {}
-        for search in self.data["search"]:
-            username = search.get("username", "")
-            email = search.get("email", "")
-            filter_: Filter
-            if username and email:
-                filter_ = Or(
-                    FilterOperator("username", "=", username),
-                    FilterOperator("email", "=", email),
-                )
-            elif username:
-                filter_ = FilterOperator("username", "=", username)
-            elif email:
-                filter_ = FilterOperator("email", "=", email)
-            else:
+        for username, email in searches:
+            if not username and not email:
                 continue
-            instances = self.datastore.filter(
-                Collection("user"), filter_, ["id", "first_name", "last_name", "email"]
-            )
-
+            ids: Set[int] = set()
+            if username:
+                ids.update(ids_by_field["username"].get(username, ()))
+            if email:
+                ids.update(ids_by_field["email"].get(email, ()))
             result[f"{username}/{email}"] = [
-                instance for instance in instances.values()
+                {
+                    field: users[id][field]
+                    for field in RESULT_FIELDS
+                    if field in users[id]
+                }
+                for id in sorted(ids)
             ]
         return result
 
+    def get_users(
+        self, usernames: Set[str], emails: Set[str]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Returns all users with one of the usernames or emails. The values are combined
+        into filters of at most SEARCH_CHUNK_SIZE values each.
+        """
+        operators = [
+            FilterOperator(field, "=", value)
+            for field, values in (("username", usernames), ("email", emails))
+            for value in sorted(values)
+        ]
+        users: Dict[int, Dict[str, Any]] = {}
+        for i in range(0, len(operators), SEARCH_CHUNK_SIZE):
+            chunk = operators[i : i + SEARCH_CHUNK_SIZE]
+            users.update(
+                self.datastore.filter(
+                    Collection("user"),
+                    chunk[0] if len(chunk) == 1 else Or(*chunk),
+                    RESULT_FIELDS + ["username"],
+                    lock_result=False,
+                )
+            )
+        return users
+
     def check_permissions(self, permission_type: int, permission_id: int) -> None:
         if has_organization_management_level(
             self.datastore, self.user_id, OrganizationManagementLevel.CAN_MANAGE_USERS
@@ -0,0 +1,95 @@
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from ..services.datastore.interface import DatastoreService
+from ..shared.filters import FilterOperator
+from ..shared.patterns import Collection
+
+FILTER_FIELDS = ("username", "first_name", "last_name")
+
+# maximum number of indexes which are kept in the worker, the least recently used
+# one is dropped first
+MAX_INDEXES = 16
+
+# the number of users and the highest position of a user, each change of the users
+# changes at least one of them
+UserIndexVersion = Tuple[int, Optional[int]]
+
+
+class SortedUserIndex:
+    """
+    The ids of all users in the order of one sort key, together with the fields the
+    keyword filter of get_users searches in. The index is kept in the worker across
+    requests and validated against the datastore on every use, so a page request only
+    costs two aggregate queries and the page itself.
+    """
+
+    ids: List[int]
+    names: List[Tuple[Optional[str], ...]]
+
+    def __init__(
+        self,
+        users: Dict[int, Dict[str, Any]],
+        sort_key: Callable[[Dict[str, Any]], Any],
+        reverse: bool,
+        version: UserIndexVersion,
+    ) -> None:
+        # users with equal sort keys are ordered by id in both directions
+        entries = sorted(users.items())
+        entries.sort(key=lambda entry: sort_key(entry[1]), reverse=reverse)
+        self.ids = [id for id, _ in entries]
+        self.names = [
+            tuple(user.get(field) for field in FILTER_FIELDS) for _, user in entries
+        ]
+        self.version = version
+
+    def get_page(
+        self, start_index: int, entries: int, keyword: Optional[str] = None
+    ) -> List[int]:
+        """
+        Returns the ids of the requested page. If a keyword is given, only users whose
+        username, first_name or last_name contain it are counted.
+        """
+        if not keyword:
+            return self.ids[start_index : start_index + entries]
+        matches = (
+            id
+            for id, names in zip(self.ids, self.names)
+            if any(name is not None and keyword in name for name in names)
+        )
+        if start_index < 0 or entries < 0:
+            # negative indices count from the end of all matches
+            return list(matches)[start_index : start_index + entries]
+        return list(islice(matches, start_index, start_index + entries))
+
+
+sorted_user_indexes: "OrderedDict[Hashable, SortedUserIndex]" = OrderedDict()
+
+
+def get_user_index_version(datastore: DatastoreService) -> UserIndexVersion:
+    filter_ = FilterOperator("id", ">", 0)
+    return (
+        datastore.count(Collection("user"), filter_, lock_result=False),
+        datastore.max(Collection("user"), filter_, "meta_position", lock_result=False),
+    )
+
+
+def get_sorted_user_index(
+    key: Hashable, version: UserIndexVersion
+) -> Optional[SortedUserIndex]:
+    """
+    Returns the index stored under the given key if it is still valid.
+    """
+    index = sorted_user_indexes.get(key)
+    if index is None or index.version != version:
+        return None
+    sorted_user_indexes.move_to_end(key)
+    return index
+
+
+def store_sorted_user_index(key: Hashable, index: SortedUserIndex) -> None:
+    sorted_user_indexes[key] = index
+    sorted_user_indexes.move_to_end(key)
+    while len(sorted_user_indexes) > MAX_INDEXES:
+        sorted_user_indexes.popitem(last=False)
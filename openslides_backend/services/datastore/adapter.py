@@ -4,6 +4,7 @@ from typing import (
     Any,
     ContextManager,
     Dict,
+    Hashable,
     List,
     Optional,
     Sequence,
@@ -56,6 +57,38 @@ from .interface import (
 DatastoreResponse = Any
 
 
+class ModelCacheEntry:
+    """
+    Holds the already read fields of one model together with the position they were
+    read at. An empty set of mapped fields always denotes the full model.
+    """
+
+    def __init__(self, position: int) -> None:
+        self.position = position
+        self.data: PartialModel = {}
+        self.fields: Set[str] = set()
+        self.complete = False
+
+    def covers(self, mapped_fields: Set[str]) -> bool:
+        return self.complete or (bool(mapped_fields) and mapped_fields <= self.fields)
+
+    def update(self, mapped_fields: Set[str], model: PartialModel) -> None:
+        if mapped_fields:
+            self.fields.update(mapped_fields)
+        else:
+            self.complete = True
+        self.data.update(deepcopy(model))
+
+    def extract(self, mapped_fields: Set[str]) -> PartialModel:
+        if not mapped_fields:
+            return deepcopy(self.data)
+        return {
+            field_name: deepcopy(self.data[field_name])
+            for field_name in mapped_fields
+            if field_name in self.data
+        }
+
+
 class DatastoreAdapter(DatastoreService):
     """
     Adapter to connect to readable and writeable datastore.
@@ -68,13 +101,43 @@ class DatastoreAdapter(DatastoreService):
     additional_relation_models: ModelMap
     additional_relation_model_locks: Dict[FullQualifiedId, int]
 
-    def __init__(self, engine: Engine, logging: LoggingModule) -> None:
+    # Request-scoped cache of all models read from the datastore. Since the datastore
+    # does not change during a request (apart from our own write), all reads of the
+    # current position can be served from here. Changed models are detected by the
+    # locked fields on write.
+    model_cache: Dict[FullQualifiedId, ModelCacheEntry]
+    cache_hits: int
+    cache_misses: int
+
+    # Values which are computed from the content of the model cache, e.g. resolved
+    # permissions. It is always cleared together with the model cache.
+    request_cache: Dict[Hashable, Any]
+
+    # Ids which were already reserved in the datastore, but not yet used. They are
+    # handed out by reserve_ids before new ids are requested. New ids are always
+    # requested in blocks of at least id_block_size ids, so that subsequent calls
+    # can be served without a round trip to the datastore. Ids which are left over
+    # at the end of the request are wasted.
+    reserved_ids: Dict[Collection, List[int]]
+    id_block_size: int
+    reserve_round_trips: int
+
+    def __init__(
+        self, engine: Engine, logging: LoggingModule, id_block_size: int = 1
+    ) -> None:
         self.logger = logging.getLogger(__name__)
         self.engine = engine
         self.reader = injector.get(Reader)
         self.locked_fields = {}
         self.additional_relation_models = defaultdict(dict)
         self.additional_relation_model_locks = {}
+        self.model_cache = {}
+        self.request_cache = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.reserved_ids = defaultdict(list)
+        self.id_block_size = max(id_block_size, 1)
+        self.reserve_round_trips = 0
 
     def retrieve(self, command: commands.Command) -> DatastoreResponse:
         """
@@ -115,16 +178,19 @@ class DatastoreAdapter(DatastoreService):
             mapped_fields_set.update(mapped_fields)
             if lock_result:
                 mapped_fields_set.add("meta_position")
-        request = GetRequest(
-            fqid=str(fqid),
-            mapped_fields=list(mapped_fields_set),
-            position=position,
-            get_deleted_models=get_deleted_models,
-        )
-        self.logger.debug(
-            f"Start GET request to datastore with the following data: {request}"
-        )
-        response = self.reader.get(request)
+        if self.is_cacheable(position, get_deleted_models):
+            response = self.get_cached(fqid, mapped_fields_set)
+        else:
+            request = GetRequest(
+                fqid=str(fqid),
+                mapped_fields=list(mapped_fields_set),
+                position=position,
+                get_deleted_models=get_deleted_models,
+            )
+            self.logger.debug(
+                f"Start GET request to datastore with the following data: {request}"
+            )
+            response = self.reader.get(request)
         if lock_result:
             instance_position = response.get("meta_position")
             if not isinstance(instance_position, int):
@@ -151,17 +217,22 @@ class DatastoreAdapter(DatastoreService):
                 if get_many_request.mapped_fields is not None:
                     get_many_request.mapped_fields.add("meta_position")
 
-        request_parts = [
-            GetManyRequestPart(
-                str(gmr.collection), gmr.ids, list(gmr.mapped_fields or [])
+        if self.is_cacheable(position, get_deleted_models):
+            response = self.get_many_cached(get_many_requests)
+        else:
+            request_parts = [
+                GetManyRequestPart(
+                    str(gmr.collection), gmr.ids, list(gmr.mapped_fields or [])
+                )
+                for gmr in get_many_requests
+            ]
+            request = FullGetManyRequest(
+                request_parts, [], position, get_deleted_models
             )
-            for gmr in get_many_requests
-        ]
-        request = FullGetManyRequest(request_parts, [], position, get_deleted_models)
-        self.logger.debug(
-            f"Start GET_MANY request to datastore with the following data: {request}"
-        )
-        response = self.reader.get_many(request)
+            self.logger.debug(
+                f"Start GET_MANY request to datastore with the following data: {request}"
+            )
+            response = self.reader.get_many(request)
         result: Dict[Collection, Dict[int, PartialModel]] = defaultdict(dict)
         for get_many_request in get_many_requests:
             collection = get_many_request.collection
@@ -185,6 +256,146 @@ class DatastoreAdapter(DatastoreService):
                 result[collection][instance_id] = value
         return result
 
+    def is_cacheable(
+        self, position: Optional[int], get_deleted_models: DeletedModelsBehaviour
+    ) -> bool:
+        """
+        Only reads of the current position which exclude deleted models are cached.
+        """
+        return (
+            position is None and get_deleted_models == DeletedModelsBehaviour.NO_DELETED
+        )
+
+    def get_cached(
+        self, fqid: FullQualifiedId, mapped_fields: Set[str]
+    ) -> PartialModel:
+        """
+        Returns the given fields of the model from the model cache. Only the fields
+        which were not read before are fetched from the datastore.
+        """
+        entry = self.model_cache.get(fqid)
+        if entry and entry.covers(mapped_fields):
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+            missing_fields = (
+                mapped_fields - entry.fields
+                if entry and mapped_fields
+                else mapped_fields
+            )
+            entry = self.fetch_into_cache(fqid, missing_fields)
+            if not entry.covers(mapped_fields):
+                # the model changed since it was cached, so all fields have to be read again
+                entry = self.fetch_into_cache(fqid, mapped_fields)
+        return entry.extract(mapped_fields)
+
+    def fetch_into_cache(
+        self, fqid: FullQualifiedId, mapped_fields: Set[str]
+    ) -> ModelCacheEntry:
+        request = GetRequest(
+            fqid=str(fqid),
+            mapped_fields=list(mapped_fields | {"meta_position"})
+            if mapped_fields
+            else [],
+            position=None,
+            get_deleted_models=DeletedModelsBehaviour.NO_DELETED,
+        )
+        self.logger.debug(
+            f"Start GET request to datastore with the following data: {request}"
+        )
+        response = self.reader.get(request)
+        return self.store_in_cache(fqid, mapped_fields, response)
+
+    def get_many_cached(
+        self, get_many_requests: List[commands.GetManyRequest]
+    ) -> Dict[str, Dict[int, PartialModel]]:
+        """
+        Returns the requested models in the same format as the reader does. All models
+        which are not (sufficiently) cached are fetched with one get_many request.
+        """
+        response: Dict[str, Dict[int, PartialModel]] = defaultdict(dict)
+        missing: List[Tuple[Collection, int, Set[str]]] = []
+        missing_fields: Dict[Collection, Set[str]] = {}
+        missing_complete: Set[Collection] = set()
+        for get_many_request in get_many_requests:
+            collection = get_many_request.collection
+            mapped_fields = set(get_many_request.mapped_fields or ())
+            for instance_id in get_many_request.ids:
+                entry = self.model_cache.get(FullQualifiedId(collection, instance_id))
+                if entry and entry.covers(mapped_fields):
+                    self.cache_hits += 1
+                    response[collection.collection][instance_id] = entry.extract(
+                        mapped_fields
+                    )
+                else:
+                    self.cache_misses += 1
+                    missing.append((collection, instance_id, mapped_fields))
+                    if mapped_fields:
+                        missing_fields.setdefault(collection, set()).update(
+                            mapped_fields
+                        )
+                    else:
+                        missing_complete.add(collection)
+        if not missing:
+            return response
+
+        # request all missing models at once, partitioned by collection
+        missing_ids: Dict[Collection, Set[int]] = defaultdict(set)
+        for collection, instance_id, _ in missing:
+            missing_ids[collection].add(instance_id)
+        fields_per_collection: Dict[Collection, Set[str]] = {
+            collection: set()
+            if collection in missing_complete
+            else missing_fields[collection] | {"meta_position"}
+            for collection in missing_ids
+        }
+        request = FullGetManyRequest(
+            [
+                GetManyRequestPart(
+                    str(collection),
+                    sorted(ids),
+                    list(fields_per_collection[collection]),
+                )
+                for collection, ids in missing_ids.items()
+            ],
+            [],
+            None,
+            DeletedModelsBehaviour.NO_DELETED,
+        )
+        self.logger.debug(
+            f"Start GET_MANY request to datastore with the following data: {request}"
+        )
+        db_response = self.reader.get_many(request)
+        for collection, instance_id, mapped_fields in missing:
+            model = db_response.get(collection.collection, {}).get(instance_id)
+            if model is None:
+                continue
+            fqid = FullQualifiedId(collection, instance_id)
+            entry = self.store_in_cache(fqid, fields_per_collection[collection], model)
+            response[collection.collection][instance_id] = entry.extract(mapped_fields)
+        return response
+
+    def store_in_cache(
+        self, fqid: FullQualifiedId, mapped_fields: Set[str], model: PartialModel
+    ) -> ModelCacheEntry:
+        """
+        Merges the given fields into the cache entry of the model. If the model was
+        changed since the entry was created, the entry is replaced.
+        """
+        position = model.get("meta_position")
+        if not isinstance(position, int):
+            raise DatastoreException(
+                "Response from datastore contains invalid 'meta_position'."
+            )
+        entry = self.model_cache.get(fqid)
+        if entry is None or entry.position != position:
+            entry = ModelCacheEntry(position)
+            self.model_cache[fqid] = entry
+        entry.update(
+            mapped_fields | {"meta_position"} if mapped_fields else set(), model
+        )
+        return entry
+
     @handle_datastore_errors
     def get_all(
         self,
@@ -445,16 +656,33 @@ class DatastoreAdapter(DatastoreService):
             self.additional_relation_model_locks[fqid] = new_value
 
     def reserve_ids(self, collection: Collection, amount: int) -> Sequence[int]:
+        self.reserve_ids_in_advance(collection, amount)
+        reserved_ids = self.reserved_ids[collection]
+        ids = reserved_ids[:amount]
+        del reserved_ids[:amount]
+        return ids
+
+    def reserve_id(self, collection: Collection) -> int:
+        return self.reserve_ids(collection=collection, amount=1)[0]
+
+    def reserve_ids_in_advance(self, collection: Collection, amount: int) -> None:
+        """
+        Makes sure that at least the given amount of ids of the collection is
+        reserved, so that they can be handed out by reserve_ids later on without
+        another request to the datastore.
+        """
+        reserved_ids = self.reserved_ids[collection]
+        if (missing := amount - len(reserved_ids)) <= 0:
+            return
+        amount = max(missing, self.id_block_size)
         command = commands.ReserveIds(collection=collection, amount=amount)
         self.logger.debug(
             f"Start RESERVE_IDS request to datastore with the following data: "
             f"Collection: {collection}, Amount: {amount}"
         )
         response = self.retrieve(command)
-        return response.get("ids")
-
-    def reserve_id(self, collection: Collection) -> int:
-        return self.reserve_ids(collection=collection, amount=1)[0]
+        self.reserve_round_trips += 1
+        reserved_ids.extend(response.get("ids"))
 
     def write(self, write_requests: Union[List[WriteRequest], WriteRequest]) -> None:
         if isinstance(write_requests, WriteRequest):
@@ -464,11 +692,15 @@ class DatastoreAdapter(DatastoreService):
             f"Start WRITE request to datastore with the following data: "
             f"Write request: {write_requests}"
         )
+        self.clear_cache()
         self.retrieve(command)
 
     def truncate_db(self) -> None:
         command = commands.TruncateDb()
         self.logger.debug("Start TRUNCATE_DB request to datastore")
+        self.clear_cache()
+        # the id sequences are reset, so the reserved ids are not valid anymore
+        self.reserved_ids.clear()
         self.retrieve(command)
 
     def update_additional_models(
@@ -604,5 +836,11 @@ class DatastoreAdapter(DatastoreService):
         return isinstance(self.additional_relation_models.get(fqid), DeletedModel)
 
     def reset(self) -> None:
+        # reserved ids are kept since they can still be used after a retry
         self.locked_fields = {}
         self.additional_relation_models.clear()
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        self.model_cache.clear()
+        self.request_cache.clear()
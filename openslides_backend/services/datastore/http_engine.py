@@ -3,6 +3,7 @@ from typing import Optional, Tuple, Union
 import requests
 
 from ...shared.exceptions import DatastoreConnectionException
+from ...shared.http_session import HTTPSession
 from ...shared.interfaces.logging import LoggingModule
 
 
@@ -27,11 +28,13 @@ class HTTPEngine:
         self,
         datastore_reader_url: str,
         datastore_writer_url: str,
+        writer_session: HTTPSession,
         logging: LoggingModule,
     ):
         self.logger = logging.getLogger(__name__)
         self.datastore_reader_url = datastore_reader_url
         self.datastore_writer_url = datastore_writer_url
+        self.writer_session = writer_session
         self.headers = {"Content-Type": "application/json"}
 
     def retrieve(
@@ -53,8 +56,13 @@ class HTTPEngine:
         url = "/".join((base_url, endpoint))
 
         try:
-            response = requests.post(url=url, data=data, headers=self.headers)
-        except requests.exceptions.ConnectionError as e:
+            if endpoint in self.WRITER_ENDPOINTS:
+                response = self.writer_session.post(
+                    url=url, data=data, headers=self.headers
+                )
+            else:
+                response = requests.post(url=url, data=data, headers=self.headers)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
             error_message = f"Cannot reach the datastore service on {url}. Error: {e}"
             raise DatastoreConnectionException(error_message)
         return response.content, response.status_code
@@ -3,6 +3,7 @@ from typing import (
     Any,
     ContextManager,
     Dict,
+    Hashable,
     List,
     Optional,
     Protocol,
@@ -15,9 +16,17 @@ from datastore.shared.services.read_database import HistoryInformation
 from datastore.shared.util import DeletedModelsBehaviour
 
 from ...shared.filters import Filter
-from ...shared.interfaces.collection_field_lock import CollectionFieldLock
+from ...shared.interfaces.collection_field_lock import (
+    CollectionFieldLock,
+    CollectionFieldLockWithFilter,
+)
 from ...shared.interfaces.write_request import WriteRequest
-from ...shared.patterns import Collection, FullQualifiedId
+from ...shared.patterns import (
+    Collection,
+    CollectionField,
+    FullQualifiedField,
+    FullQualifiedId,
+)
 from ...shared.typing import ModelMap
 from .commands import GetManyRequest
 
@@ -43,6 +52,19 @@ class DatastoreService(Protocol):
     locked_fields: Dict[str, CollectionFieldLock]
     additional_relation_models: ModelMap
 
+    # Statistics of the request-scoped model cache
+    cache_hits: int
+    cache_misses: int
+
+    # Request-scoped storage for values computed from the datastore content
+    request_cache: Dict[Hashable, Any]
+
+    # Ids which were reserved in advance but not used yet, the minimal number of ids
+    # reserved per RESERVE_IDS request and the number of such requests
+    reserved_ids: Dict[Collection, List[int]]
+    id_block_size: int
+    reserve_round_trips: int
+
     def get_database_context(self) -> ContextManager[None]:
         ...
 
@@ -130,12 +152,22 @@ class DatastoreService(Protocol):
     ) -> Dict[str, List[HistoryInformation]]:
         ...
 
+    def update_locked_fields(
+        self,
+        key: Union[FullQualifiedId, FullQualifiedField, CollectionField],
+        lock: Union[int, CollectionFieldLockWithFilter],
+    ) -> None:
+        ...
+
     def reserve_ids(self, collection: Collection, amount: int) -> Sequence[int]:
         ...
 
     def reserve_id(self, collection: Collection) -> int:
         ...
 
+    def reserve_ids_in_advance(self, collection: Collection, amount: int) -> None:
+        ...
+
     def write(self, write_requests: Union[List[WriteRequest], WriteRequest]) -> None:
         ...
 
@@ -3,6 +3,7 @@ from typing import Any, Dict
 import requests
 
 from ...shared.exceptions import MediaServiceException
+from ...shared.http_session import HTTPSession
 from ...shared.interfaces.logging import LoggingModule
 from .interface import MediaService
 
@@ -12,9 +13,12 @@ class MediaServiceAdapter(MediaService):
     Adapter to connect to media service.
     """
 
-    def __init__(self, media_url: str, logging: LoggingModule) -> None:
+    def __init__(
+        self, media_url: str, session: HTTPSession, logging: LoggingModule
+    ) -> None:
         self.logger = logging.getLogger(__name__)
         self.media_url = media_url + "/"
+        self.session = session
 
     def _upload(self, file: str, id: int, mimetype: str, subpath: str) -> None:
         url = self.media_url + subpath + "/"
@@ -41,8 +45,8 @@ class MediaServiceAdapter(MediaService):
         self, url: str, payload: Dict[str, Any], description: str
     ) -> None:
         try:
-            response = requests.post(url, json=payload)
-        except requests.exceptions.ConnectionError as e:
+            response = self.session.post(url, json=payload)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
             msg = f"Connect to mediaservice failed. {e}"
             self.logger.debug(description + msg)
             raise MediaServiceException(msg)
@@ -5,6 +5,7 @@ import requests
 from authlib import AUTHENTICATION_HEADER, COOKIE_NAME
 
 from ...shared.exceptions import VoteServiceException
+from ...shared.http_session import HTTPSession
 from ...shared.interfaces.logging import LoggingModule
 from ...shared.interfaces.wsgi import Headers
 from .interface import VoteService
@@ -15,8 +16,11 @@ class VoteAdapter(VoteService):
     Adapter to connect to the vote service.
     """
 
-    def __init__(self, vote_url: str, logging: LoggingModule) -> None:
+    def __init__(
+        self, vote_url: str, session: HTTPSession, logging: LoggingModule
+    ) -> None:
         self.url = vote_url
+        self.session = session
         self.logger = logging.getLogger(__name__)
 
     def retrieve(self, endpoint: str, payload: Optional[Dict[str, Any]] = None) -> Any:
@@ -37,7 +41,7 @@ class VoteAdapter(VoteService):
             raise VoteServiceException("You must be logged in to vote")
         payload_json = json.dumps(payload, separators=(",", ":")) if payload else None
         try:
-            return requests.post(
+            return self.session.post(
                 url=endpoint,
                 data=payload_json,
                 headers={
@@ -46,7 +50,7 @@ class VoteAdapter(VoteService):
                 },
                 cookies={COOKIE_NAME: self.cookie},
             )
-        except requests.exceptions.ConnectionError as e:
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
             self.logger.error(
                 f"Cannot reach the vote service on {endpoint}. Error: {e}"
             )
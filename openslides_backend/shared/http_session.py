@@ -0,0 +1,91 @@
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Optional, Tuple, TypedDict, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .interfaces.logging import LoggingModule
+
+HTTPSessionSettings = TypedDict(
+    "HTTPSessionSettings",
+    {
+        "pool_size": int,
+        "connect_timeout": float,
+        "read_timeout": Optional[float],
+        "retries": int,
+        "backoff_factor": float,
+    },
+)
+
+
+class HTTPSession(requests.Session):
+    """
+    Session which keeps a pool of keep-alive connections to one service, so that
+    subsequent requests do not have to open a new TCP connection each.
+
+    Only failed connection attempts are retried (with exponential backoff), since
+    the requests themselves are not idempotent.
+
+    The session is shared by the requests of all users, so cookies set by a service
+    are not stored. Cookies have to be given to each request explicitly.
+    """
+
+    def __init__(
+        self, name: str, settings: HTTPSessionSettings, logging: LoggingModule
+    ) -> None:
+        super().__init__()
+        self.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        self.name = name
+        self.logger = logging.getLogger(__name__)
+        self.timeout: Tuple[float, Optional[float]] = (
+            settings["connect_timeout"],
+            settings["read_timeout"],
+        )
+        retry = Retry(
+            total=settings["retries"],
+            connect=settings["retries"],
+            read=0,
+            redirect=0,
+            status=0,
+            backoff_factor=settings["backoff_factor"],
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=settings["pool_size"],
+            max_retries=retry,
+        )
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+    def request(
+        self, method: str, url: Union[str, bytes], *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        response = super().request(method, url, *args, **kwargs)
+        statistics = self.get_statistics()
+        self.logger.debug(
+            f"Connection pool of {self.name}: {statistics['reused_connections']} of "
+            f"{statistics['requests']} requests used an existing connection."
+        )
+        return response
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Returns the number of requests and of newly opened connections of all
+        connection pools of this session.
+        """
+        requests_count = 0
+        connections_count = 0
+        for adapter in set(self.adapters.values()):
+            pools = adapter.poolmanager.pools  # type: ignore
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is not None:
+                    requests_count += pool.num_requests
+                    connections_count += pool.num_connections
+        return {
+            "requests": requests_count,
+            "new_connections": connections_count,
+            "reused_connections": max(requests_count - connections_count, 0),
+        }
@@ -10,6 +10,7 @@ from .services.datastore.adapter import DatastoreAdapter
 from .services.datastore.http_engine import HTTPEngine
 from .services.media.adapter import MediaServiceAdapter
 from .services.vote.adapter import VoteAdapter
+from .shared.http_session import HTTPSession
 from .shared.interfaces.logging import LoggingModule
 from .shared.interfaces.wsgi import View, WSGIApplication
 
@@ -22,12 +23,29 @@ class OpenSlidesBackendServices(containers.DeclarativeContainer):
     config = providers.Configuration("config")
     logging = providers.Object(0)
     authentication = providers.Singleton(AuthenticationHTTPAdapter, logging)
-    media = providers.Singleton(MediaServiceAdapter, config.media_url, logging)
+    media_session = providers.Singleton(
+        HTTPSession, "media", config.media_session, logging
+    )
+    media = providers.Singleton(
+        MediaServiceAdapter, config.media_url, media_session, logging
+    )
+    datastore_writer_session = providers.Singleton(
+        HTTPSession, "datastore writer", config.datastore_writer_session, logging
+    )
     engine = providers.Singleton(
-        HTTPEngine, config.datastore_reader_url, config.datastore_writer_url, logging
+        HTTPEngine,
+        config.datastore_reader_url,
+        config.datastore_writer_url,
+        datastore_writer_session,
+        logging,
+    )
+    datastore = providers.Factory(
+        DatastoreAdapter, engine, logging, config.datastore_id_block_size
+    )
+    vote_session = providers.Singleton(
+        HTTPSession, "vote", config.vote_session, logging
     )
-    datastore = providers.Factory(DatastoreAdapter, engine, logging)
-    vote = providers.Singleton(VoteAdapter, config.vote_url, logging)
+    vote = providers.Singleton(VoteAdapter, config.vote_url, vote_session, logging)
 
 
 class OpenSlidesBackendWSGI(containers.DeclarativeContainer):
@@ -95,6 +95,34 @@ class ChatGroupCreate(BaseActionTestCase):
             "chat_group/3", {"name": "redekreis1", "meeting_id": 1, "weight": 11}
         )
 
+    def test_create_groups_from_different_meetings(self) -> None:
+        self.set_models(
+            {
+                "organization/1": {"enable_chat": True},
+                "meeting/1": {"enable_chat": True, "is_active_in_organization_id": 1},
+                "meeting/2": {},
+                "meeting/3": {},
+                "group/1": {"meeting_id": 1},
+                "group/2": {"meeting_id": 3},
+                "group/3": {"meeting_id": 1},
+                "group/4": {"meeting_id": 2},
+            }
+        )
+        response = self.request(
+            "chat_group.create",
+            {
+                "name": "redekreis1",
+                "meeting_id": 1,
+                "read_group_ids": [4, 1, 2, 3],
+            },
+        )
+        self.assert_status_code(response, 400)
+        assert (
+            "The following models do not belong to meeting 1: ['group/4', 'group/2']"
+            in response.json["message"]
+        )
+        self.assert_model_not_exists("chat_group/1")
+
     def test_create_group_from_different_meeting(self) -> None:
         self.set_models(
             {
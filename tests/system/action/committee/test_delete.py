@@ -51,6 +51,28 @@ class CommitteeDeleteActionTest(BaseActionTestCase):
         )
         self.assert_model_exists(self.COMMITTEE_FQID, {"meeting_ids": [22]})
 
+    def test_delete_protected_by_meetings(self) -> None:
+        self.create_data()
+        self.set_models(
+            {
+                "meeting/22": {"committee_id": self.COMMITTEE_ID},
+                "meeting/23": {"committee_id": self.COMMITTEE_ID},
+                "meeting/24": {"committee_id": self.COMMITTEE_ID},
+                "meeting/25": {"committee_id": self.COMMITTEE_ID},
+                self.COMMITTEE_FQID: {"meeting_ids": [22, 23, 24, 25]},
+            }
+        )
+
+        response = self.request("committee.delete", {"id": self.COMMITTEE_ID})
+
+        self.assert_status_code(response, 400)
+        assert (
+            "This committee has still meetings 22, 23, 24, ... Please remove all meetings before deletion."
+            in response.json["message"]
+        )
+        self.assert_model_exists(self.COMMITTEE_FQID, {"meeting_ids": [22, 23, 24, 25]})
+        self.assert_model_exists("meeting/22")
+
     def test_delete_no_permission(self) -> None:
         self.create_data()
         self.set_models(
@@ -160,3 +160,5 @@ def set_test_email_settings() -> None:
     EmailSettings.password = ""
     EmailSettings.accept_self_signed_certificate = False
     EmailSettings.default_from_email = "noreply@example.com"
+    EmailSettings.pool_size = 4
+    EmailSettings.rate_limit = 0
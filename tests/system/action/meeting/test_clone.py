@@ -1,6 +1,7 @@
 from typing import Any, Dict
 from unittest.mock import MagicMock
 
+from openslides_backend.action.actions.meeting.export_helper import export_meeting
 from openslides_backend.permissions.management_levels import CommitteeManagementLevel
 from tests.system.action.base import BaseActionTestCase
 
@@ -475,3 +476,16 @@ class MeetingClone(BaseActionTestCase):
             "Missing CommitteeManagementLevel: can_manage for committee 2",
             response.json["message"],
         )
+
+    def test_export_meeting(self) -> None:
+        self.set_models(self.test_models)
+        with self.datastore.get_database_context():
+            export = export_meeting(self.datastore, MagicMock(), 1)
+        self.assertEqual(list(export["meeting"].keys()), ["1"])
+        self.assertEqual(list(export["group"].keys()), ["1"])
+        self.assertEqual(export["tag"], {})
+        meeting = export["meeting"]["1"]
+        self.assertEqual(meeting["name"], "Test")
+        self.assertIsNone(meeting["welcome_title"])
+        self.assertNotIn("meta_position", meeting)
+        self.assertNotIn("meta_deleted", meeting)
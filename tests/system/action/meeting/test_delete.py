@@ -184,3 +184,56 @@ class MeetingDeleteActionTest(BaseActionTestCase):
                 "stable": False,
             },
         )
+
+    def test_delete_with_workflows_and_motions(self) -> None:
+        self.set_models(
+            {
+                "meeting/1": {
+                    "motions_default_workflow_id": 2,
+                    "motion_workflow_ids": [2],
+                    "motion_state_ids": [3],
+                    "motion_ids": [5],
+                    "is_active_in_organization_id": 1,
+                },
+                "motion_workflow/2": {
+                    "meeting_id": 1,
+                    "state_ids": [3],
+                    "first_state_id": 3,
+                    "default_workflow_meeting_id": 1,
+                },
+                "motion_state/3": {
+                    "workflow_id": 2,
+                    "first_state_of_workflow_id": 2,
+                    "meeting_id": 1,
+                    "motion_ids": [5],
+                },
+                "motion/5": {"meeting_id": 1, "state_id": 3},
+            }
+        )
+        response = self.request("meeting.delete", {"id": 1})
+        self.assert_status_code(response, 200)
+        self.assert_model_exists("committee/1", {"meeting_ids": []})
+        self.assert_model_deleted("meeting/1")
+        self.assert_model_deleted("motion_workflow/2")
+        self.assert_model_deleted("motion_state/3")
+        self.assert_model_deleted("motion/5")
+
+    def test_delete_with_reference_projector(self) -> None:
+        self.set_models(
+            {
+                "meeting/1": {
+                    "reference_projector_id": 3,
+                    "projector_ids": [3],
+                    "is_active_in_organization_id": 1,
+                },
+                "projector/3": {
+                    "meeting_id": 1,
+                    "used_as_reference_projector_meeting_id": 1,
+                },
+            }
+        )
+        response = self.request("meeting.delete", {"id": 1})
+        self.assert_status_code(response, 200)
+        self.assert_model_exists("committee/1", {"meeting_ids": []})
+        self.assert_model_deleted("meeting/1")
+        self.assert_model_deleted("projector/3")
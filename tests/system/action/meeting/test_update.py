@@ -189,6 +189,28 @@ class MeetingUpdateActionTest(BaseActionTestCase):
             response.json["message"],
         )
 
+    def test_update_projectors_from_wrong_meeting_error(self) -> None:
+        self.set_models(
+            {
+                "projector/2": {
+                    "name": "Projector 2",
+                    "meeting_id": 2,
+                },
+            }
+        )
+        _, response = self.basic_test(
+            {
+                "reference_projector_id": 2,
+                "default_projector_$_id": {"topics": 10, "motion": 2, "amendment": 1},
+            },
+            check_200=False,
+        )
+        self.assert_status_code(response, 400)
+        self.assertIn(
+            "The following models do not belong to meeting 1: ['projector/2', 'projector/10']",
+            response.json["message"],
+        )
+
     def test_update_default_projector_to_not_existing_replacement_error(self) -> None:
         _, response = self.basic_test(
             {"default_projector_$_id": {"not_existing": 1}}, check_200=False
@@ -1,3 +1,7 @@
+from unittest.mock import MagicMock
+
+from openslides_backend.action.actions.motion.create import MotionCreate
+from openslides_backend.action.relations.relation_manager import RelationManager
 from openslides_backend.permissions.permissions import Permissions
 from tests.system.action.base import BaseActionTestCase
 
@@ -55,6 +59,89 @@ class MotionCreateActionTest(BaseActionTestCase):
         self.assertEqual(agenda_item.get("meeting_id"), 222)
         self.assertEqual(agenda_item.get("content_object_id"), "motion/1")
 
+    def test_create_reserve_ids_once_per_collection(self) -> None:
+        self.set_models(
+            {
+                "meeting/222": {
+                    "name": "name_SNLGsvIV",
+                    "is_active_in_organization_id": 1,
+                    "agenda_item_creation": "always",
+                },
+                "motion_workflow/12": {
+                    "name": "name_workflow1",
+                    "first_state_id": 34,
+                    "state_ids": [34],
+                },
+                "motion_state/34": {"name": "name_state34", "meeting_id": 222},
+            }
+        )
+        action = MotionCreate(
+            self.services, self.datastore, RelationManager(self.datastore), MagicMock()
+        )
+        self.datastore.reserve_round_trips = 0
+        with self.datastore.get_database_context():
+            action.perform(
+                [
+                    {
+                        "title": f"title_{i}",
+                        "meeting_id": 222,
+                        "workflow_id": 12,
+                        "text": "test",
+                    }
+                    for i in range(3)
+                ],
+                1,
+                internal=True,
+            )
+        # motion, agenda_item, list_of_speakers and motion_submitter
+        self.assertEqual(self.datastore.reserve_round_trips, 4)
+        self.assertEqual(
+            sum(map(len, self.datastore.reserved_ids.values())),
+            0,
+        )
+
+    def test_create_reserve_ids_with_agenda_create(self) -> None:
+        self.set_models(
+            {
+                "meeting/222": {
+                    "name": "name_SNLGsvIV",
+                    "is_active_in_organization_id": 1,
+                    "agenda_item_creation": "default_no",
+                },
+                "motion_workflow/12": {
+                    "name": "name_workflow1",
+                    "first_state_id": 34,
+                    "state_ids": [34],
+                },
+                "motion_state/34": {"name": "name_state34", "meeting_id": 222},
+            }
+        )
+        action = MotionCreate(
+            self.services, self.datastore, RelationManager(self.datastore), MagicMock()
+        )
+        self.datastore.reserve_round_trips = 0
+        with self.datastore.get_database_context():
+            action.perform(
+                [
+                    {
+                        "title": f"title_{i}",
+                        "meeting_id": 222,
+                        "workflow_id": 12,
+                        "text": "test",
+                        "agenda_create": i == 1,
+                    }
+                    for i in range(3)
+                ],
+                1,
+                internal=True,
+            )
+        # motion, agenda_item, list_of_speakers and motion_submitter
+        self.assertEqual(self.datastore.reserve_round_trips, 4)
+        self.assertEqual(
+            sum(map(len, self.datastore.reserved_ids.values())),
+            0,
+        )
+
     def test_create_simple_fields(self) -> None:
         self.create_meeting()
         self.set_user_groups(1, [1])
@@ -365,6 +365,56 @@ class MotionSetNumberMixinTest(BaseActionTestCase):
         assert model.get("number") == "025"
         assert model.get("number_value") == 25
 
+    def test_create_set_number_multi(self) -> None:
+        self.set_models(
+            {
+                "meeting/222": {
+                    "name": "name_SNLGsvIV",
+                    "motions_number_min_digits": 3,
+                    "motions_number_type": "per_category",
+                    "is_active_in_organization_id": 1,
+                },
+                "user/1": {"meeting_ids": [222]},
+                "motion_workflow/12": {
+                    "name": "name_workflow1",
+                    "first_state_id": 34,
+                    "state_ids": [34],
+                },
+                "motion_state/34": {
+                    "name": "name_state34",
+                    "meeting_id": 222,
+                    "set_number": True,
+                },
+                "motion_category/176": {"name": "name_category_176", "meeting_id": 222},
+                "motion/8": {
+                    "title": "title_FcnPUXJB",
+                    "meeting_id": 222,
+                    "state_id": 34,
+                    "number": "002",
+                    "number_value": 1,
+                    "category_id": 176,
+                },
+            }
+        )
+
+        response = self.request_multi(
+            "motion.create",
+            [
+                {
+                    "title": f"test_{i}",
+                    "meeting_id": 222,
+                    "workflow_id": 12,
+                    "text": "test",
+                    "category_id": 176,
+                }
+                for i in range(3)
+            ],
+        )
+        self.assert_status_code(response, 200)
+        self.assert_model_exists("motion/9", {"number": "003", "number_value": 3})
+        self.assert_model_exists("motion/10", {"number": "004", "number_value": 4})
+        self.assert_model_exists("motion/11", {"number": "005", "number_value": 5})
+
     def test_set_number_false(self) -> None:
         self.set_models(
             {
@@ -63,6 +63,63 @@ class MotionWorkflowSystemTest(BaseActionTestCase):
         self.assert_model_deleted("motion_workflow/2")
         self.assert_model_deleted("motion_state/3")
 
+    def test_delete_with_protected_state(self) -> None:
+        self.set_models(
+            {
+                "meeting/1": {
+                    "motion_workflow_ids": [2, 100],
+                    "motion_state_ids": [3],
+                    "motion_ids": [5],
+                    "is_active_in_organization_id": 1,
+                },
+                "motion_workflow/2": {"meeting_id": 1, "state_ids": [3]},
+                "motion_state/3": {
+                    "workflow_id": 2,
+                    "meeting_id": 1,
+                    "motion_ids": [5],
+                },
+                "motion/5": {"meeting_id": 1, "state_id": 3},
+                "motion_workflow/100": {"meeting_id": 1},
+            }
+        )
+        response = self.request("motion_workflow.delete", {"id": 2})
+        self.assert_status_code(response, 400)
+        self.assertIn(
+            "You can not delete motion_workflow/2 because you have to delete the following related models first: [FullQualifiedId('motion/5')]",
+            response.json["message"],
+        )
+        self.assert_model_exists("motion_workflow/2")
+        self.assert_model_exists("motion_state/3", {"motion_ids": [5]})
+
+    def test_delete_default_with_protected_state(self) -> None:
+        self.set_models(
+            {
+                "meeting/1": {
+                    "motions_default_workflow_id": 2,
+                    "motion_workflow_ids": [2, 100],
+                    "motion_state_ids": [3],
+                    "motion_ids": [5],
+                    "is_active_in_organization_id": 1,
+                },
+                "motion_workflow/2": {
+                    "meeting_id": 1,
+                    "state_ids": [3],
+                    "default_workflow_meeting_id": 1,
+                },
+                "motion_state/3": {
+                    "workflow_id": 2,
+                    "meeting_id": 1,
+                    "motion_ids": [5],
+                },
+                "motion/5": {"meeting_id": 1, "state_id": 3},
+                "motion_workflow/100": {"meeting_id": 1},
+            }
+        )
+        response = self.request("motion_workflow.delete", {"id": 2})
+        self.assert_status_code(response, 400)
+        self.assertIn("Cannot delete a default workflow.", response.json["message"])
+        self.assert_model_exists("motion_workflow/2")
+
     def test_delete_wrong_id(self) -> None:
         self.create_model("motion_workflow/112", {"name": "name_srtgb123"})
         response = self.request("motion_workflow.delete", {"id": 111})
@@ -82,6 +82,108 @@ class PollStopActionTest(BaseActionTestCase):
             {"voted": False, "user_id": user3, "vote_delegated_to_id": user2},
         ]
 
+    def test_stop_creates_votes(self) -> None:
+        self.set_models(
+            {
+                "organization/1": {"enable_electronic_voting": True},
+                "poll/1": {
+                    "type": Poll.TYPE_NAMED,
+                    "pollmethod": "YNA",
+                    "state": Poll.STATE_STARTED,
+                    "option_ids": [1, 2],
+                    "meeting_id": 1,
+                    "entitled_group_ids": [1],
+                },
+                "option/1": {"meeting_id": 1, "poll_id": 1},
+                "option/2": {"meeting_id": 1, "poll_id": 1},
+                "group/1": {"meeting_id": 1},
+                "meeting/1": {
+                    "default_group_id": 1,
+                    "is_active_in_organization_id": 1,
+                    "group_ids": [1],
+                },
+            }
+        )
+        user1 = self.create_user_for_meeting(1)
+        user2 = self.create_user_for_meeting(1)
+        self.set_models(
+            {
+                f"user/{user1}": {"is_present_in_meeting_ids": [1]},
+                f"user/{user2}": {"is_present_in_meeting_ids": [1]},
+            }
+        )
+        self.start_poll(1)
+        for user_id, value in ((user1, "Y"), (user2, "N")):
+            self.login(user_id)
+            response = self.vote_service.vote(
+                {"id": 1, "value": {"1": value, "2": "A"}}
+            )
+            self.assert_status_code(response, 200)
+        self.login(1)
+        response = self.request("poll.stop", {"id": 1})
+        self.assert_status_code(response, 200)
+        votes = [self.get_model(f"vote/{id_}") for id_ in range(1, 5)]
+        assert all(vote.get("meeting_id") == 1 for vote in votes)
+        assert sorted(
+            (vote["user_id"], vote["option_id"], vote["value"]) for vote in votes
+        ) == [(user1, 1, "Y"), (user1, 2, "A"), (user2, 1, "N"), (user2, 2, "A")]
+        option1 = self.get_model("option/1")
+        assert option1.get("yes") == "1.000000"
+        assert option1.get("no") == "1.000000"
+        assert option1.get("abstain") == "0.000000"
+        assert len(option1.get("vote_ids", [])) == 2
+        option2 = self.get_model("option/2")
+        assert option2.get("abstain") == "2.000000"
+        assert len(option2.get("vote_ids", [])) == 2
+        assert sorted(self.get_model("meeting/1").get("vote_ids", [])) == [1, 2, 3, 4]
+        for user_id in (user1, user2):
+            user = self.get_model(f"user/{user_id}")
+            assert user.get("vote_$_ids") == ["1"]
+            assert len(user.get("vote_$1_ids", [])) == 2
+
+    def test_stop_and_delete_in_one_request(self) -> None:
+        self.set_models(
+            {
+                "organization/1": {"enable_electronic_voting": True},
+                "poll/1": {
+                    "type": Poll.TYPE_NAMED,
+                    "pollmethod": "Y",
+                    "state": Poll.STATE_STARTED,
+                    "option_ids": [1],
+                    "meeting_id": 1,
+                    "entitled_group_ids": [1],
+                },
+                "option/1": {"meeting_id": 1, "poll_id": 1},
+                "group/1": {"meeting_id": 1},
+                "meeting/1": {
+                    "default_group_id": 1,
+                    "is_active_in_organization_id": 1,
+                    "group_ids": [1],
+                    "poll_ids": [1],
+                    "option_ids": [1],
+                },
+            }
+        )
+        user1 = self.create_user_for_meeting(1)
+        self.set_models({f"user/{user1}": {"is_present_in_meeting_ids": [1]}})
+        self.start_poll(1)
+        self.login(user1)
+        response = self.vote_service.vote({"id": 1, "value": {"1": 1}})
+        self.assert_status_code(response, 200)
+        self.login(1)
+        response = self.request_json(
+            [
+                {"action": "poll.stop", "data": [{"id": 1}]},
+                {"action": "poll.delete", "data": [{"id": 1}]},
+            ]
+        )
+        self.assert_status_code(response, 200)
+        self.assert_model_deleted("poll/1")
+        self.assert_model_deleted("option/1")
+        self.assert_model_deleted("vote/1")
+        self.assert_model_exists(f"user/{user1}", {"vote_$1_ids": []})
+        self.assert_model_exists("meeting/1", {"vote_ids": [], "option_ids": []})
+
     def test_stop_entitled_users_at_stop_user_only_once(self) -> None:
         self.set_models(
             {
@@ -109,6 +211,38 @@ class PollStopActionTest(BaseActionTestCase):
             {"voted": False, "user_id": 2, "vote_delegated_to_id": None},
         ]
 
+    def test_stop_entitled_users_at_stop_delegations(self) -> None:
+        self.set_models(
+            {
+                "poll/1": {
+                    "state": Poll.STATE_STARTED,
+                    "meeting_id": 1,
+                    "entitled_group_ids": [3, 4],
+                },
+                "user/2": {"is_present_in_meeting_ids": [1]},
+                "user/3": {"is_present_in_meeting_ids": [1]},
+                "user/4": {"vote_delegated_$1_to_id": 6},
+                "user/5": {"vote_delegated_$1_to_id": 7},
+                "user/6": {"is_present_in_meeting_ids": [1]},
+                "user/7": {},
+                "group/3": {"user_ids": [2, 3]},
+                "group/4": {"user_ids": [3, 4, 5]},
+                "meeting/1": {
+                    "group_ids": [3, 4],
+                    "is_active_in_organization_id": 1,
+                },
+            }
+        )
+        self.start_poll(1)
+        response = self.request("poll.stop", {"id": 1})
+        self.assert_status_code(response, 200)
+        poll = self.get_model("poll/1")
+        assert poll.get("entitled_users_at_stop") == [
+            {"voted": False, "user_id": 2, "vote_delegated_to_id": None},
+            {"voted": False, "user_id": 3, "vote_delegated_to_id": None},
+            {"voted": False, "user_id": 4, "vote_delegated_to_id": 6},
+        ]
+
     def test_stop_published(self) -> None:
         self.set_models(
             {
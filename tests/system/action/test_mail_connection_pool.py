@@ -0,0 +1,95 @@
+from smtplib import SMTPRecipientsRefused
+from time import monotonic
+from typing import Any, Dict, List
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from openslides_backend.action.mixins.send_email_mixin import (
+    EmailMixin,
+    EmailSettings,
+    MailConnectionPool,
+)
+from tests.system.action.mail_base import (
+    AIOHandler,
+    AiosmtpdServerManager,
+    set_test_email_settings,
+)
+
+
+def get_mails(amount: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "from_": EmailSettings.default_from_email,
+            "to": f"recipient{i}@example.com",
+            "subject": f"Invitation {i}",
+            "content": "Welcome",
+            "html": False,
+        }
+        for i in range(amount)
+    ]
+
+
+class MailConnectionPoolTest(TestCase):
+    def setUp(self) -> None:
+        set_test_email_settings()
+        EmailSettings.port = 2525
+
+    def tearDown(self) -> None:
+        # the settings are process-wide, restore them for the following tests
+        set_test_email_settings()
+
+    def test_send_all(self) -> None:
+        handler = AIOHandler()
+        with AiosmtpdServerManager(handler):
+            with MailConnectionPool(MagicMock(), size=4) as pool:
+                outcomes = pool.send_all(get_mails(20))
+        self.assertEqual(outcomes, [None] * 20)
+        self.assertEqual(
+            sorted(email["to"][0] for email in handler.emails),
+            sorted(f"recipient{i}@example.com" for i in range(20)),
+        )
+
+    def test_send_all_recipient_error(self) -> None:
+        mails = get_mails(3)
+        mails[1]["to"] = "recipient_create_error551@example.com"
+        handler = AIOHandler()
+        with AiosmtpdServerManager(handler):
+            with MailConnectionPool(MagicMock(), size=2) as pool:
+                outcomes = pool.send_all(mails)
+        self.assertIsNone(outcomes[0])
+        self.assertIsInstance(outcomes[1], SMTPRecipientsRefused)
+        self.assertIsNone(outcomes[2])
+        self.assertEqual(len(handler.emails), 2)
+
+    def test_send_all_rate_limit(self) -> None:
+        handler = AIOHandler()
+        with AiosmtpdServerManager(handler):
+            with MailConnectionPool(MagicMock(), size=1, rate_limit=20) as pool:
+                start = monotonic()
+                outcomes = pool.send_all(get_mails(3))
+                duration = monotonic() - start
+        self.assertEqual(outcomes, [None] * 3)
+        self.assertGreaterEqual(duration, 0.1)
+
+    def test_send_all_additional_connection_refused(self) -> None:
+        handler = AIOHandler()
+        logger = MagicMock()
+        with AiosmtpdServerManager(handler):
+            with MailConnectionPool(logger, size=2, rate_limit=20) as pool:
+                with patch.object(
+                    EmailMixin,
+                    "get_mail_connection",
+                    side_effect=ConnectionRefusedError("refused"),
+                ):
+                    outcomes = pool.send_all(get_mails(4))
+        self.assertEqual(outcomes, [None] * 4)
+        self.assertEqual(len(handler.emails), 4)
+        logger.warning.assert_called_once_with(
+            "Could not open an additional mail connection: refused"
+        )
+
+    def test_connection_refused(self) -> None:
+        EmailSettings.timeout = 1
+        with self.assertRaises(ConnectionRefusedError):
+            with MailConnectionPool(MagicMock()):
+                pass
@@ -1,3 +1,7 @@
+from unittest.mock import MagicMock
+
+from openslides_backend.action.actions.topic.update import TopicUpdate
+from openslides_backend.action.relations.relation_manager import RelationManager
 from openslides_backend.permissions.permissions import Permissions
 from tests.system.action.base import BaseActionTestCase
 
@@ -83,3 +87,27 @@ class TopicUpdateTest(BaseActionTestCase):
             {"id": 1, "title": "test2", "text": "text"},
             Permissions.AgendaItem.CAN_MANAGE,
         )
+
+    def test_update_prefetch(self) -> None:
+        self.set_models(
+            {
+                "meeting/1": {"name": "test", "is_active_in_organization_id": 1},
+                "topic/1": {"title": "test", "meeting_id": 1},
+                "topic/2": {"title": "test", "meeting_id": 1},
+            }
+        )
+        action = TopicUpdate(
+            self.services, self.datastore, RelationManager(self.datastore), MagicMock()
+        )
+        action.user_id = 1
+        with self.datastore.get_database_context():
+            action.prefetch([{"id": 1, "title": "a"}, {"id": 2, "title": "b"}])
+            self.datastore.cache_hits = self.datastore.cache_misses = 0
+            for topic_id in (1, 2):
+                action.check_for_archived_meeting({"id": topic_id})
+        self.assertEqual(self.datastore.cache_misses, 0)
+        self.assertEqual(self.datastore.cache_hits, 4)
+        self.assertIn("topic/1/meeting_id", self.datastore.locked_fields)
+        self.assertIn(
+            "meeting/1/is_active_in_organization_id", self.datastore.locked_fields
+        )
@@ -56,6 +56,36 @@ class UserCreateActionTest(BaseActionTestCase):
         self.assert_status_code(response, 200)
         self.assert_model_exists("user/4", {"username": "John 2"})
 
+    def test_create_first_name_and_count_multi(self) -> None:
+        self.set_models(
+            {"user/2": {"username": "John"}, "user/3": {"username": "John 2"}}
+        )
+        response = self.request_multi(
+            "user.create",
+            [
+                {"first_name": "John"},
+                {"first_name": "John", "last_name": "Smith"},
+                {"first_name": "John"},
+                {"first_name": "John"},
+            ],
+        )
+        self.assert_status_code(response, 200)
+        self.assert_model_exists("user/4", {"username": "John 1"})
+        self.assert_model_exists("user/5", {"username": "John Smith"})
+        self.assert_model_exists("user/6", {"username": "John 3"})
+        self.assert_model_exists("user/7", {"username": "John 4"})
+
+    def test_create_username_generated_in_same_payload(self) -> None:
+        response = self.request_multi(
+            "user.create",
+            [{"first_name": "John"}, {"username": "John"}],
+        )
+        self.assert_status_code(response, 400)
+        assert (
+            response.json["message"] == "A user with the username John already exists."
+        )
+        self.assert_model_not_exists("user/2")
+
     def test_create_some_more_fields(self) -> None:
         """
         Also checks if the correct password is stored from the given default_password
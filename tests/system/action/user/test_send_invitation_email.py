@@ -51,6 +51,36 @@ class SendInvitationMail(BaseActionTestCase):
         self.assertIsInstance(user2.get("last_email_send"), int)
         self.assertGreaterEqual(user2.get("last_email_send"), start_time)
 
+    def test_send_many_parallel(self) -> None:
+        self.set_models(
+            {
+                f"user/{id_}": {
+                    "username": f"Testuser {id_}",
+                    "email": f"recipient{id_}@example.com",
+                    "group_$1_ids": [1],
+                    "meeting_ids": [1],
+                }
+                for id_ in range(3, 23)
+            }
+        )
+        handler = AIOHandler()
+        with AiosmtpdServerManager(handler):
+            response = self.request_multi(
+                "user.send_invitation_email",
+                [{"id": id_, "meeting_id": 1} for id_ in range(2, 23)],
+            )
+        self.assert_status_code(response, 200)
+        results = response.json["results"][0]
+        self.assertEqual(
+            [result["recipient_user_id"] for result in results], list(range(2, 23))
+        )
+        self.assertTrue(all(result["sent"] for result in results))
+        self.assertEqual(len(handler.emails), 21)
+        for id_ in range(2, 23):
+            self.assertIsInstance(
+                self.get_model(f"user/{id_}").get("last_email_send"), int
+            )
+
     def test_send_mixed_multimail(self) -> None:
         """
         Test with 2 PayloadElements and some actions
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from openslides_backend.permissions.management_levels import (
     CommitteeManagementLevel,
     OrganizationManagementLevel,
@@ -29,6 +31,27 @@ class UserUpdateActionTest(BaseActionTestCase):
         model = self.get_model("user/111")
         assert model.get("username") == "username_Xcdfgee"
 
+    def test_update_username_without_get_all(self) -> None:
+        self.set_models(
+            {
+                "user/111": {"username": "username_srtgb123"},
+                "user/112": {"username": "username_Xcdfgee"},
+            }
+        )
+        with patch.object(
+            self.datastore, "get_all", wraps=self.datastore.get_all
+        ) as get_all:
+            response = self.request(
+                "user.update", {"id": 111, "username": "username_Xcdfgee"}
+            )
+            self.assert_status_code(response, 400)
+            response = self.request(
+                "user.update", {"id": 111, "username": "username_new"}
+            )
+            self.assert_status_code(response, 200)
+        get_all.assert_not_called()
+        self.assert_model_exists("user/111", {"username": "username_new"})
+
     def test_update_some_more_fields(self) -> None:
         self.set_models(
             {
@@ -1,6 +1,7 @@
 from typing import Any, Dict, Optional, Tuple
 
 from openslides_backend.http.views.presenter_view import PresenterView
+from openslides_backend.presenter.sorted_user_index import sorted_user_indexes
 from openslides_backend.shared.interfaces.wsgi import WSGIApplication
 from tests.system.base import BaseSystemTestCase
 from tests.system.util import create_presenter_test_application, get_route_path
@@ -9,6 +10,11 @@ PRESENTER_URL = get_route_path(PresenterView.presenter_route)
 
 
 class BasePresenterTestCase(BaseSystemTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        # the positions start again after the datastore was truncated
+        sorted_user_indexes.clear()
+
     def get_application(self) -> WSGIApplication:
         return create_presenter_test_application()
 
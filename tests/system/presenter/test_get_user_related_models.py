@@ -154,6 +154,73 @@ class TestGetUserRelatedModels(BasePresenterTestCase):
             },
         }
 
+    def test_get_user_related_models_more_users_and_meetings(self) -> None:
+        self.set_models(
+            {
+                "committee/1": {"name": "committee1"},
+                "committee/2": {"name": "committee2"},
+                "user/1": {
+                    "committee_ids": [2, 1],
+                    "committee_$_management_level": ["1"],
+                    "committee_$1_management_level": "can_manage",
+                    "meeting_ids": [1, 2],
+                },
+                "user/2": {"meeting_ids": [1]},
+                "user/3": {"committee_ids": [1], "meeting_ids": [2, 1]},
+                "meeting/1": {"name": "meeting1", "is_active_in_organization_id": 1},
+                "meeting/2": {"name": "meeting2"},
+                "motion_submitter/1": {"user_id": 1, "meeting_id": 2},
+                "speaker/1": {"user_id": 3, "meeting_id": 1},
+                "speaker/2": {"user_id": 3, "meeting_id": 2},
+                "speaker/3": {"user_id": 3, "meeting_id": 1},
+                "assignment_candidate/1": {"user_id": 3, "meeting_id": 2},
+            }
+        )
+        status_code, data = self.request(
+            "get_user_related_models", {"user_ids": [3, 2, 1]}
+        )
+        self.assertEqual(status_code, 200)
+        assert data == {
+            "1": {
+                "committees": [
+                    {"id": 2, "name": "committee2", "cml": ""},
+                    {"id": 1, "name": "committee1", "cml": "can_manage"},
+                ],
+                "meetings": [
+                    {
+                        "id": 2,
+                        "name": "meeting2",
+                        "is_active_in_organization_id": None,
+                        "submitter_ids": [1],
+                        "candidate_ids": [],
+                        "speaker_ids": [],
+                    }
+                ],
+            },
+            "2": {},
+            "3": {
+                "committees": [{"id": 1, "name": "committee1", "cml": ""}],
+                "meetings": [
+                    {
+                        "id": 2,
+                        "name": "meeting2",
+                        "is_active_in_organization_id": None,
+                        "submitter_ids": [],
+                        "candidate_ids": [1],
+                        "speaker_ids": [2],
+                    },
+                    {
+                        "id": 1,
+                        "name": "meeting1",
+                        "is_active_in_organization_id": 1,
+                        "submitter_ids": [],
+                        "candidate_ids": [],
+                        "speaker_ids": [1, 3],
+                    },
+                ],
+            },
+        }
+
     def test_get_user_related_models_missing_payload(self) -> None:
         status_code, data = self.request("get_user_related_models", {})
         self.assertEqual(status_code, 400)
@@ -2,6 +2,7 @@ from typing import Any, Dict
 
 import pytest
 
+from openslides_backend.services.datastore.commands import GetManyRequest
 from openslides_backend.services.datastore.interface import InstanceAdditionalBehaviour
 from openslides_backend.shared.exceptions import DatastoreException
 from openslides_backend.shared.patterns import Collection, FullQualifiedId
@@ -13,6 +14,10 @@ class DatabaseAdapterSystemTest(BaseActionTestCase):
         with self.datastore.get_database_context():
             return self.datastore.fetch_model(*args, **kwargs)
 
+    def reset_cache_statistics(self) -> None:
+        self.datastore.cache_hits = 0
+        self.datastore.cache_misses = 0
+
     def init_both(self) -> None:
         self.set_models(
             {"meeting/1": {"name": "meetingDB", "description": "descriptionDB"}}
@@ -240,3 +245,95 @@ class DatabaseAdapterSystemTest(BaseActionTestCase):
             exception=False,
         )
         self.assertEqual(result.get("name"), None)
+
+    def test_model_cache_hit(self) -> None:
+        self.init_only_db()
+        self.reset_cache_statistics()
+        fqid = FullQualifiedId(Collection("meeting"), 1)
+        self.fetch_model(fqid, ["name"])
+        result = self.fetch_model(fqid, ["name"])
+        self.assertEqual(result["name"], "meetingDB")
+        self.assertEqual(self.datastore.cache_hits, 1)
+        self.assertEqual(self.datastore.cache_misses, 1)
+
+    def test_model_cache_missing_fields(self) -> None:
+        self.set_models(
+            {"meeting/1": {"name": "meetingDB", "description": "descriptionDB"}}
+        )
+        self.reset_cache_statistics()
+        fqid = FullQualifiedId(Collection("meeting"), 1)
+        self.fetch_model(fqid, ["name"])
+        result = self.fetch_model(fqid, ["name", "description", "not_there"])
+        self.assertEqual(result["name"], "meetingDB")
+        self.assertEqual(result["description"], "descriptionDB")
+        self.assertNotIn("not_there", result)
+        self.assertEqual(self.datastore.cache_misses, 2)
+        self.fetch_model(fqid, ["description", "not_there"])
+        self.assertEqual(self.datastore.cache_hits, 1)
+
+    def test_model_cache_locked_fields(self) -> None:
+        self.init_only_db()
+        self.reset_cache_statistics()
+        fqid = FullQualifiedId(Collection("meeting"), 1)
+        self.fetch_model(fqid, ["name"])
+        position = self.datastore.locked_fields["meeting/1/name"]
+        self.datastore.locked_fields = {}
+        self.fetch_model(fqid, ["name"])
+        self.assertEqual(self.datastore.cache_hits, 1)
+        self.assertEqual(self.datastore.locked_fields, {"meeting/1/name": position})
+
+    def test_model_cache_no_lock_no_meta_position(self) -> None:
+        self.init_only_db()
+        self.reset_cache_statistics()
+        fqid = FullQualifiedId(Collection("meeting"), 1)
+        self.fetch_model(fqid, ["name"])
+        result = self.fetch_model(fqid, ["name"], lock_result=False)
+        self.assertEqual(result, {"name": "meetingDB"})
+
+    def test_model_cache_get_many(self) -> None:
+        self.set_models(
+            {"meeting/1": {"name": "meeting1"}, "meeting/2": {"name": "meeting2"}}
+        )
+        self.reset_cache_statistics()
+        self.fetch_model(FullQualifiedId(Collection("meeting"), 1), ["name"])
+        with self.datastore.get_database_context():
+            result = self.datastore.get_many(
+                [GetManyRequest(Collection("meeting"), [1, 2], ["name"])]
+            )
+        self.assertEqual(result[Collection("meeting")][1]["name"], "meeting1")
+        self.assertEqual(result[Collection("meeting")][2]["name"], "meeting2")
+        self.assertEqual(self.datastore.cache_hits, 1)
+        self.assertEqual(self.datastore.cache_misses, 2)
+        model = self.fetch_model(FullQualifiedId(Collection("meeting"), 2), ["name"])
+        self.assertEqual(model["name"], "meeting2")
+        self.assertEqual(self.datastore.cache_hits, 2)
+
+    def test_model_cache_reset_on_write(self) -> None:
+        self.init_only_db()
+        self.reset_cache_statistics()
+        fqid = FullQualifiedId(Collection("meeting"), 1)
+        self.fetch_model(fqid, ["name"])
+        self.set_models({"meeting/1": {"name": "meetingNew"}})
+        result = self.fetch_model(fqid, ["name"])
+        self.assertEqual(result["name"], "meetingNew")
+
+    def test_reserve_ids_block_size(self) -> None:
+        self.datastore.id_block_size = 10
+        self.datastore.reserve_round_trips = 0
+        first_id = self.datastore.reserve_id(Collection("meeting"))
+        ids = self.datastore.reserve_ids(Collection("meeting"), 3)
+        self.assertEqual(list(ids), [first_id + 1, first_id + 2, first_id + 3])
+        self.assertEqual(self.datastore.reserve_round_trips, 1)
+        self.assertEqual(len(self.datastore.reserved_ids[Collection("meeting")]), 6)
+        self.datastore.reserve_ids(Collection("meeting"), 8)
+        self.assertEqual(self.datastore.reserve_round_trips, 2)
+        self.assertEqual(len(self.datastore.reserved_ids[Collection("meeting")]), 8)
+
+    def test_reserve_ids_in_advance(self) -> None:
+        self.datastore.reserve_round_trips = 0
+        self.datastore.reserve_ids_in_advance(Collection("meeting"), 3)
+        self.datastore.reserve_ids_in_advance(Collection("meeting"), 2)
+        ids = [self.datastore.reserve_id(Collection("meeting")) for _ in range(3)]
+        self.assertEqual(ids, [ids[0], ids[0] + 1, ids[0] + 2])
+        self.assertEqual(self.datastore.reserve_round_trips, 1)
+        self.assertEqual(self.datastore.reserved_ids[Collection("meeting")], [])
@@ -0,0 +1,44 @@
+from openslides_backend.permissions.permission_helper import has_perm, is_admin
+from openslides_backend.permissions.permissions import Permissions
+from tests.system.action.base import BaseActionTestCase
+
+
+class PermissionHelperSystemTest(BaseActionTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.create_meeting()
+        self.set_models(
+            {
+                "user/2": {"username": "user2"},
+                "group/3": {"permissions": [Permissions.Motion.CAN_MANAGE]},
+            }
+        )
+
+    def test_is_admin_locks_fields(self) -> None:
+        self.set_user_groups(2, [2])
+        with self.datastore.get_database_context():
+            self.assertTrue(is_admin(self.datastore, 2, 1))
+        self.assertIn("meeting/1/admin_group_id", self.datastore.locked_fields)
+        self.assertIn("user/2/group_$1_ids", self.datastore.locked_fields)
+
+    def test_is_admin_after_has_perm(self) -> None:
+        self.set_user_groups(2, [3])
+        with self.datastore.get_database_context():
+            self.assertTrue(has_perm(self.datastore, 2, Permissions.Motion.CAN_SEE, 1))
+            self.assertFalse(is_admin(self.datastore, 2, 1))
+        self.assertIn("user/2/group_$1_ids", self.datastore.locked_fields)
+
+    def test_is_admin_anonymous(self) -> None:
+        self.set_models({"meeting/1": {"enable_anonymous": False}})
+        with self.datastore.get_database_context():
+            self.assertFalse(is_admin(self.datastore, 0, 1))
+
+    def test_has_perm_locks_reapplied(self) -> None:
+        self.set_user_groups(2, [3])
+        with self.datastore.get_database_context():
+            self.assertTrue(
+                has_perm(self.datastore, 2, Permissions.Motion.CAN_MANAGE, 1)
+            )
+            self.datastore.locked_fields = {}
+            self.assertTrue(has_perm(self.datastore, 2, Permissions.Motion.CAN_SEE, 1))
+        self.assertIn("group/3/permissions", self.datastore.locked_fields)
@@ -60,7 +60,7 @@ def create_test_application(view: Type[View]) -> WSGIApplication:
         logging=MagicMock(),
     )
     services.vote = providers.Singleton(
-        TestVoteAdapter, services.config.vote_url, MagicMock()
+        TestVoteAdapter, services.config.vote_url, services.vote_session, MagicMock()
     )
     mock_media_service = Mock(MediaService)
     mock_media_service.upload_mediafile = Mock(
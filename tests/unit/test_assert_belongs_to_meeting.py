@@ -0,0 +1,82 @@
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from openslides_backend.action.util.assert_belongs_to_meeting import (
+    assert_belongs_to_meeting,
+)
+from openslides_backend.services.datastore.commands import GetManyRequest
+from openslides_backend.shared.exceptions import ActionException
+from openslides_backend.shared.patterns import Collection, FullQualifiedId
+
+MODELS: Dict[str, Dict[int, Dict[str, Any]]] = {
+    "tag": {1: {"meeting_id": 1}, 2: {"meeting_id": 2}, 3: {"meeting_id": 1}},
+    "user": {1: {"meeting_ids": [1, 2]}, 2: {"meeting_ids": [2]}, 3: {}},
+}
+
+
+def get_datastore_mock() -> MagicMock:
+    def get_many(
+        requests: List[GetManyRequest],
+    ) -> Dict[Collection, Dict[int, Dict[str, Any]]]:
+        return {
+            request.collection: {
+                id_: {"meta_position": 1, **MODELS[request.collection.collection][id_]}
+                for id_ in request.ids
+                if id_ in MODELS[request.collection.collection]
+            }
+            for request in requests
+        }
+
+    datastore = MagicMock()
+    datastore.request_cache = {}
+    datastore.additional_relation_models = {}
+    datastore.get_many = MagicMock(side_effect=get_many)
+    return datastore
+
+
+def fqids(*fqid_strs: str) -> List[FullQualifiedId]:
+    return [
+        FullQualifiedId(Collection(collection), int(id_))
+        for collection, id_ in (fqid_str.split("/") for fqid_str in fqid_strs)
+    ]
+
+
+def test_belongs_to_meeting() -> None:
+    datastore = get_datastore_mock()
+    assert_belongs_to_meeting(
+        datastore, fqids("meeting/1", "tag/1", "tag/3", "user/1"), 1
+    )
+    datastore.get_many.assert_called_once()
+
+
+def test_all_violations() -> None:
+    datastore = get_datastore_mock()
+    with pytest.raises(ActionException) as exception:
+        assert_belongs_to_meeting(
+            datastore,
+            fqids("meeting/2", "tag/1", "tag/2", "tag/4", "user/2", "user/3"),
+            1,
+        )
+    assert exception.value.message == (
+        "The following models do not belong to meeting 1: "
+        "['meeting/2', 'tag/2', 'tag/4', 'user/2', 'user/3']"
+    )
+
+
+def test_memo() -> None:
+    datastore = get_datastore_mock()
+    assert_belongs_to_meeting(datastore, fqids("tag/1", "user/1"), 1)
+    assert_belongs_to_meeting(datastore, fqids("tag/1", "user/1"), 1)
+    datastore.get_many.assert_called_once()
+    assert datastore.update_locked_fields.call_count == 2
+
+
+def test_additional_models() -> None:
+    datastore = get_datastore_mock()
+    tag_fqid = FullQualifiedId(Collection("tag"), 2)
+    datastore.additional_relation_models = {tag_fqid: {"meeting_id": 1}}
+    datastore.fetch_model = MagicMock(return_value={"meeting_id": 1})
+    assert_belongs_to_meeting(datastore, [tag_fqid], 1)
+    datastore.get_many.assert_not_called()
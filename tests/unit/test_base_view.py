@@ -0,0 +1,58 @@
+from typing import Optional, Tuple
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from werkzeug.test import EnvironBuilder
+
+from openslides_backend.http.http_exceptions import MethodNotAllowed, NotFound
+from openslides_backend.http.request import Request
+from openslides_backend.http.views.base_view import BaseView, route
+from openslides_backend.shared.interfaces.wsgi import ResponseBody
+
+
+class FakeView(BaseView):
+    @route("handle_request")
+    def handle_route(self, request: Request) -> Tuple[ResponseBody, Optional[str]]:
+        return request.json, None
+
+    @route("health", method="GET", json=False)
+    def health_route(self, request: Request) -> Tuple[ResponseBody, Optional[str]]:
+        return {"status": "running"}, None
+
+
+class BaseViewTester(TestCase):
+    def setUp(self) -> None:
+        self.view = FakeView(MagicMock(), MagicMock())
+
+    def dispatch(
+        self, path: str, method: str = "GET", json: Optional[ResponseBody] = None
+    ) -> Tuple[ResponseBody, Optional[str]]:
+        environ = EnvironBuilder(path, method=method, json=json).get_environ()
+        return self.view.dispatch(Request(environ))
+
+    def test_route_table(self) -> None:
+        self.assertEqual(
+            set(self.view.routes),
+            {
+                ("POST", "/system/fake/handle_request"),
+                ("GET", "/system/fake/health"),
+            },
+        )
+
+    def test_dispatch(self) -> None:
+        self.assertEqual(
+            self.dispatch("/system/fake/health"), ({"status": "running"}, None)
+        )
+        self.assertEqual(
+            self.dispatch("/system/fake/handle_request/", "POST", [1]), ([1], None)
+        )
+
+    def test_dispatch_wrong_method(self) -> None:
+        with self.assertRaises(MethodNotAllowed):
+            self.dispatch("/system/fake/health", "POST")
+
+    def test_dispatch_not_found(self) -> None:
+        with self.assertRaises(NotFound):
+            self.dispatch("/system/fake/unknown")
+        with self.assertRaises(NotFound):
+            self.dispatch("/system/fake/health?query=1")
@@ -0,0 +1,74 @@
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+from openslides_backend.action.util.cascade_prefetcher import CascadePrefetcher
+from openslides_backend.models import models  # noqa
+from openslides_backend.services.datastore.commands import GetManyRequest
+from openslides_backend.shared.patterns import Collection, FullQualifiedId
+
+MODELS: Dict[str, Dict[int, Dict[str, Any]]] = {
+    "topic": {1: {"agenda_item_id": 1, "list_of_speakers_id": 1}},
+    "agenda_item": {1: {"content_object_id": "topic/1"}},
+    "list_of_speakers": {1: {"speaker_ids": [1, 2]}},
+    "speaker": {1: {}, 2: {}},
+    "motion_workflow": {1: {"state_ids": [1, 2]}, 2: {"state_ids": [3, 4]}},
+    "motion_state": {
+        1: {"first_state_of_workflow_id": 1},
+        2: {},
+        3: {"first_state_of_workflow_id": 2, "motion_ids": [1]},
+        4: {"motion_ids": [2, 3]},
+    },
+}
+
+
+def get_datastore_mock() -> MagicMock:
+    def get_many(
+        requests: List[GetManyRequest], lock_result: bool
+    ) -> Dict[Collection, Dict[int, Dict[str, Any]]]:
+        assert not lock_result
+        return {
+            request.collection: {
+                id_: MODELS[request.collection.collection][id_] for id_ in request.ids
+            }
+            for request in requests
+        }
+
+    datastore = MagicMock()
+    datastore.request_cache = {}
+    datastore.additional_relation_models = {}
+    datastore.get_many = MagicMock(side_effect=get_many)
+    datastore.is_deleted = MagicMock(return_value=False)
+    return datastore
+
+
+def fqid(collection: str, id_: int) -> FullQualifiedId:
+    return FullQualifiedId(Collection(collection), id_)
+
+
+def test_prefetch_cascade() -> None:
+    datastore = get_datastore_mock()
+    CascadePrefetcher(datastore).prefetch_cascade(fqid("topic", 1))
+    # one request for the topic, one for its agenda item and list of speakers and
+    # one for the speakers
+    assert datastore.get_many.call_count == 3
+    for fqid_ in (
+        fqid("topic", 1),
+        fqid("agenda_item", 1),
+        fqid("list_of_speakers", 1),
+        fqid("speaker", 2),
+    ):
+        assert CascadePrefetcher.is_prefetched(datastore, fqid_)
+    assert not CascadePrefetcher.is_prefetched(datastore, fqid("speaker", 3))
+
+
+def test_prefetch_cascade_first_state() -> None:
+    datastore = get_datastore_mock()
+    CascadePrefetcher(datastore).prefetch_cascade(fqid("motion_workflow", 1))
+    assert CascadePrefetcher.is_prefetched(datastore, fqid("motion_state", 2))
+
+
+def test_prefetch_cascade_stops_at_protect() -> None:
+    datastore = get_datastore_mock()
+    CascadePrefetcher(datastore).prefetch_cascade(fqid("motion_workflow", 2))
+    assert CascadePrefetcher.is_prefetched(datastore, fqid("motion_state", 4))
+    assert not CascadePrefetcher.is_prefetched(datastore, fqid("motion", 1))
@@ -0,0 +1,37 @@
+import json
+import os
+from unittest import TestCase
+
+from openslides_backend.models.checker import Checker, CheckException
+
+EXAMPLE_DATA = os.path.join(
+    os.path.dirname(__file__), "..", "..", "global", "data", "example-data.json"
+)
+
+
+class CheckerTester(TestCase):
+    def setUp(self) -> None:
+        with open(EXAMPLE_DATA) as data:
+            self.data = json.load(data)
+
+    def test_example_data(self) -> None:
+        checker = Checker(data=self.data, mode="all")
+        checker.run_check()
+        self.assertEqual(set(checker.timings.keys()), set(self.data.keys()))
+
+    def test_type_error(self) -> None:
+        self.data["meeting"]["1"]["name"] = 1
+        checker = Checker(data=self.data, mode="all")
+        with self.assertRaises(CheckException) as context:
+            checker.run_check()
+        self.assertIn("meeting/1/name: Type error", str(context.exception))
+
+    def test_decimal(self) -> None:
+        poll = next(iter(self.data["poll"].values()))
+        poll["votesvalid"] = "1.5"
+        checker = Checker(data=self.data, mode="all")
+        with self.assertRaises(CheckException) as context:
+            checker.run_check()
+        self.assertIn(
+            f"poll/{poll['id']}/votesvalid: Type error", str(context.exception)
+        )
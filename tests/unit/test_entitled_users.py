@@ -0,0 +1,62 @@
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+from openslides_backend.action.util.entitled_users import get_entitled_users
+from openslides_backend.services.datastore.commands import GetManyRequest
+from openslides_backend.shared.patterns import Collection, FullQualifiedId
+
+MODELS: Dict[str, Dict[int, Dict[str, Any]]] = {
+    "meeting": {1: {"group_ids": [1, 2]}},
+    "group": {1: {"user_ids": [1, 2, 3]}, 2: {"user_ids": [3, 4, 5]}},
+    "user": {
+        1: {"is_present_in_meeting_ids": [1]},
+        2: {"vote_delegated_$1_to_id": 1},
+        3: {"is_present_in_meeting_ids": [2], "vote_delegated_$1_to_id": 6},
+        4: {"vote_delegated_$1_to_id": 7},
+        5: {},
+        6: {"is_present_in_meeting_ids": [1]},
+        7: {},
+    },
+}
+
+
+def get_datastore_mock() -> MagicMock:
+    def get(fqid: FullQualifiedId, mapped_fields: List[str]) -> Dict[str, Any]:
+        return MODELS[fqid.collection.collection][fqid.id]
+
+    def get_many(
+        requests: List[GetManyRequest],
+    ) -> Dict[Collection, Dict[int, Dict[str, Any]]]:
+        return {
+            request.collection: {
+                id_: {"id": id_, **MODELS[request.collection.collection][id_]}
+                for id_ in request.ids
+            }
+            for request in requests
+        }
+
+    datastore = MagicMock()
+    datastore.get = MagicMock(side_effect=get)
+    datastore.get_many = MagicMock(side_effect=get_many)
+    return datastore
+
+
+def test_get_entitled_users() -> None:
+    datastore = get_datastore_mock()
+    assert get_entitled_users(datastore, 1, [1, 3]) == [
+        {"user_id": 1, "voted": True, "vote_delegated_to_id": None},
+        {"user_id": 2, "voted": False, "vote_delegated_to_id": 1},
+        {"user_id": 3, "voted": True, "vote_delegated_to_id": 6},
+    ]
+    assert datastore.get.call_count == 1
+    # groups, users and the delegates which are no group members
+    assert datastore.get_many.call_count == 3
+    assert datastore.get_many.call_args_list[1][0][0][0].ids == [1, 2, 3, 4, 5]
+    assert sorted(datastore.get_many.call_args_list[2][0][0][0].ids) == [6, 7]
+
+
+def test_get_entitled_users_no_groups() -> None:
+    datastore = get_datastore_mock()
+    datastore.get = MagicMock(return_value={})
+    assert get_entitled_users(datastore, 1) == []
+    assert datastore.get_many.call_count == 1
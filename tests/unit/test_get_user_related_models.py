@@ -0,0 +1,116 @@
+from typing import Any, Dict, List
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from openslides_backend.presenter.get_user_related_models import GetUserRelatedModels
+from openslides_backend.services.datastore.commands import GetManyRequest
+from openslides_backend.shared.filters import Filter, FilterOperator, Or
+from openslides_backend.shared.patterns import Collection
+
+MODELS: Dict[str, Dict[int, Dict[str, Any]]] = {
+    "user": {
+        2: {
+            "committee_ids": [1],
+            "committee_$_management_level": ["1"],
+            "committee_$1_management_level": "can_manage",
+            "meeting_ids": [1, 2],
+        },
+        3: {"committee_ids": [1], "meeting_ids": [1]},
+        4: {},
+    },
+    "committee": {1: {"id": 1, "name": "c1"}},
+    "meeting": {
+        1: {"id": 1, "name": "m1", "is_active_in_organization_id": 1},
+        2: {"id": 2, "name": "m2"},
+    },
+    "motion_submitter": {5: {"user_id": 2, "meeting_id": 1}},
+    "assignment_candidate": {6: {"user_id": 3, "meeting_id": 1}},
+    "speaker": {
+        7: {"user_id": 2, "meeting_id": 2},
+        8: {"user_id": 2, "meeting_id": 2},
+    },
+}
+
+
+def get_many(requests: List[GetManyRequest]) -> Dict[Collection, Dict[int, Any]]:
+    result: Dict[Collection, Dict[int, Any]] = {}
+    for request in requests:
+        models = MODELS[request.collection.collection]
+        result[request.collection] = {
+            id: {
+                field: value
+                for field, value in models[id].items()
+                if field in (request.mapped_fields or ())
+            }
+            for id in request.ids
+            if id in models
+        }
+    return result
+
+
+def filter(collection: Collection, filter_: Filter) -> Dict[int, Dict[str, Any]]:
+    operators = filter_.or_filter if isinstance(filter_, Or) else [filter_]
+    user_ids = {operator.value for operator in operators}
+    assert all(isinstance(operator, FilterOperator) for operator in operators)
+    return {
+        id: model
+        for id, model in MODELS[collection.collection].items()
+        if model["user_id"] in user_ids
+    }
+
+
+class GetUserRelatedModelsTest(TestCase):
+    def test_result(self) -> None:
+        datastore = MagicMock()
+        datastore.get_many.side_effect = lambda requests, *args, **kwargs: get_many(
+            requests
+        )
+        datastore.filter.side_effect = (
+            lambda collection, filter_, *args, **kwargs: filter(collection, filter_)
+        )
+        presenter = GetUserRelatedModels(
+            {"user_ids": [2, 3, 4]}, MagicMock(), datastore, MagicMock(), 1
+        )
+        presenter.check_permissions = MagicMock()  # type: ignore
+        self.assertEqual(
+            presenter.get_result(),
+            {
+                "2": {
+                    "committees": [{"id": 1, "name": "c1", "cml": "can_manage"}],
+                    "meetings": [
+                        {
+                            "id": 1,
+                            "name": "m1",
+                            "is_active_in_organization_id": 1,
+                            "submitter_ids": [5],
+                            "candidate_ids": [],
+                            "speaker_ids": [],
+                        },
+                        {
+                            "id": 2,
+                            "name": "m2",
+                            "is_active_in_organization_id": None,
+                            "submitter_ids": [],
+                            "candidate_ids": [],
+                            "speaker_ids": [7, 8],
+                        },
+                    ],
+                },
+                "3": {
+                    "committees": [{"id": 1, "name": "c1", "cml": ""}],
+                    "meetings": [
+                        {
+                            "id": 1,
+                            "name": "m1",
+                            "is_active_in_organization_id": 1,
+                            "submitter_ids": [],
+                            "candidate_ids": [6],
+                            "speaker_ids": [],
+                        }
+                    ],
+                },
+                "4": {},
+            },
+        )
+        self.assertEqual(datastore.filter.call_count, 3)
+        self.assertEqual(datastore.get_many.call_count, 4)
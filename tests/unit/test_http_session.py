@@ -0,0 +1,67 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from openslides_backend.environment import get_session_settings
+from openslides_backend.shared.http_session import HTTPSession
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        # echo the received cookies and set a new one
+        self.send_header("X-Received-Cookie", self.headers.get("Cookie", ""))
+        self.send_header("Set-Cookie", "session=user1; Path=/")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+class HTTPSessionTester(TestCase):
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_default_settings(self) -> None:
+        settings = get_session_settings("DATASTORE_WRITER")
+        self.assertEqual(settings["connect_timeout"], 5)
+        self.assertIsNone(settings["read_timeout"])
+        session = HTTPSession("test", settings, MagicMock())
+        self.assertEqual(session.timeout, (5, None))
+
+    def test_connection_reuse(self) -> None:
+        session = HTTPSession(
+            "test", get_session_settings("DATASTORE_WRITER"), MagicMock()
+        )
+        for _ in range(3):
+            response = session.post(self.url, data="{}")
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            session.get_statistics(),
+            {"requests": 3, "new_connections": 1, "reused_connections": 2},
+        )
+
+    def test_no_cookie_persistence(self) -> None:
+        session = HTTPSession(
+            "test", get_session_settings("DATASTORE_WRITER"), MagicMock()
+        )
+        response = session.post(self.url, data="{}", cookies={"refreshId": "user1"})
+        self.assertEqual(response.headers["X-Received-Cookie"], "refreshId=user1")
+        self.assertEqual(response.cookies.get("session"), "user1")
+        self.assertEqual(len(session.cookies), 0)
+        response = session.post(self.url, data="{}", cookies={"refreshId": "user2"})
+        self.assertEqual(response.headers["X-Received-Cookie"], "refreshId=user2")
+        response = session.post(self.url, data="{}")
+        self.assertEqual(response.headers["X-Received-Cookie"], "")
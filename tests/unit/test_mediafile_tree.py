@@ -0,0 +1,64 @@
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+from openslides_backend.action.actions.mediafile.mediafile_tree import MediafileTree
+from openslides_backend.shared.patterns import Collection
+
+
+def get_mediafiles() -> Dict[int, Dict[str, Any]]:
+    return {
+        1: {"child_ids": [2, 3], "is_public": True, "inherited_access_group_ids": []},
+        2: {
+            "child_ids": [4],
+            "access_group_ids": [7, 8],
+            "is_public": False,
+            "inherited_access_group_ids": [7, 8],
+        },
+        3: {"is_public": True, "inherited_access_group_ids": []},
+        4: {"access_group_ids": [8], "is_public": False},
+    }
+
+
+def test_recalculate_children() -> None:
+    tree = MediafileTree(get_mediafiles())
+    assert list(tree.recalculate_children(1, False, [7])) == [
+        {"id": 2, "is_public": False, "inherited_access_group_ids": [7]},
+        {"id": 4, "is_public": False, "inherited_access_group_ids": []},
+        {"id": 3, "is_public": False, "inherited_access_group_ids": [7]},
+    ]
+    assert tree.mediafiles[4]["inherited_access_group_ids"] == []
+    assert list(tree.recalculate_children(1, False, [7])) == []
+
+
+def test_unchanged_subtree_is_skipped() -> None:
+    mediafiles = get_mediafiles()
+    mediafiles[4]["is_public"] = True
+    tree = MediafileTree(mediafiles)
+    assert list(tree.recalculate_children(1, True, [])) == []
+
+
+def test_get() -> None:
+    mediafiles = get_mediafiles()
+    for id_, mediafile in mediafiles.items():
+        mediafile["meta_position"] = id_
+    datastore = MagicMock()
+    datastore.request_cache = {}
+    datastore.get = MagicMock(return_value={"mediafile_ids": [1, 2, 3, 4]})
+    datastore.get_many = MagicMock(return_value={Collection("mediafile"): mediafiles})
+    tree = MediafileTree.get(datastore, 1)
+    assert MediafileTree.get(datastore, 1) is tree
+    datastore.get_many.assert_called_once()
+
+    list(tree.recalculate_children(2, True, []))
+    locked = [
+        (str(call[0][0]), call[0][1])
+        for call in datastore.update_locked_fields.call_args_list
+    ]
+    assert locked == [
+        ("mediafile/2/child_ids", 2),
+        ("mediafile/4/child_ids", 4),
+        ("mediafile/4/access_group_ids", 4),
+        ("mediafile/4/is_public", 4),
+        ("mediafile/4/inherited_access_group_ids", 4),
+        ("mediafile/4/child_ids", 4),
+    ]
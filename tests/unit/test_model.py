@@ -6,6 +6,7 @@ from fastjsonschema import validate
 from openslides_backend.action.util.default_schema import DefaultSchema
 from openslides_backend.models import fields
 from openslides_backend.models.base import Model
+from openslides_backend.models.models import User
 from openslides_backend.shared.exceptions import ActionException
 from openslides_backend.shared.patterns import Collection
 
@@ -87,6 +88,26 @@ class ModelBaseTester(TestCase):
             [field.own_field_name for field in FakeModel().get_fields()],
         )
 
+    def test_field_lists_fake_model(self) -> None:
+        model = FakeModel()
+        self.assertEqual(
+            ["fake_model_2_generic_ids", "fake_model_2_ids"],
+            [field.own_field_name for field in model.get_relation_fields()],
+        )
+        self.assertEqual(
+            ["id", "text"],
+            [field.own_field_name for field in model.get_required_fields()],
+        )
+        self.assertEqual((), model.fields_with_default)
+
+    def test_try_get_field_template_field(self) -> None:
+        user = User()
+        field = user.get_field("group_$_ids")
+        self.assertIs(user.try_get_field("group_$42_ids"), field)
+        self.assertIs(user.try_get_field("group_$42_ids"), field)
+        self.assertIsNone(user.try_get_field("group_$42_idsx"))
+        self.assertIsNone(user.try_get_field("unknown_field"))
+
     def test_own_collection_attr(self) -> None:
         rels = [
             FakeModel().get_field("fake_model_2_ids"),
@@ -0,0 +1,94 @@
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+from openslides_backend.action.actions.motion.numbering import MotionNumbering
+from openslides_backend.shared.patterns import Collection
+
+
+def get_datastore_mock(meeting: Dict[str, Any]) -> MagicMock:
+    datastore = MagicMock()
+    datastore.request_cache = {}
+    datastore.locked_fields = {}
+
+    def update_locked_fields(key: Any, lock: Any) -> None:
+        datastore.locked_fields[str(key)] = lock
+
+    datastore.update_locked_fields = MagicMock(side_effect=update_locked_fields)
+    datastore.get = MagicMock(
+        return_value={
+            "motion_ids": [1, 2, 3],
+            "motion_category_ids": [5],
+            "meta_position": 4,
+            **meeting,
+        }
+    )
+    datastore.get_many = MagicMock(
+        return_value={
+            Collection("motion"): {
+                1: {"number": "A1", "number_value": 1, "category_id": 5},
+                2: {"number": "A 1", "number_value": 1, "lead_motion_id": 1},
+                3: {"number": "3", "number_value": 3, "meta_position": 9},
+            },
+            Collection("motion_category"): {5: {"prefix": "A", "meta_position": 2}},
+        }
+    )
+    for models in datastore.get_many.return_value.values():
+        for model in models.values():
+            model.setdefault("meta_position", 1)
+    return datastore
+
+
+def test_allocate() -> None:
+    datastore = get_datastore_mock({"motions_amendments_prefix": " "})
+    numbering = MotionNumbering.get(datastore, 1)
+    assert [numbering.allocate(id_, None, None) for id_ in (4, 5)] == [
+        ("4", 4),
+        ("5", 5),
+    ]
+    assert numbering.allocate(6, 1, None) == ("A1 2", 2)
+    assert numbering.allocate(7, None, 5, 1) == ("A2", 2)
+    assert numbering.allocate(8, None, 5) == ("A6", 6)
+    assert MotionNumbering.get(datastore, 1) is numbering
+    datastore.get.assert_called_once()
+    datastore.get_many.assert_called_once()
+
+
+def test_allocate_per_category() -> None:
+    datastore = get_datastore_mock(
+        {"motions_number_type": "per_category", "motions_number_min_digits": 3}
+    )
+    numbering = MotionNumbering.get(datastore, 1)
+    assert numbering.allocate(4, None, 5) == ("A002", 2)
+    assert numbering.allocate(5, None, None) == ("004", 4)
+
+
+def test_register() -> None:
+    numbering = MotionNumbering.get(get_datastore_mock({}), 1)
+    assert not numbering.is_unique("3")
+    numbering.register(3, "7", 7, None, None)
+    assert numbering.is_unique("3")
+    assert not numbering.is_unique("7")
+    assert numbering.is_unique("7", [3])
+    numbering.register(3, "2", 2, None, None)
+    assert numbering.allocate(4, None, None) == ("3", 3)
+
+
+def test_lock() -> None:
+    datastore = get_datastore_mock({})
+    MotionNumbering.get(datastore, 1)
+    MotionNumbering.get(datastore, 1)
+    assert datastore.update_locked_fields.call_count == 7
+    assert set(datastore.locked_fields) == {
+        "meeting/1/motion_ids",
+        "meeting/1/motion_category_ids",
+        "motion/number",
+        "motion/number_value",
+        "motion/lead_motion_id",
+        "motion/category_id",
+        "motion_category/prefix",
+    }
+    assert datastore.locked_fields["motion/number"]["position"] == 9
+    # the locked fields of the next action
+    datastore.locked_fields.clear()
+    MotionNumbering.get(datastore, 1)
+    assert datastore.update_locked_fields.call_count == 14
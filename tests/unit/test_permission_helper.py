@@ -1,5 +1,14 @@
-from openslides_backend.permissions.permission_helper import is_child_permission
-from openslides_backend.permissions.permissions import Permissions
+from typing import List
+from unittest.mock import MagicMock
+
+from openslides_backend.permissions.permission_helper import (
+    MeetingPermissions,
+    get_meeting_permissions,
+    has_perm,
+    is_child_permission,
+)
+from openslides_backend.permissions.permissions import Permission, Permissions
+from openslides_backend.shared.patterns import Collection
 
 
 def test_is_child_permission_equal() -> None:
@@ -42,3 +51,47 @@ def test_is_child_permission_different_collections() -> None:
     assert not is_child_permission(
         Permissions.AgendaItem.CAN_SEE, Permissions.Motion.CAN_MANAGE
     )
+
+
+def get_datastore_mock(group_permissions: List[Permission]) -> MagicMock:
+    datastore = MagicMock()
+    datastore.request_cache = {}
+    datastore.get = MagicMock(return_value={"group_$1_ids": [2]})
+    datastore.get_many = MagicMock(
+        return_value={
+            Collection("group"): {
+                2: {"permissions": group_permissions, "meta_position": 5}
+            }
+        }
+    )
+    return datastore
+
+
+def test_has_perm_implied_permission() -> None:
+    datastore = get_datastore_mock([Permissions.Motion.CAN_MANAGE])
+    assert has_perm(datastore, 1, Permissions.Motion.CAN_SEE, 1)
+    assert not has_perm(datastore, 1, Permissions.AgendaItem.CAN_SEE, 1)
+
+
+def test_has_perm_resolved_once() -> None:
+    datastore = get_datastore_mock([Permissions.AgendaItem.CAN_SEE])
+    for _ in range(3):
+        assert has_perm(datastore, 1, Permissions.AgendaItem.CAN_SEE, 1)
+    datastore.get.assert_called_once()
+    datastore.get_many.assert_called_once()
+    assert datastore.update_locked_fields.call_count == 4
+
+
+def test_is_admin_from_group() -> None:
+    datastore = get_datastore_mock([])
+    datastore.get_many.return_value[Collection("group")][2][
+        "admin_group_for_meeting_id"
+    ] = 1
+    assert get_meeting_permissions(datastore, 1, 1).is_admin
+    assert has_perm(datastore, 1, Permissions.Motion.CAN_MANAGE, 1)
+
+
+def test_meeting_permissions_locks_not_shared() -> None:
+    meeting_permissions = MeetingPermissions(set())
+    assert meeting_permissions.locks == {}
+    assert meeting_permissions.locks is not MeetingPermissions(set()).locks
@@ -1,9 +1,26 @@
+from typing import Any, List, cast
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from openslides_backend.presenter import PresenterBlob
+from openslides_backend.presenter.base import BasePresenter
 from openslides_backend.presenter.presenter import PresenterHandler
+from openslides_backend.services.datastore.commands import GetManyRequest
 from openslides_backend.shared.exceptions import PresenterException
+from openslides_backend.shared.patterns import Collection
+
+
+class EchoPresenter(BasePresenter):
+    csrf_exempt = False
+
+    def validate(self) -> None:
+        pass
+
+    def get_prefetch_requests(self) -> List[GetManyRequest]:
+        return [GetManyRequest(Collection("meeting"), [self.data["id"]], ["name"])]
+
+    def get_result(self) -> Any:
+        return self.data
 
 
 class GeneralPresenterTester(TestCase):
@@ -37,3 +54,30 @@ class GeneralPresenterTester(TestCase):
             context_manager.exception.message,
             "You cannot call presenters with different login mechanisms",
         )
+
+    def test_presenters_in_one_context(self) -> None:
+        authentication = cast(
+            MagicMock, self.presenter_handler.services.authentication()
+        )
+        authentication.authenticate.return_value = (1, None)
+        datastore = cast(MagicMock, self.presenter_handler.datastore)
+        request = MagicMock()
+        request.json = [
+            PresenterBlob(presenter="echo", data={"id": 1}),
+            PresenterBlob(presenter="echo", data={"id": 2}),
+        ]
+        with patch.dict(
+            "openslides_backend.presenter.presenter.presenters_map",
+            {"echo": EchoPresenter},
+        ):
+            response, _ = self.presenter_handler.parse_presenters(request)
+        self.assertEqual(response, [{"id": 1}, {"id": 2}])
+        datastore.get_database_context.assert_called_once()
+        datastore.get_many.assert_called_once()
+        self.assertEqual(
+            [
+                get_many_request.ids
+                for get_many_request in datastore.get_many.call_args[0][0]
+            ],
+            [[1], [2]],
+        )
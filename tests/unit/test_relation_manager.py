@@ -0,0 +1,114 @@
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+from openslides_backend.action.relations.calculated_field_handlers_map import (
+    get_calculated_field_handlers,
+)
+from openslides_backend.action.relations.meeting_user_ids_handler import (
+    MeetingUserIdsHandler,
+)
+from openslides_backend.action.relations.relation_manager import RelationManager
+from openslides_backend.action.relations.single_relation_handler import (
+    SingleRelationHandler,
+)
+from openslides_backend.action.relations.user_committee_calculate_handler import (
+    UserCommitteeCalculateHandler,
+)
+from openslides_backend.action.relations.user_meeting_ids_handler import (
+    UserMeetingIdsHandler,
+)
+from openslides_backend.models.models import Group, Motion, User
+from openslides_backend.services.datastore.commands import GetManyRequest
+from openslides_backend.shared.patterns import (
+    Collection,
+    FullQualifiedField,
+    FullQualifiedId,
+)
+
+
+def get_handlers(instance: Dict[str, Any]) -> Dict[str, SingleRelationHandler]:
+    datastore = MagicMock()
+    model = Motion()
+    return {
+        field_name: SingleRelationHandler(
+            datastore, model.get_field(field_name), field_name, instance  # type: ignore
+        )
+        for field_name in ("tag_ids", "attachment_ids")
+    }
+
+
+def test_prefetch_relations() -> None:
+    calls: List[List[GetManyRequest]] = []
+
+    def get_many(
+        requests: List[GetManyRequest], lock_result: bool
+    ) -> Dict[Collection, Dict[int, Dict[str, Any]]]:
+        assert not lock_result
+        calls.append(requests)
+        if len(calls) == 1:
+            return {Collection("motion"): {1: {"tag_ids": [3, 4]}}}
+        return {}
+
+    datastore = MagicMock()
+    datastore.get_many = MagicMock(side_effect=get_many)
+    datastore.is_deleted = MagicMock(return_value=False)
+    instance = {"id": 1, "tag_ids": [2, 3], "attachment_ids": [5]}
+    handlers = get_handlers(instance)
+    RelationManager(datastore).prefetch_relations(Motion(), instance, handlers)
+
+    assert len(calls) == 2
+    assert calls[0][0].ids == [1]
+    assert calls[0][0].mapped_fields == {"tag_ids", "attachment_ids"}
+    related = {request.collection: request for request in calls[1]}
+    assert related[Collection("tag")].ids == [2, 4]
+    assert related[Collection("tag")].mapped_fields == {"tagged_ids"}
+    assert related[Collection("mediafile")].ids == [5]
+    assert related[Collection("mediafile")].mapped_fields == {"attachment_ids"}
+    assert all(handler.db_instance_exists for handler in handlers.values())
+
+
+def test_prefetch_relations_new_instance() -> None:
+    datastore = MagicMock()
+    datastore.get_many = MagicMock(return_value={})
+    instance = {"id": 1, "tag_ids": [], "attachment_ids": []}
+    handlers = get_handlers(instance)
+    RelationManager(datastore).prefetch_relations(Motion(), instance, handlers)
+
+    datastore.get_many.assert_called_once()
+    assert not any(handler.db_instance_exists for handler in handlers.values())
+
+
+def test_get_calculated_field_handlers() -> None:
+    assert get_calculated_field_handlers(Group.user_ids) == [MeetingUserIdsHandler]
+    assert get_calculated_field_handlers(User.group__ids) == [
+        UserMeetingIdsHandler,
+        UserCommitteeCalculateHandler,
+    ]
+    assert get_calculated_field_handlers(Motion.title) == []
+
+
+def test_meeting_user_ids_handler_bulk_read() -> None:
+    users = {2: {}, 3: {"group_$1_ids": [5]}}
+
+    def fetch_model(fqid: FullQualifiedId, *args: Any, **kwargs: Any) -> Any:
+        if fqid.collection == Collection("group"):
+            return {"user_ids": [1, 2, 3, 4], "meeting_id": 1}
+        return users[fqid.id]
+
+    datastore = MagicMock()
+    datastore.fetch_model = MagicMock(side_effect=fetch_model)
+    datastore.is_deleted = MagicMock(return_value=False)
+    datastore.additional_relation_models = {
+        FullQualifiedId(Collection("user"), 4): {"group_$1_ids": None}
+    }
+    users[4] = {}
+    result = MeetingUserIdsHandler(datastore).process_field(
+        Group.user_ids, "user_ids", {"id": 1, "user_ids": [1]}, "group.update"
+    )
+
+    datastore.get_many.assert_called_once()
+    requests = datastore.get_many.call_args[0][0]
+    assert sorted(requests[0].ids) == [2, 3]
+    assert requests[0].mapped_fields == {"group_$1_ids"}
+    element = result[FullQualifiedField(Collection("meeting"), 1, "user_ids")]
+    assert sorted(element["remove"]) == [2, 4]  # type: ignore
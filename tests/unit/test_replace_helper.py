@@ -0,0 +1,71 @@
+from unittest import TestCase
+
+from openslides_backend.action.actions.meeting.replace_helper import IdReplacer
+from openslides_backend.shared.exceptions import ActionException
+
+
+class IdReplacerTester(TestCase):
+    def setUp(self) -> None:
+        self.replace_map = {
+            "meeting": {1: 11},
+            "group": {1: 21, 2: 22},
+            "user": {1: 31},
+            "option": {1: 41},
+            "motion": {1: 51},
+        }
+
+    def test_structured_relation_field(self) -> None:
+        replacer = IdReplacer(self.replace_map, ["meeting", "group", "user"])
+        entry = {
+            "id": 1,
+            "group_$_ids": ["1"],
+            "group_$1_ids": [1, 2],
+            "meeting_ids": [1],
+        }
+        replacer.replace_entry("user", entry)
+        self.assertEqual(
+            entry,
+            {
+                "id": 31,
+                "group_$_ids": ["11"],
+                "group_$11_ids": [21, 22],
+                "meeting_ids": [11],
+            },
+        )
+
+    def test_rewrite_is_compiled_once(self) -> None:
+        replacer = IdReplacer(self.replace_map, ["meeting", "group"])
+        entries = [{"id": 1, "meeting_id": 1}, {"id": 2, "meeting_id": 1}]
+        for entry in entries:
+            replacer.replace_entry("group", entry)
+        self.assertEqual(
+            entries, [{"id": 21, "meeting_id": 11}, {"id": 22, "meeting_id": 11}]
+        )
+        self.assertEqual(len(replacer.rewrites), 2)
+
+    def test_not_allowed_collection(self) -> None:
+        replacer = IdReplacer(self.replace_map, ["meeting", "group", "option"])
+        entry = {"id": 1, "user_ids": [5], "meeting_id": 1}
+        replacer.replace_entry("group", entry)
+        self.assertEqual(entry, {"id": 21, "user_ids": [5], "meeting_id": 11})
+        option = {"id": 1, "content_object_id": "user/5"}
+        replacer.replace_entry("option", option)
+        self.assertEqual(option, {"id": 41, "content_object_id": "user/5"})
+
+    def test_generic_relation(self) -> None:
+        replacer = IdReplacer(self.replace_map, ["option", "motion"])
+        entry = {"id": 1, "content_object_id": "motion/1"}
+        replacer.replace_entry("option", entry)
+        self.assertEqual(entry, {"id": 41, "content_object_id": "motion/51"})
+
+    def test_recommendation_extension(self) -> None:
+        replacer = IdReplacer(self.replace_map, ["motion"])
+        entry = {"id": 1, "recommendation_extension": "See [motion/1]"}
+        replacer.replace_entry("motion", entry)
+        self.assertEqual(entry["recommendation_extension"], "See [motion/51]")
+
+    def test_unknown_field(self) -> None:
+        replacer = IdReplacer(self.replace_map, ["motion"])
+        with self.assertRaises(ActionException) as context:
+            replacer.replace_entry("motion", {"id": 1, "unknown": 1})
+        self.assertEqual(context.exception.message, "motion/unknown is not allowed.")
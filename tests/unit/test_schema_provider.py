@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+from openslides_backend.action import actions  # noqa
+from openslides_backend.action.action import Action
+from openslides_backend.action.util.actions_map import actions_map
+
+
+class SchemaProviderTester(TestCase):
+    def test_compiled_on_first_use(self) -> None:
+        class ParentAction(Action):
+            schema = {"type": "object", "required": ["id"]}
+
+        class ChildAction(ParentAction):
+            pass
+
+        self.assertNotIn("_schema_validator", vars(ParentAction))
+        validator = ChildAction.schema_validator
+        self.assertIs(vars(ParentAction)["_schema_validator"], validator)
+        self.assertIs(ParentAction.schema_validator, validator)
+        validator({"id": 1})
+
+    def test_no_schema(self) -> None:
+        with self.assertRaises(AttributeError):
+            Action.schema_validator
+
+    def test_all_schemas_compile(self) -> None:
+        for name, action in actions_map.items():
+            if not issubclass(action, Action):
+                # other tests may register mocks
+                continue
+            with self.subTest(name):
+                self.assertTrue(callable(action.schema_validator))
@@ -0,0 +1,85 @@
+from typing import Any, Dict
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from openslides_backend.presenter.search_users_by_name_or_email import (
+    SearchUsersByNameEmail,
+)
+from openslides_backend.shared.filters import Filter, FilterOperator, Or
+
+USERS: Dict[int, Dict[str, Any]] = {
+    2: {"id": 2, "username": "user2", "email": "user2@test.de", "first_name": "f2"},
+    3: {"id": 3, "username": "user3", "email": "userX@test.de"},
+    4: {"id": 4, "username": "user4", "email": "userX@test.de"},
+}
+
+
+def filter_users(filter_: Filter) -> Dict[int, Dict[str, Any]]:
+    operators = filter_.or_filter if isinstance(filter_, Or) else [filter_]
+    result = {}
+    for operator in operators:
+        assert isinstance(operator, FilterOperator)
+        for id, user in USERS.items():
+            if user.get(operator.field) == operator.value:
+                result[id] = user
+    return result
+
+
+class SearchUsersByNameEmailTest(TestCase):
+    def setUp(self) -> None:
+        self.datastore = MagicMock()
+        self.datastore.filter.side_effect = (
+            lambda collection, filter_, *args, **kwargs: filter_users(filter_)
+        )
+
+    def get_result(self, search: Any) -> Any:
+        presenter = SearchUsersByNameEmail(
+            {"permission_type": 3, "permission_id": 1, "search": search},
+            MagicMock(),
+            self.datastore,
+            MagicMock(),
+            1,
+        )
+        presenter.check_permissions = MagicMock()  # type: ignore
+        return presenter.get_result()
+
+    def test_fan_out(self) -> None:
+        result = self.get_result(
+            [
+                {"username": "user2"},
+                {"email": "userX@test.de"},
+                {"username": "user2", "email": "userX@test.de"},
+                {"username": "unknown"},
+                {},
+            ]
+        )
+        self.assertEqual(
+            result,
+            {
+                "user2/": [{"id": 2, "email": "user2@test.de", "first_name": "f2"}],
+                "/userX@test.de": [
+                    {"id": 3, "email": "userX@test.de"},
+                    {"id": 4, "email": "userX@test.de"},
+                ],
+                "user2/userX@test.de": [
+                    {"id": 2, "email": "user2@test.de", "first_name": "f2"},
+                    {"id": 3, "email": "userX@test.de"},
+                    {"id": 4, "email": "userX@test.de"},
+                ],
+                "unknown/": [],
+            },
+        )
+        self.datastore.filter.assert_called_once()
+
+    def test_chunks(self) -> None:
+        with patch(
+            "openslides_backend.presenter.search_users_by_name_or_email.SEARCH_CHUNK_SIZE",
+            2,
+        ):
+            result = self.get_result(
+                [{"username": f"user{i}"} for i in range(2, 5)]
+                + [{"email": "userX@test.de"}]
+            )
+        self.assertEqual(self.datastore.filter.call_count, 2)
+        self.assertEqual([user["id"] for user in result["user4/"]], [4])
+        self.assertEqual([user["id"] for user in result["/userX@test.de"]], [3, 4])
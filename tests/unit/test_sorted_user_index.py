@@ -0,0 +1,61 @@
+from typing import Any, Dict
+from unittest import TestCase
+
+from openslides_backend.presenter.sorted_user_index import (
+    MAX_INDEXES,
+    SortedUserIndex,
+    get_sorted_user_index,
+    sorted_user_indexes,
+    store_sorted_user_index,
+)
+
+
+def sort_key(user: Dict[str, Any]) -> Any:
+    return (user.get("last_name") or "", user.get("username") or "")
+
+
+class SortedUserIndexTest(TestCase):
+    def setUp(self) -> None:
+        sorted_user_indexes.clear()
+        self.users = {
+            4: {"username": "john", "first_name": "John", "last_name": "Xylon"},
+            1: {"username": "admin"},
+            3: {"username": "goofi", "first_name": "Testy", "last_name": "Tester"},
+            2: {"username": "florian", "first_name": "Florian", "last_name": "Tester"},
+            5: {"username": "xorr", "first_name": "John", "last_name": "Xorr"},
+        }
+
+    def test_sort(self) -> None:
+        index = SortedUserIndex(self.users, sort_key, False, (5, 1))
+        self.assertEqual(index.ids, [1, 2, 3, 5, 4])
+        self.assertEqual(index.get_page(1, 2), [2, 3])
+        self.assertEqual(index.get_page(4, 100), [4])
+
+    def test_reverse_keeps_ties_in_id_order(self) -> None:
+        index = SortedUserIndex(
+            self.users, lambda user: user.get("last_name") or "", True, (5, 1)
+        )
+        self.assertEqual(index.ids, [4, 5, 2, 3, 1])
+
+    def test_keyword(self) -> None:
+        index = SortedUserIndex(self.users, sort_key, False, (5, 1))
+        self.assertEqual(index.get_page(0, 100, "John"), [5, 4])
+        self.assertEqual(index.get_page(1, 1, "o"), [3])
+        self.assertEqual(index.get_page(-2, 1, "John"), [5])
+        self.assertEqual(index.get_page(0, 100, "nobody"), [])
+
+    def test_version(self) -> None:
+        index = SortedUserIndex(self.users, sort_key, False, (5, 1))
+        store_sorted_user_index("key", index)
+        self.assertIs(get_sorted_user_index("key", (5, 1)), index)
+        self.assertIsNone(get_sorted_user_index("key", (5, 2)))
+        self.assertIsNone(get_sorted_user_index("other", (5, 1)))
+
+    def test_eviction(self) -> None:
+        for i in range(MAX_INDEXES):
+            store_sorted_user_index(i, SortedUserIndex({}, sort_key, False, (0, None)))
+        get_sorted_user_index(0, (0, None))
+        store_sorted_user_index("new", SortedUserIndex({}, sort_key, False, (0, None)))
+        self.assertEqual(len(sorted_user_indexes), MAX_INDEXES)
+        self.assertIn(0, sorted_user_indexes)
+        self.assertNotIn(1, sorted_user_indexes)
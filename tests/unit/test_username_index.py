@@ -0,0 +1,98 @@
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+from openslides_backend.action.actions.user.username_index import (
+    MAX_FILTER_LOOKUPS,
+    UsernameIndex,
+)
+from openslides_backend.shared.filters import FilterOperator
+from openslides_backend.shared.patterns import Collection
+
+USERS = {
+    1: {"username": "admin", "meta_position": 3},
+    2: {"username": "Max Mustermann", "meta_position": 7},
+    3: {"username": "Max Mustermann 1", "meta_position": 5},
+    4: {"username": "Max Mustermann 3", "meta_position": 6},
+}
+
+
+def get_datastore_mock() -> MagicMock:
+    def filter_users(
+        collection: Collection, filter_: FilterOperator, mapped_fields: Any
+    ) -> Dict[int, Dict[str, Any]]:
+        return {
+            id_: {"id": id_}
+            for id_, user in USERS.items()
+            if user["username"] == filter_.value
+        }
+
+    datastore = MagicMock()
+    datastore.request_cache = {}
+    datastore.get_all = MagicMock(return_value=USERS)
+    datastore.filter = MagicMock(side_effect=filter_users)
+    return datastore
+
+
+def test_single_username_without_get_all() -> None:
+    datastore = get_datastore_mock()
+    username_index = UsernameIndex.get(datastore)
+    assert username_index.is_available("Max Mustermann", 2)
+    assert not username_index.is_available("Max Mustermann 1", 2)
+    assert username_index.generate("Max Mustermann") == "Max Mustermann 2"
+    datastore.get_all.assert_not_called()
+    assert datastore.filter.call_count == 5
+
+
+def test_load_after_max_filter_lookups() -> None:
+    datastore = get_datastore_mock()
+    username_index = UsernameIndex.get(datastore)
+    for i in range(MAX_FILTER_LOOKUPS):
+        username_index.generate(f"Erika {i}")
+    datastore.get_all.assert_not_called()
+    username_index.generate("Max Mustermann")
+    datastore.get_all.assert_called_once()
+    assert datastore.filter.call_count == MAX_FILTER_LOOKUPS
+
+
+def test_generate() -> None:
+    datastore = get_datastore_mock()
+    username_index = UsernameIndex.get(datastore)
+    username_index.load()
+    assert [username_index.generate("Max Mustermann") for _ in range(3)] == [
+        "Max Mustermann 2",
+        "Max Mustermann 4",
+        "Max Mustermann 5",
+    ]
+    assert username_index.generate("Erika") == "Erika"
+    assert username_index.generate("Erika") == "Erika 1"
+    assert UsernameIndex.get(datastore) is username_index
+    datastore.get_all.assert_called_once()
+
+
+def test_is_available() -> None:
+    username_index = UsernameIndex.get(get_datastore_mock())
+    username_index.load()
+    assert username_index.is_available("Max Mustermann", 2)
+    assert not username_index.is_available("Max Mustermann", 3)
+    assert username_index.is_available("Erika")
+    username_index.reserve("Erika", 5)
+    assert not username_index.is_available("Erika", 6)
+    assert username_index.is_available("Erika", 5)
+    username_index.reserve("Peter")
+    assert not username_index.is_available("Peter")
+
+
+def test_locks() -> None:
+    datastore = get_datastore_mock()
+    username_index = UsernameIndex.get(datastore)
+    username_index.load()
+    username_index.generate("Max Mustermann")
+    assert datastore.update_locked_fields.call_count == 3
+    collection_field, lock = datastore.update_locked_fields.call_args[0]
+    assert str(collection_field) == "user/username"
+    assert lock["position"] == 7
+    assert lock["filter"].to_dict()["and_filter"][0] == {
+        "field": "username",
+        "operator": "=",
+        "value": "Max Mustermann 2",
+    }